@@ -1,28 +1,43 @@
-from PyQt6.QtCore import QObject, pyqtSignal, pyqtProperty, pyqtSlot
+from PyQt6.QtCore import QObject, QStandardPaths, Qt, QTimer, pyqtSignal, pyqtProperty, pyqtSlot
 import logging
 import numpy as np
-import base58
-import re
 import json
-from scripts.generate_ultrasound_plot import generate_ultrasound_plot  # Import the function directly
-from openlifu.io.LIFUInterface import LIFUInterface
-from openlifu.bf.pulse import Pulse
-from openlifu.bf.sequence import Sequence
-from openlifu.geo import Point
-from openlifu.plan.solution import Solution
-from openlifu.xdc import Transducer
-from openlifu.xdc.util import load_transducer_from_file
+import os
+import sys
+import time
+import functools
+from collections import OrderedDict
+from concurrent.futures import Future
+# openlifu imports its whole package (vtk, pandas, nibabel, ...) on first
+# touch, so it is only imported where a device or solution is first needed.
+from scripts.generate_ultrasound_plot import PlotCache, generate_ultrasound_plot  # Import the function directly
+from lifu_worker import COMMAND, POLL, SAFETY, DeviceWorker, when_all
+from lifu_status import StatusDecoder
+from lifu_transducer import TransducerCache, compute_focus_delays
+from lifu_solution_cache import SolutionCache
+from lifu_field import BeamField
+from lifu_history import TelemetryHistory
+from lifu_recorder import SessionRecorder
+from lifu_logging import LOG_FORMAT, sampled
+from lifu_feed import MessageFeedModel
+from lifu_shadow import DeviceShadow
+from lifu_device_info import DeviceInfo, device_id
+from lifu_polling import PollChannel, TelemetryPoller
+from lifu_latency import CommandLatency, TimedInterface
+from lifu_link_stress import EchoStress
+from lifu_profiles import MAX_PROFILES, ProfileSlot, activate_profile, load_profiles
 
 logger = logging.getLogger("LIFUConnector")
 # Set up logging
 logger.setLevel(logging.INFO)
 logger.propagate = False
 
-# Create console handler and set level to debug
+# Create console handler; main.py swaps it for the queued, rate-limited
+# pipeline from lifu_logging.configure_logging
 ch = logging.StreamHandler()
 ch.setLevel(logging.INFO)
 # Create formatter
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+formatter = logging.Formatter(LOG_FORMAT)
 # Add formatter to ch
 ch.setFormatter(formatter)
 # Add ch to logger
@@ -36,11 +51,87 @@ CONFIGURED = 2
 READY = 3
 RUNNING = 4
 
+# Telemetry poll intervals in seconds: "active" while sonicating or the
+# trigger runs, "idle" otherwise; a link is not polled while disconnected.
+POLL_CHANNELS = (
+    PollChannel("hv.temperature", "HV", {"active": 0.5, "idle": 5.0}),
+    PollChannel("hv.voltages", "HV", {"active": 0.5, "idle": 5.0}),
+    PollChannel("hv.power", "HV", {"active": 2.0, "idle": 10.0}),
+    PollChannel("hv.rgb", "HV", {"active": 30.0, "idle": 30.0}),
+    PollChannel("tx.temperature", "TX", {"active": 0.5, "idle": 5.0}),
+    PollChannel("tx.trigger", "TX", {"active": 2.0, "idle": 10.0}),
+)
+
+LATENCY_PUBLISH_MS = 1000  # How often commandLatency may notify QML
+BEAM_FIELD_CACHE = 8  # Beam preview fields kept for repeated plots
+SIMPLE_TX_VOLTAGE = 1.0  # setSimpleTxConfig leaves the Solution default voltage
+
+
+def default_cache_dir():
+    """Per-user cache directory for data the app can rebuild on demand."""
+    base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericCacheLocation)
+    return os.path.join(base, "OpenLIFU-TestAPP")
+
+def default_data_dir():
+    """Per-user directory for data the app produces, such as recordings."""
+    base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericDataLocation)
+    return os.path.join(base, "OpenLIFU-TestAPP")
+
+def device_command(link=None, priority=COMMAND, voidable=False):
+    """Run the decorated slot on the worker that owns `link` ("TX" or "HV").
+
+    With link=None the slot's first argument names the device. Slots that
+    return a bool report it through commandCompleted, since QML no longer
+    waits for the serial round trip; commands that raised, or that the
+    worker rejected, dropped as stale, voided or no longer accepts (after
+    shutdown_workers) report False. priority is a lifu_worker
+    priority, or a callable taking the slot's arguments (including self)
+    that returns one. voidable marks commands that energize the device
+    (start, HV on), or is a callable deciding that per call: a SAFETY
+    command voids them on both links while they are still queued, since
+    a start on TX may switch HV on.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args):
+            target = link if link is not None else args[0]
+            worker = self._workers.get(target)
+            if worker is None:
+                logger.error(f"Invalid target for {func.__name__}: {target}")
+                self.commandCompleted.emit(str(target), func.__name__, False)
+                return
+
+            def job():
+                result = func(self, *args)
+                if isinstance(result, bool):
+                    self.commandCompleted.emit(target, func.__name__, result)
+                return result
+
+            def not_run(future):
+                if not future.cancelled() and future.exception() is not None:
+                    self.commandCompleted.emit(target, func.__name__, False)
+
+            job_priority = priority(self, *args) if callable(priority) else priority
+            job_voidable = voidable(self, *args) if callable(voidable) else voidable
+            if job_priority == SAFETY:
+                for other in self._workers.values():
+                    if other is not worker:
+                        other.void()  # The submit below voids this link's own
+            try:
+                future = worker.submit(job, priority=job_priority, voidable=job_voidable)
+            except RuntimeError as e:  # Fired during teardown
+                logger.warning(f"{func.__name__} not sent: {e}")
+                self.commandCompleted.emit(target, func.__name__, False)
+                return
+            future.add_done_callback(not_run)
+        return wrapper
+    return decorator
+
 class LIFUConnector(QObject):
     # Ensure signals are correctly defined
     signalConnected = pyqtSignal(str, str)  # (descriptor, port)
     signalDisconnected = pyqtSignal(str, str)  # (descriptor, port)
-    signalDataReceived = pyqtSignal(str, str)  # (descriptor, data)
+    signalDataReceived = pyqtSignal(str, str)  # (descriptor, data); deprecated, per message: use dataFeed
     plotGenerated = pyqtSignal(str)  # Signal to notify QML when a new plot is ready
     solutionConfigured = pyqtSignal(str)  # Signal for solution configuration feedback
 
@@ -59,10 +150,24 @@ class LIFUConnector(QObject):
     connectionStatusChanged = pyqtSignal()  # 🔹 New signal for connection updates
     triggerStateChanged = pyqtSignal(bool)  # 🔹 New signal for trigger state change
     txConfigStateChanged = pyqtSignal(bool)  # 🔹 New signal for tx configured state change
-
-    def __init__(self, hv_test_mode=False):
+    commandCompleted = pyqtSignal(str, str, bool)  # (target, command, success)
+    telemetrySnapshotReady = pyqtSignal("QVariantMap")  # Consolidated HV + TX telemetry
+    plotCacheStatsChanged = pyqtSignal()  # Plot cache hit/miss counters changed
+    recordingChanged = pyqtSignal()  # Session recording started or stopped
+    profilesChanged = pyqtSignal()  # Preloaded profiles or the active one changed
+    deviceInfoChanged = pyqtSignal()  # Cached firmware versions / device IDs filled or cleared
+    commandLatencyChanged = pyqtSignal()  # New round trips timed, at most once per second
+    echoStressChanged = pyqtSignal()  # Echo stress test progress or result
+    sdkVersionChanged = pyqtSignal()  # openlifu became known after the deferred import
+    _echoStressProgress = pyqtSignal(object, dict)  # (EchoStress, result) from its driver thread
+
+    def __init__(self, hv_test_mode=False, interface=None, defer_interface=False):
         super().__init__()
-        self.interface = LIFUInterface(HV_test_mode=hv_test_mode, run_async=True)
+        # interface replaces the hardware LIFUInterface, e.g. with a
+        # lifu_simulator.SimulatedLIFUInterface for testing without a device.
+        # With defer_interface there is none until attach_interface(), so the
+        # UI can come up before openlifu is imported.
+        self.interface = None
         self._txConnected = False
         self._hvConnected = False
         self._configured = False
@@ -70,27 +175,174 @@ class LIFUConnector(QObject):
         self._trigger_state = False  # Internal state to track trigger status
         self._txconfigured_state = False  # Internal state to track trigger status
         self._num_modules_connected = 0
+        self._hv_on = False  # Last HV state the device reported
+        self._data_listeners = 0  # Connections to the per-message signalDataReceived
+        self._workers = {"TX": DeviceWorker("TX"), "HV": DeviceWorker("HV")}
+        self._status_decoder = StatusDecoder()
+        self._history = TelemetryHistory()
+        self._recorder = None  # SessionRecorder while recording
+        self._transducers = TransducerCache()
+        self._solutions = SolutionCache(os.path.join(default_cache_dir(), "solutions"))
+        self._plots = PlotCache()
+        self._plot_worker = DeviceWorker("PLOT")
+        self._plot_generation = 0  # Bumped per request; older jobs are stale
+        self._plot_future = None
+        self._beam_fields = OrderedDict()  # Solution key or focus -> BeamField, used by the plot worker only
+        # TX digest -> (solution key, module count, focus, frequency) of what the device holds or can switch to
+        self._uploaded = {}
+        self._feed = MessageFeedModel(parent=self)  # Device messages for QML, batched per frame
+        self._shadow = DeviceShadow()  # What was last written to each link
+        self._device_info = DeviceInfo()  # Static facts per connected link
+        self._poller = TelemetryPoller(POLL_CHANNELS, self._poll_mode, self._poll_channel)
+        self._profiles = []  # ProfileSlot per preloaded device profile
+        self._active_profile = 0  # Slot in use, 0 when none
+        self._latency = CommandLatency()  # Round trip of every interface call
+        self._latency_version = 0
+        self._latency_timer = QTimer(self)
+        self._latency_timer.setInterval(LATENCY_PUBLISH_MS)
+        self._latency_timer.timeout.connect(self._publish_latency)
+        self._latency_timer.start()
+        self._echo_stress = None  # EchoStress of the last link test
+        self._echo_stress_result = {}
+        self._sdk_version = self._loaded_sdk_version()
 
         self.connect_signals()
+        if interface is None and not defer_interface:
+            from openlifu.io.LIFUInterface import LIFUInterface
+            interface = LIFUInterface(HV_test_mode=hv_test_mode, run_async=True)
+        if interface is not None:
+            self.attach_interface(interface)
+
+    def attach_interface(self, interface):
+        """Use interface for the device links and follow its signals.
+
+        Calls go through a TimedInterface, which records the round trip of
+        each one in the commandLatency histograms.
+        """
+        self.interface = TimedInterface(interface, self._latency)
+        interface.signal_connect.connect(self.on_connected)
+        interface.signal_disconnect.connect(self.on_disconnected)
+        interface.signal_data_received.connect(self.on_data_received)
+        version = self._loaded_sdk_version()
+        if version != self._sdk_version:
+            self._sdk_version = version
+            self.sdkVersionChanged.emit()
+
+    def connectNotify(self, signal):
+        if signal.name() == b"signalDataReceived":
+            self._data_listeners += 1
+
+    def disconnectNotify(self, signal):
+        if signal.name() == b"signalDataReceived":
+            self._data_listeners -= 1
 
     def connect_signals(self):
-        """Connect LIFUInterface signals to QML."""
-        self.interface.signal_connect.connect(self.on_connected)
-        self.interface.signal_disconnect.connect(self.on_disconnected)
-        self.interface.signal_data_received.connect(self.on_data_received)
+        """Connect the connector's own signals."""
+        self._echoStressProgress.connect(self._on_echo_stress_progress, Qt.ConnectionType.QueuedConnection)
+        # Record telemetry history on whichever worker emits it.
+        direct = Qt.ConnectionType.DirectConnection
+        self.temperatureHvUpdated.connect(self._record_hv_temperature, direct)
+        self.temperatureTxUpdated.connect(self._record_tx_temperature, direct)
+        self.monVoltagesReceived.connect(self._record_mon_voltages, direct)
+        self.powerStatusReceived.connect(self._record_power_status, direct)
+        # Switch poll rates as soon as the link or sonication state changes.
+        for signal in (self.stateChanged, self.triggerStateChanged, self.connectionStatusChanged):
+            signal.connect(self._poller.notify, direct)
+
+    def _record_power_status(self, v12_on, hv_on):
+        self._hv_on = bool(hv_on)
+
+    def _record_sample(self, channel, value):
+        timestamp = time.time()
+        self._history.record(channel, value, timestamp)
+        recorder = self._recorder
+        if recorder is not None:
+            recorder.record_sample(channel, value, timestamp)
+
+    def _record_hv_temperature(self, temp1, temp2):
+        self._record_sample("hv.temp1", temp1)
+        self._record_sample("hv.temp2", temp2)
+
+    def _record_tx_temperature(self, module, tx_temp, amb_temp):
+        self._record_sample(f"tx{module}.temp", tx_temp)
+        self._record_sample(f"tx{module}.ambient", amb_temp)
+
+    def _record_mon_voltages(self, voltages):
+        for entry in voltages:
+            self._record_sample(f"hv.vmon{entry['channel']}", entry["converted_voltage"])
+
+    def _record_status(self, record):
+        # History only: the recorder already has the raw message, and
+        # SessionReader derives the status and its samples from that.
+        timestamp = time.time()
+        for channel, value in record.samples():
+            self._history.record(channel, value, timestamp)
+
+    @pyqtSlot()
+    def startRecording(self):
+        """Start capturing the device data stream to a new session file."""
+        if self._recorder is None:
+            self._recorder = SessionRecorder(os.path.join(default_data_dir(), "recordings"))
+            self.recordingChanged.emit()
+
+    @pyqtSlot()
+    def stopRecording(self):
+        """Stop capturing and close the session file."""
+        recorder, self._recorder = self._recorder, None
+        if recorder is not None:
+            recorder.close()
+            self.recordingChanged.emit()
+
+    @pyqtProperty(bool, notify=recordingChanged)
+    def recording(self):
+        return self._recorder is not None
+
+    def _on_both_links(self, fn, *args, **kwargs):
+        """Run an interface call that talks to both TX and HV from a TX job.
+
+        The call executes on the HV worker while the calling TX worker waits,
+        so neither link sees interleaved traffic. Only TX jobs may do this;
+        HV jobs never wait on the TX worker, which keeps it deadlock free.
+        """
+        return self._workers["HV"].call(fn, *args, **kwargs)
+
+    def drain(self) -> Future:
+        """Future that completes once both device workers ran everything queued so far."""
+        done = Future()
+        # Lowest priority, so it runs after every job already queued
+        when_all([worker.submit(lambda: None, priority=POLL) for worker in self._workers.values()],
+                 lambda _: done.set_result(None))
+        return done
+
+    @pyqtSlot()
+    def shutdown_workers(self):
+        """Stop the device workers and drop any queued commands."""
+        if self._echo_stress is not None:
+            self._echo_stress.stop()
+        for worker in self._workers.values():
+            worker.shutdown()
+        self._plot_worker.shutdown()
+
+    def _set_state(self, state):
+        """Store the system state and notify QML only when it changes."""
+        if state == self._state:
+            return
+        self._state = state
+        self.stateChanged.emit(state)
+        logger.info(f"Updated state: {state}")
 
     def update_state(self):
         """Update system state based on connection and configuration."""
+        state = self._state
         if not self._txConnected and not self._hvConnected:
-            self._state = DISCONNECTED
+            state = DISCONNECTED
         elif self._txConnected and not self._configured:
-            self._state = TX_CONNECTED
+            state = TX_CONNECTED
         elif self._txConnected and self._hvConnected and self._configured:
-            self._state = READY
+            state = READY
         elif self._txConnected and self._configured:
-            self._state = CONFIGURED
-        self.stateChanged.emit(self._state)  # Notify QML of state update
-        logger.info(f"Updated state: {self._state}")
+            state = CONFIGURED
+        self._set_state(state)
 
     def _update_trigger_state(self, trigger_data):
         """Helper method to update trigger state and emit signal."""
@@ -107,94 +359,25 @@ class LIFUConnector(QObject):
 
     @pyqtSlot(str, result=dict)
     def parse_status_string(self, status_str):
-        result = {
-            "status": None,
-            "mode": None,
-            "pulse_train_percent": None,
-            "pulse_percent": None,
-            "temp_tx": None,
-            "temp_ambient": None
-        }
-
-        try:
-            # Try pattern WITH PULSE field
-            pattern_with_pulse = re.compile(
-                r"STATUS:(\w+),"
-                r"MODE:(\w+),"
-                r"PULSE_TRAIN:\[(\d+)/(\d+)\],"
-                r"PULSE:\[(\d+)/(\d+)\],"
-                r"TEMP_TX:([0-9.]+),"
-                r"TEMP_AMBIENT:([0-9.]+)"
-            )
-            match = pattern_with_pulse.match(status_str.strip())
-
-            if match:
-                (
-                    status,
-                    mode,
-                    pt_current, pt_total,
-                    p_current, p_total,
-                    temp_tx,
-                    temp_ambient
-                ) = match.groups()
-
-                # Convert and compute percentages
-                pt_current = int(pt_current)
-                pt_total = int(pt_total)
-                p_current = int(p_current)
-                p_total = int(p_total)
-
-                result["status"] = status
-                result["mode"] = mode
-                result["pulse_train_percent"] = (pt_current / pt_total * 100) if pt_total > 0 else 0
-                result["pulse_percent"] = (p_current / p_total * 100) if p_total > 0 else 0
-                result["temp_tx"] = float(temp_tx)
-                result["temp_ambient"] = float(temp_ambient)
-
-            else:
-                # Try pattern WITHOUT PULSE field
-                pattern_without_pulse = re.compile(
-                    r"STATUS:(\w+),"
-                    r"MODE:(\w+),"
-                    r"PULSE_TRAIN:\[(\d+)/(\d+)\],"
-                    r"TEMP_TX:([0-9.]+),"
-                    r"TEMP_AMBIENT:([0-9.]+)"
-                )
-                match = pattern_without_pulse.match(status_str.strip())
-
-                if not match:
-                    raise ValueError("Input string format is invalid.")
-
-                (
-                    status,
-                    mode,
-                    pt_current, pt_total,
-                    temp_tx,
-                    temp_ambient
-                ) = match.groups()
-
-                # Convert and compute percentages
-                pt_current = int(pt_current)
-                pt_total = int(pt_total)
-
-                result["status"] = status
-                result["mode"] = mode
-                result["pulse_train_percent"] = (pt_current / pt_total * 100) if pt_total > 0 else 0
-                result["pulse_percent"] = None  # No pulse data available
-                result["temp_tx"] = float(temp_tx)
-                result["temp_ambient"] = float(temp_ambient)
-
-            return result
-
-        except Exception as e:
-            logger.error(f"Failed to parse status string: {e}")
-            return result
+        record = self._status_decoder.decode(status_str)
+        if record is None:
+            logger.error("Failed to parse status string: Input string format is invalid.")
+            return {
+                "status": None,
+                "mode": None,
+                "pulse_train_percent": None,
+                "pulse_percent": None,
+                "temp_tx": None,
+                "temp_ambient": None
+            }
+        return record.to_dict()
 
     @pyqtSlot()
     async def start_monitoring(self):
         """Start monitoring for device connection asynchronously."""
         try:
             logger.info("Starting device monitoring...")
+            self._poller.start()
             await self.interface.start_monitoring()
         except Exception as e:
             logger.error(f"Error in start_monitoring: {e}", exc_info=True)
@@ -204,6 +387,7 @@ class LIFUConnector(QObject):
         """Stop monitoring device connection."""
         try:
             logger.info("Stopping device monitoring...")
+            self._poller.stop()
             self.interface.stop_monitoring()
         except Exception as e:
             logger.error(f"Error while stopping monitoring: {e}", exc_info=True)
@@ -215,6 +399,9 @@ class LIFUConnector(QObject):
             self._txConnected = True
         elif descriptor == "HV":
             self._hvConnected = True
+        worker = self._workers.get(descriptor)
+        if worker is not None:
+            worker.submit(self._load_device_info, descriptor)
         self.signalConnected.emit(descriptor, port)
         self.connectionStatusChanged.emit() 
         self.update_state()
@@ -226,6 +413,12 @@ class LIFUConnector(QObject):
             self._txConnected = False
         elif descriptor == "HV":
             self._hvConnected = False
+        self._shadow.forget(descriptor)
+        self._device_info.forget(descriptor)
+        self.deviceInfoChanged.emit()
+        if descriptor == "TX":
+            self._clear_profiles()
+            self._set_num_modules(0)
         self.signalDisconnected.emit(descriptor, port)
         self.connectionStatusChanged.emit() 
         self.update_state()
@@ -233,54 +426,82 @@ class LIFUConnector(QObject):
     @pyqtSlot(str, str)
     def on_data_received(self, descriptor, message):
         """Handle incoming data from the LIFU device."""
-        logger.info(f"Data received from {descriptor}: {message}")
-        self.signalDataReceived.emit(descriptor, message)
+        rate_key = f"rx.{descriptor}"
+        if sampled(logger, rate_key):
+            logger.info("Data received from %s: %s", descriptor, message, extra={"rate_key": rate_key})
+        recorder = self._recorder
+        if recorder is not None:
+            recorder.record_message(descriptor, message)
+        self._feed.push(descriptor, message)
+        if self._data_listeners:  # Only paid for by existing listeners
+            self.signalDataReceived.emit(descriptor, message)
 
         if descriptor == "TX":
             try:
-                parsed = self.parse_status_string(message)
-                if parsed["status"] in {"RUNNING", "STOPPED"}:
+                record = self._status_decoder.decode(message)
+                if record is not None:
+                    self._record_status(record)
+                if record is not None and record.status in {"RUNNING", "STOPPED"}:
                     # Update internal trigger state based on parsed status
-                    new_trigger_state = parsed["status"] == "RUNNING"
+                    new_trigger_state = record.status == "RUNNING"
                     
                     if new_trigger_state != self._trigger_state:
                         self._trigger_state = new_trigger_state
                         self.triggerStateChanged.emit(self._trigger_state)
-                        logger.info(f"Trigger state updated to: {'RUNNING' if self._trigger_state else 'STOPPED'}")
+                        logger.info("Trigger state updated to: %s", record.status)
                     
-                    if parsed["status"] == "STOPPED":
+                    if record.status == "STOPPED" and self._state != READY:
                         logger.info("Trigger is stopped.")
-                        self._state = READY
-                        self.stateChanged.emit(self._state)
+                        self._set_state(READY)
 
             except Exception as e:
                 logger.error(f"Failed to parse and update trigger state: {e}")
 
     @pyqtSlot(str, float)
+    @device_command("TX")
     def configureSolution(self, solutionName, amplitude):
         """Configures the solution and emits status to QML."""
         try:
             logger.debug("Configuring solution: %s with amplitude: %s", solutionName, amplitude)
             solution = None  # Replace with actual configuration logic
-            if self.interface.set_solution(solution):
-                logger.info("Solution '%s' configured successfully.", solutionName)
-                self.solutionConfigured.emit(f"Solution '{solutionName}' configured.")
-            else:
-                logger.error("Failed to configure solution '%s'.", solutionName)
-                self.solutionConfigured.emit("Configuration failed.")
+            # set_solution returns None; it raises when the upload fails.
+            self._on_both_links(self.interface.set_solution, solution)
+            logger.info("Solution '%s' configured successfully.", solutionName)
+            self.solutionConfigured.emit(f"Solution '{solutionName}' configured.")
+            return True
         except Exception as e:
             logger.error("Error configuring solution: %s", e)
             self.solutionConfigured.emit("Configuration error.")
+            return False
 
     @pyqtSlot(str, str, str, str, str, str, str)
     def generate_plot(self, x, y, z, freq, cycles, trigger, mode):
-        """Generates an ultrasound plot and emits data to QML."""
+        """Queue an ultrasound plot; plotGenerated is emitted when it is ready.
+
+        Plots render on their own worker thread. Only the latest request is
+        delivered: a newer call cancels a request that has not started yet
+        and discards the result of one that is already rendering.
+        """
+        self._plot_generation += 1
+        if self._plot_future is not None:
+            self._plot_future.cancel()
+        self._plot_future = self._plot_worker.submit(
+            self._render_plot, self._plot_generation, x, y, z, freq, cycles, trigger, mode)
+
+    def _render_plot(self, generation, x, y, z, freq, cycles, trigger, mode):
+        if generation != self._plot_generation:
+            return
         try:
             logger.info(f"Generating plot: X={x}, Y={y}, Z={z}, Frequency={freq}, Cycles={cycles}, Trigger={trigger}, Mode={mode}")
-            image_data = generate_ultrasound_plot(x, y, z, freq, cycles, trigger, mode)
+            field = self._beam_field(x, y, z, freq)
+            image_data = generate_ultrasound_plot(x, y, z, freq, cycles, trigger, mode, cache=self._plots,
+                                                  field=field)
+            self.plotCacheStatsChanged.emit()
 
             if image_data == "ERROR":
                 logger.error("Plot generation failed")
+            elif generation != self._plot_generation:
+                logger.info("Plot superseded by a newer request, dropping it")
             else:
                 logger.info("Plot generated successfully")
                 self.plotGenerated.emit(image_data)  # Send image data to QML
@@ -288,30 +509,108 @@ class LIFUConnector(QObject):
         except Exception as e:
             logger.error(f"Error generating plot: {e}")
 
+    def _beam_field(self, x, y, z, freq):
+        """Field of the array for the preview, or None.
+
+        When the device holds a solution for this focus and frequency, the
+        field uses the delays and apodizations that were programmed;
+        otherwise those of the connected array steered to the focus (the
+        1x pinmap while no TX is connected). Fields are kept per solution
+        key or focus. Returns None (the analytic preview) when no pinmap
+        can be loaded. Runs on the plot worker.
+        """
+        focus, freq = (float(x), float(y), float(z)), float(freq)
+        uploaded = self._uploaded.get(self._shadow.current("TX", "solution"))
+        if uploaded is not None and tuple(uploaded[2]) == focus and uploaded[3] == freq:
+            key, num_modules = uploaded[:2]
+        else:
+            key, num_modules = None, max(self._num_modules_connected, 1)
+        try:
+            xdc = self._transducers.get(num_modules)
+            field_key = key or (xdc.digest, focus, freq)
+            field = self._beam_fields.get(field_key)
+            if field is None:
+                solution = self._solutions.get(key) if key else None
+                if solution is not None:
+                    field = BeamField(xdc, focus, freq, solution["delays"][0], solution["apodizations"][0])
+                else:
+                    field = BeamField(xdc, focus, freq)
+                self._beam_fields[field_key] = field
+                while len(self._beam_fields) > BEAM_FIELD_CACHE:
+                    self._beam_fields.popitem(last=False)
+            self._beam_fields.move_to_end(field_key)
+            return field
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Using analytic beam preview, no array geometry: {e}")
+            return None
+
     @pyqtSlot(str, str, str, str, str, str, str, str, str, str, str)
+    @device_command("TX")
     def configure_transmitter(self, xInput, yInput, zInput, freq, voltage, triggerHZ, pulseCount, trainInterval, trainCount, durationS, mode):
         """Simulate configuring the transmitter."""
         if self._txConnected:
-            pulse = Pulse(frequency=float(freq), duration=float(durationS))
-            pt = Point(position=(float(xInput),float(yInput),float(zInput)), units="mm")
-            
-            self.queryNumModules()
+            # Module count read on this job (cached per connection), not queued behind it
+            num_modules = self._link_info("TX")["numModules"]
+            xdc = self._transducers.get(num_modules)
+
+            params = self._solution_params(xdc, xInput, yInput, zInput, freq, voltage, triggerHZ, pulseCount,
+                                           trainInterval, trainCount, durationS, mode)
+            key = SolutionCache.make_key(params)
+            tx_digest = self._tx_digest(params)
+            if not self._upload_solution(tx_digest, params["voltage"], mode,
+                                         lambda: self._build_solution(key, params)):
+                return False
+            self._uploaded[tx_digest] = (key, num_modules, params["focus"], params["pulse"]["frequency"])
 
-            arr = load_transducer_from_file(fR".\pinmap_{self._num_modules_connected}x.json")
-            logger.info(f"{self._num_modules_connected}x config file loaded")
-            
-            focus = pt.get_position(units="mm")
+            self._configured = True
+            self.update_state()
+            logger.info("Transmitter configured")
+            return True
 
-            distances = np.sqrt(np.sum((focus - arr.get_positions(units="mm"))**2, 1))
-            tof = distances*1e-3 / 1500
-            delays = tof.max() - tof
-            apodizations = np.ones(arr.numelements())
-            sequence = Sequence(
-                pulse_interval=1.0/float(triggerHZ),
-                pulse_count=int(pulseCount),
-                pulse_train_interval=float(trainInterval),
-                pulse_train_count=int(trainCount)
-            )
+    @staticmethod
+    def _solution_params(xdc, x, y, z, freq, voltage, triggerHZ, pulseCount, trainInterval, trainCount,
+                         durationS, mode):
+        """Everything that determines a solution, as the cache key parameters."""
+        return {
+            "transducer": xdc.transducer.id,
+            "pinmap": xdc.digest,
+            "focus": (float(x), float(y), float(z)),
+            "pulse": {"frequency": float(freq), "duration": float(durationS)},
+            "sequence": {
+                "pulse_interval": 1.0/float(triggerHZ),
+                "pulse_count": int(pulseCount),
+                "pulse_train_interval": float(trainInterval),
+                "pulse_train_count": int(trainCount),
+            },
+            "voltage": float(voltage),
+            "trigger_mode": mode,
+        }
+
+    def _tx_digest(self, params):
+        """Shadow digest of what a solution programs into the TX (all but the voltage)."""
+        return self._shadow.digest({k: v for k, v in params.items() if k != "voltage"})
+
+    def _build_solution(self, key, params, focus_delays=None):
+        """Solution for _solution_params, from the cache or built.
+
+        focus_delays is an optional precomputed (delays, apodizations) pair
+        for the focus, so batches can compute them in one call.
+        """
+        solution = self._solutions.get(key)
+        if solution is None:
+            from openlifu.bf.pulse import Pulse
+            from openlifu.bf.sequence import Sequence
+            from openlifu.geo import Point
+            from openlifu.plan.solution import Solution
+
+            focus = params["focus"]
+            pulse = Pulse(**params["pulse"])
+            pt = Point(position=focus, units="mm")
+            if focus_delays is None:
+                delays, apodizations = self.compute_focus_delays(pt.get_position(units="mm"))
+                focus_delays = delays[0], apodizations[0]
+            delays, apodizations = focus_delays
+            sequence = Sequence(**params["sequence"])
 
             solution = Solution(
                 id="solution",
@@ -322,51 +621,218 @@ class LIFUConnector(QObject):
                 apodizations = apodizations,
                 pulse = pulse,
                 sequence = sequence,
-                voltage=float(voltage),
+                voltage=params["voltage"],
                 target=pt,
                 foci=[pt],
                 approved=True
             )
-            
-            self.interface.set_solution(solution, trigger_mode=mode)
+            solution = self._solutions.put(key, solution)
+        else:
+            logger.info("Using cached solution")
+        return solution
+
+    def _upload_solution(self, tx_digest, voltage, trigger_mode, build):
+        """Bring the device to a solution, writing only what differs.
+
+        tx_digest identifies everything set_solution programs into the TX
+        (delays, apodizations, pulse, sequence, trigger mode); build() is
+        only called when the TX does not hold it already. A changed voltage
+        alone is sent to the HV controller without reprogramming the TX.
+        Returns False when the HV controller rejected the voltage, which is
+        then not recorded. Runs on the TX worker.
+        """
+        voltage = float(voltage)
+        hv_digest = self._shadow.digest(voltage)
+        if self._shadow.holds("TX", "solution", tx_digest):
+            if self._shadow.holds("HV", "voltage", hv_digest):
+                logger.info("Device already holds this solution, skipping upload")
+                return True
+            self._shadow.forget("HV", "voltage")
+            if not self._on_both_links(self.interface.hvcontroller.set_voltage, voltage):
+                logger.error("Failed to set voltage")
+                return False
+            self._shadow.record("HV", "voltage", hv_digest)
+            logger.info("Solution unchanged, only voltage updated")
+            return True
 
-            self._configured = True
-            self.update_state()
-            logger.info("Transmitter configured")
+        solution = build()
+        # set_solution also reprograms the trigger and sets the voltage, and
+        # replaces the preloaded profiles.
+        for link, name in (("TX", "solution"), ("TX", "trigger"), ("HV", "voltage")):
+            self._shadow.forget(link, name)
+        self._clear_profiles()
+        self._on_both_links(self.interface.set_solution, solution, trigger_mode=trigger_mode)
+        self._shadow.record("TX", "solution", tx_digest)
+        self._shadow.record("HV", "voltage", hv_digest)
+        return True
 
-        
-    @pyqtSlot(int, int, result=bool)
+    @pyqtSlot(str)
+    @device_command("TX")
+    def preloadProfiles(self, profilesJson):
+        """Upload up to MAX_PROFILES configurations into the device profile slots.
+
+        profilesJson is a JSON list of objects with the configure_transmitter
+        fields: x, y, z, frequency, voltage, triggerHz, pulseCount,
+        trainInterval, trainCount, duration and mode. Delays for all
+        uncached foci are computed in one batch and every slot is written
+        in a single register pass; slot 1 is then active. Afterwards
+        activateProfile switches between them without re-uploading.
+        """
+        if not self._txConnected:
+            return False
+        try:
+            configs = json.loads(profilesJson)
+            num_modules = self._link_info("TX")["numModules"]
+            xdc = self._transducers.get(num_modules)
+            params = [self._solution_params(xdc, c["x"], c["y"], c["z"], c["frequency"], c["voltage"],
+                                            c["triggerHz"], c["pulseCount"], c["trainInterval"], c["trainCount"],
+                                            c["duration"], c.get("mode", "sequence"))
+                      for c in configs]
+            keys = [SolutionCache.make_key(p) for p in params]
+            solutions = [self._solutions.get(key) for key in keys]
+            missing = [i for i, solution in enumerate(solutions) if solution is None]
+            if missing:
+                delays, apodizations = self.compute_focus_delays(np.array([params[i]["focus"] for i in missing]))
+                for row, i in enumerate(missing):
+                    solutions[i] = self._build_solution(keys[i], params[i], (delays[row], apodizations[row]))
+
+            # Every slot and the trigger are rewritten.
+            self._clear_profiles()
+            self._shadow.forget("TX")
+            load_profiles(self.interface.txdevice, solutions)
+            self._profiles = [ProfileSlot(slot, self._tx_digest(p), p["sequence"], p["trigger_mode"], p["voltage"])
+                              for slot, p in enumerate(params, start=1)]
+            self._uploaded = {entry.tx_digest: (key, num_modules, p["focus"], p["pulse"]["frequency"])
+                              for entry, key, p in zip(self._profiles, keys, params)}
+            if not self._select_profile(1, switch=False):
+                return False
+            logger.info(f"Preloaded {len(self._profiles)} profiles")
+            return True
+        except (ValueError, KeyError, TypeError, OSError) as e:
+            logger.error(f"Error preloading profiles: {e}")
+            self._shadow.forget("TX")
+            self._clear_profiles()
+            return False
+
+    @pyqtSlot(int)
+    @device_command("TX")
+    def activateProfile(self, slot):
+        """Make a preloaded profile (1-based) the active solution."""
+        if not 1 <= slot <= len(self._profiles):
+            logger.error(f"No preloaded profile {slot}")
+            return False
+        if slot == self._active_profile:
+            return True
+        try:
+            if not self._select_profile(slot):
+                return False
+        except (ValueError, OSError) as e:
+            logger.error(f"Error activating profile {slot}: {e}")
+            return False
+        logger.info(f"Activated profile {slot}")
+        return True
+
+    def _select_profile(self, slot, switch=True):
+        """Select a slot's registers, then its trigger and voltage if they differ.
+
+        Returns False, leaving the failed write unrecorded and the profile
+        inactive, when the device rejects the trigger or the voltage.
+        """
+        entry = self._profiles[slot - 1]
+        self._shadow.forget("TX", "solution")
+        if switch:
+            activate_profile(self.interface.txdevice, slot)
+        trigger_digest = self._shadow.digest({"sequence": entry.sequence, "mode": entry.trigger_mode})
+        if not self._shadow.holds("TX", "trigger", trigger_digest):
+            self._shadow.forget("TX", "trigger")
+            if not self.interface.txdevice.set_trigger(**entry.sequence, trigger_mode=entry.trigger_mode):
+                logger.error(f"Failed to set the trigger of profile {slot}")
+                return False
+            self._shadow.record("TX", "trigger", trigger_digest)
+        hv_digest = self._shadow.digest(float(entry.voltage))
+        if not self._shadow.holds("HV", "voltage", hv_digest):
+            self._shadow.forget("HV", "voltage")
+            if not self._on_both_links(self.interface.hvcontroller.set_voltage, entry.voltage):
+                logger.error(f"Failed to set the voltage of profile {slot}")
+                return False
+            self._shadow.record("HV", "voltage", hv_digest)
+        # The device now runs exactly this solution.
+        self._shadow.record("TX", "solution", entry.tx_digest)
+        self._active_profile = slot
+        self.profilesChanged.emit()
+        return True
+
+    def _clear_profiles(self):
+        self._uploaded = {}  # The profiles, or the solution replacing them
+        if self._profiles or self._active_profile:
+            self._profiles = []
+            self._active_profile = 0
+            self.profilesChanged.emit()
+
+    @pyqtProperty(int, notify=profilesChanged)
+    def profileCount(self):
+        """Number of preloaded device profiles."""
+        return len(self._profiles)
+
+    @pyqtProperty(int, notify=profilesChanged)
+    def activeProfile(self):
+        """Active preloaded profile (1-based), 0 when none."""
+        return self._active_profile
+
+    @pyqtProperty(int, constant=True)
+    def maxProfiles(self):
+        return MAX_PROFILES
+
+    def compute_focus_delays(self, foci, num_modules=None):
+        """Return (delays, apodizations) for an (N, 3) array of foci in mm.
+
+        Uses the cached pinmap for num_modules (the connected module count by
+        default, 1 while no TX is connected); both results have shape (N, elements). Large grids are
+        processed in chunks, see lifu_transducer.compute_focus_delays.
+        """
+        if num_modules is None:
+            num_modules = max(self._num_modules_connected, 1)  # 1x pinmap while no TX is connected
+        xdc = self._transducers.get(num_modules)
+        return compute_focus_delays(xdc.positions, foci)
+
+    @pyqtSlot(int, int)
+    @device_command("TX")
     def setSimpleTxConfig(self, freq: float, pulses: int):
-        print(freq, pulses)
-        pulse = Pulse(frequency=freq, duration=float(1e-5), amplitude=1.0)
-        pt = Point(position=(0, 0, 25), units="mm")
-
-        sequence = Sequence(
-            pulse_interval=1.0/freq,
-            pulse_count=int(1),
-            pulse_train_interval=float(0),
-            pulse_train_count=int(1)
-        )
-
-        solution = Solution(
-            id="solution",
-            name="Solution",
-            protocol_id="example_protocol",
-            transducer_id="example_transducer",
-            delays = np.zeros((1,64)),
-            apodizations = np.ones((1,64)),
-            pulse = pulse,
-            sequence = sequence,
-            target=pt,
-            foci=[pt],
-            approved=True
-        )
-
-        sol_dict = solution.to_dict()
-        profile_index = 1
-        profile_increment = True
-        logger.error(f">>>>>>>>>>>>>>>>>>> Set Solution {solution}")
-        ret_status = self.interface.set_solution(solution = solution)
+        def build():
+            from openlifu.bf.pulse import Pulse
+            from openlifu.bf.sequence import Sequence
+            from openlifu.geo import Point
+            from openlifu.plan.solution import Solution
+
+            pulse = Pulse(frequency=freq, duration=float(1e-5), amplitude=1.0)
+            pt = Point(position=(0, 0, 25), units="mm")
+
+            sequence = Sequence(
+                pulse_interval=1.0/freq,
+                pulse_count=int(1),
+                pulse_train_interval=float(0),
+                pulse_train_count=int(1)
+            )
+
+            return Solution(
+                id="solution",
+                name="Solution",
+                protocol_id="example_protocol",
+                transducer="example_transducer",
+                delays = np.zeros((1,64)),
+                apodizations = np.ones((1,64)),
+                pulse = pulse,
+                sequence = sequence,
+                voltage=SIMPLE_TX_VOLTAGE,
+                target=pt,
+                foci=[pt],
+                approved=True
+            )
+
+        logger.info("Set simple solution: frequency %s, pulses %s", freq, pulses)
+        tx_digest = self._shadow.digest({"simple": {"frequency": freq, "pulses": pulses}})
+        if not self._upload_solution(tx_digest, SIMPLE_TX_VOLTAGE, "sequence", build):
+            return False
 
         self._txconfigured_state = True
         self.txConfigStateChanged.emit(self._txconfigured_state)
@@ -380,26 +846,30 @@ class LIFUConnector(QObject):
         logger.info("Configuration reset")
 
     @pyqtSlot()
+    @device_command("TX", voidable=True)
     def start_sonication(self):
         """Start the beam, transitioning to RUNNING state."""
         if self._state == READY:
-            self.interface.hvcontroller.turn_hv_on()
+            if self._on_both_links(self.interface.hvcontroller.turn_hv_on):
+                self._hv_on = True
             if self.interface.txdevice.start_trigger():
-                self._state = RUNNING
+                self._update_trigger_state({"TriggerStatus": "RUNNING"})
+                self._set_state(RUNNING)
             else:
                 logger.info("Failed to start trigger")
-            self.stateChanged.emit(self._state)
             logger.info("Sonication started")
 
     @pyqtSlot()
+    @device_command("TX", priority=SAFETY)
     def stop_sonication(self):
         """Stop the beam and return to READY state."""
         if self._state == RUNNING:
-            if self.interface.stop_sonication():
-                self._state = READY
+            if self._on_both_links(self.interface.stop_sonication):
+                self._hv_on = False
+                self._update_trigger_state({"TriggerStatus": "STOPPED"})
+                self._set_state(READY)
             else:
                 logger.info("Failed to stop trigger")
-            self.stateChanged.emit(self._state)
             logger.info("Sonication stopped")
 
     @pyqtProperty(bool, notify=connectionStatusChanged)
@@ -412,6 +882,11 @@ class LIFUConnector(QObject):
         """Expose HV connection status to QML."""
         return self._hvConnected
 
+    @pyqtProperty(QObject, constant=True)
+    def dataFeed(self):
+        """Bounded MessageFeedModel of received device messages."""
+        return self._feed
+
     @pyqtProperty(int, notify=stateChanged)
     def state(self):
         """Expose state as a QML property."""
@@ -432,34 +907,55 @@ class LIFUConnector(QObject):
         """Expose trigger enabled status to QML."""
         return self._trigger_state
     
+    def _read_hv_info(self):
+        hv = self.interface.hvcontroller
+        return {"firmwareVersion": hv.get_version(), "deviceId": device_id(hv.get_hardware_id())}
+
+    def _read_tx_info(self):
+        tx = self.interface.txdevice
+        num_modules = tx.get_tx_module_count()
+        modules = [{"module": module, "firmwareVersion": tx.get_version(module),
+                    "deviceId": device_id(tx.get_hardware_id(module))}
+                   for module in range(1, num_modules + 1)]
+        return {"numModules": num_modules, "modules": modules}
+
+    def _link_info(self, link):
+        """Static facts for link; only the first call per connection reads the device.
+
+        Must run on the link's worker.
+        """
+        read = self._read_tx_info if link == "TX" else self._read_hv_info
+        info, fresh = self._device_info.get(link, read)
+        if fresh:
+            logger.info(f"{link} device info: {info}")
+            if link == "TX":
+                self._set_num_modules(info["numModules"])
+            self.deviceInfoChanged.emit()
+        return info
+
+    def _load_device_info(self, link):
+        try:
+            self._link_info(link)
+        except Exception as e:
+            logger.error(f"Error reading {link} device info: {e}")
+
     @pyqtSlot()
+    @device_command("HV")
     def queryHvInfo(self):
-        """Fetch and emit device information."""
-        try:
-            fw_version = self.interface.hvcontroller.get_version()
-            logger.info(f"Version: {fw_version}")
-            hw_id = self.interface.hvcontroller.get_hardware_id()
-            device_id = base58.b58encode(bytes.fromhex(hw_id)).decode()
-            self.hvDeviceInfoReceived.emit(fw_version, device_id)
-            logger.info(f"Device Info - Firmware: {fw_version}, Device ID: {device_id}")
+        """Emit device information; read from the device once per connection."""
+        try:
+            info = self._link_info("HV")
+            self.hvDeviceInfoReceived.emit(info["firmwareVersion"], info["deviceId"])
         except Exception as e:
             logger.error(f"Error querying device info: {e}")
 
     @pyqtSlot()
+    @device_command("TX")
     def queryTxInfo(self):
-        """Fetch and emit device information."""
+        """Emit per-module device information; read from the device once per connection."""
         try:
-            for module in range(1, self._num_modules_connected+1):
-                fw_version = self.interface.txdevice.get_version(module)
-                logger.info(f"Version: {fw_version}")
-                hw_id = self.interface.txdevice.get_hardware_id(module)            
-                if hw_id :
-                        device_id = base58.b58encode(bytes.fromhex(hw_id)).decode()
-                else:
-                    device_id = 'N/A'
-                
-                self.txDeviceInfoReceived.emit(module, fw_version, device_id)
-            logger.info(f"Device Info - Firmware: {fw_version}, Device ID: {device_id}")
+            for module in self._link_info("TX")["modules"]:
+                self.txDeviceInfoReceived.emit(module["module"], module["firmwareVersion"], module["deviceId"])
         except Exception as e:
             logger.error(f"Error querying device info: {e}")
 
@@ -468,7 +964,24 @@ class LIFUConnector(QObject):
         """Fetch and emit number of connected TX modules."""
         return self._num_modules_connected
 
+    @pyqtProperty(str, notify=deviceInfoChanged)
+    def hvFirmwareVersion(self):
+        info = self._device_info.peek("HV")
+        return info["firmwareVersion"] if info else "N/A"
+
+    @pyqtProperty(str, notify=deviceInfoChanged)
+    def hvDeviceId(self):
+        info = self._device_info.peek("HV")
+        return info["deviceId"] if info else "N/A"
+
+    @pyqtProperty(list, notify=deviceInfoChanged)
+    def txModules(self):
+        """[{module, firmwareVersion, deviceId}] per connected TX module."""
+        info = self._device_info.peek("TX")
+        return info["modules"] if info else []
+
     @pyqtSlot()
+    @device_command("HV")
     def queryHvTemperature(self):
         """Fetch and emit temperature data."""
         try:
@@ -476,12 +989,13 @@ class LIFUConnector(QObject):
             temp2 = self.interface.hvcontroller.get_temperature2()  
 
             self.temperatureHvUpdated.emit(temp1, temp2)
-            logger.info(f"Temperature Data - Temp1: {temp1}, Temp2: {temp2}")
+            logger.info("Temperature Data - Temp1: %s, Temp2: %s", temp1, temp2)
         except Exception as e:
             logger.error(f"Error querying temperature data: {e}")
 
 
     @pyqtSlot()
+    @device_command("TX")
     def queryTxTemperature(self):
         """Fetch and emit temperature data."""
         try:
@@ -491,22 +1005,164 @@ class LIFUConnector(QObject):
                 amb_temp = self.interface.txdevice.get_ambient_temperature(module)  
 
                 self.temperatureTxUpdated.emit(module, tx_temp, amb_temp)
-                logger.info(f"Temperature Data - Temp1: {tx_temp}, Temp2: {amb_temp}")
+                logger.info("Temperature Data - Temp1: %s, Temp2: %s", tx_temp, amb_temp)
         except Exception as e:
             logger.error(f"Error querying temperature data: {e}")
 
+    def _set_num_modules(self, num_modules):
+        """Record the TX module count, dropping cached pinmaps if it changed."""
+        if num_modules != self._num_modules_connected:
+            self._transducers.invalidate()
+        self._num_modules_connected = num_modules
+        self.numModulesUpdated.emit()
+
     @pyqtSlot()
+    @device_command("TX")
     def queryNumModules(self):
-        """Fetch and emit number of connected TX modules."""
+        """Emit the number of connected TX modules (read once per connection)."""
         try:
-            self._num_modules_connected = self.interface.txdevice.get_tx_module_count()
-            self.numModulesUpdated.emit()
+            self._set_num_modules(self._link_info("TX")["numModules"])
             logger.info(f"Number of connected TX modules: {self._num_modules_connected}")
 
         except Exception as e:
             logger.error(f"Error querying number of TX modules: {e}")
 
+    def _read_field(self, fields, name, fn, *args):
+        """Read one telemetry field into `fields`, stamped with its own read time."""
+        try:
+            value = fn(*args)
+            fields[name] = {"value": value, "timestamp": time.time()}
+        except Exception as e:
+            logger.error(f"Error reading {name}: {e}")
+            fields[name] = {"value": None, "timestamp": time.time(), "error": str(e)}
+        return fields[name]["value"]
+
+    def _read_hv_telemetry(self):
+        """Read all HV telemetry on the HV worker and emit the per-item signals."""
+        hv = self.interface.hvcontroller
+        fields = {}
+        temp1 = self._read_field(fields, "temperature1", hv.get_temperature1)
+        temp2 = self._read_field(fields, "temperature2", hv.get_temperature2)
+        hv_state = self._read_field(fields, "hv_status", hv.get_hv_status)
+        v12_state = self._read_field(fields, "v12_status", hv.get_12v_status)
+        rgb_state = self._read_field(fields, "rgb_state", hv.get_rgb_led)
+        voltages = self._read_field(fields, "monitor_voltages", hv.get_vmon_values)
+
+        if temp1 is not None and temp2 is not None:
+            self.temperatureHvUpdated.emit(temp1, temp2)
+        if hv_state is not None and v12_state is not None:
+            self.powerStatusReceived.emit(v12_state, hv_state)
+        if rgb_state is not None:
+            state_text = {0: "Off", 1: "Red", 2: "Green", 3: "Blue"}.get(rgb_state, "Unknown")
+            self.rgbStateReceived.emit(rgb_state, state_text)
+        if voltages is not None:
+            self.monVoltagesReceived.emit(voltages)
+        return fields
+
+    def _read_tx_telemetry(self):
+        """Read per-module temperatures and trigger state on the TX worker; the module count is cached."""
+        tx = self.interface.txdevice
+        fields = {}
+        self._read_field(fields, "num_modules", lambda: self._link_info("TX")["numModules"])
+
+        # All modules share one UART, so these round trips go back to back on
+        # the TX link while the HV link is read in parallel.
+        modules = []
+        for module in range(1, self._num_modules_connected+1):
+            module_fields = {"module": module}
+            tx_temp = self._read_field(module_fields, "tx_temperature", tx.get_temperature, module)
+            amb_temp = self._read_field(module_fields, "ambient_temperature", tx.get_ambient_temperature, module)
+            if tx_temp is not None and amb_temp is not None:
+                self.temperatureTxUpdated.emit(module, tx_temp, amb_temp)
+            modules.append(module_fields)
+        fields["modules"] = modules
+
+        trigger_data = self._read_field(fields, "trigger", self._read_trigger)
+        if trigger_data:
+            self._update_trigger_state(trigger_data)
+        return fields
+
+    def _read_trigger(self):
+        trigger_data = self.interface.txdevice.get_trigger_json()
+        return json.loads(trigger_data) if isinstance(trigger_data, str) else trigger_data
+
+    def _poll_mode(self, channel):
+        """TelemetryPoller mode for channel: None while its link is down."""
+        if not (self._txConnected if channel.link == "TX" else self._hvConnected):
+            return None
+        return "active" if self._state == RUNNING or self._trigger_state else "idle"
+
+    def _poll_channel(self, channel):
+        """Read one POLL_CHANNELS channel on its link's worker."""
+        # A poll older than its interval is superseded by the next one
+        return self._workers[channel.link].submit(self._poll_readers[channel.name], self, priority=POLL,
+                                                  max_wait=self._poller.interval(channel))
+
+    def _poll_hv_temperature(self):
+        hv = self.interface.hvcontroller
+        self.temperatureHvUpdated.emit(hv.get_temperature1(), hv.get_temperature2())
+
+    def _poll_hv_voltages(self):
+        self.monVoltagesReceived.emit(self.interface.hvcontroller.get_vmon_values())
+
+    def _poll_hv_power(self):
+        hv = self.interface.hvcontroller
+        self.powerStatusReceived.emit(hv.get_12v_status(), hv.get_hv_status())
+
+    def _poll_hv_rgb(self):
+        state = self.interface.hvcontroller.get_rgb_led()
+        self.rgbStateReceived.emit(state, {0: "Off", 1: "Red", 2: "Green", 3: "Blue"}.get(state, "Unknown"))
+
+    def _poll_tx_temperature(self):
+        tx = self.interface.txdevice
+        for module in range(1, self._link_info("TX")["numModules"] + 1):
+            self.temperatureTxUpdated.emit(module, tx.get_temperature(module), tx.get_ambient_temperature(module))
+
+    def _poll_tx_trigger(self):
+        self._update_trigger_state(self._read_trigger())
+
+    _poll_readers = {
+        "hv.temperature": _poll_hv_temperature,
+        "hv.voltages": _poll_hv_voltages,
+        "hv.power": _poll_hv_power,
+        "hv.rgb": _poll_hv_rgb,
+        "tx.temperature": _poll_tx_temperature,
+        "tx.trigger": _poll_tx_trigger,
+    }
+
+    @pyqtSlot()
+    @pyqtSlot(str)
+    def queryTelemetrySnapshot(self, link=""):
+        """Gather HV and TX telemetry concurrently and emit one snapshot.
+
+        link ("HV" or "TX") limits the snapshot to that link, so a page
+        showing one device does not read the other; the other's entry is
+        None. Each link is read on its own worker, so the refresh takes as
+        long as the slower link rather than the sum of every query. The
+        individual signals (temperatureHvUpdated, temperatureTxUpdated, ...)
+        still fire as fields arrive; telemetrySnapshotReady follows with
+        everything, each field carrying the time it was read.
+        """
+        started = time.time()
+        links = []
+        futures = []
+        if self._hvConnected and link in ("", "HV"):
+            links.append("hv")
+            futures.append(self._workers["HV"].submit(self._read_hv_telemetry))
+        if self._txConnected and link in ("", "TX"):
+            links.append("tx")
+            futures.append(self._workers["TX"].submit(self._read_tx_telemetry))
+
+        def emit_snapshot(results):
+            snapshot = {"timestamp": started, "hv": None, "tx": None}
+            snapshot.update(zip(links, results))
+            logger.debug("Telemetry snapshot took %.3fs", time.time() - started)
+            self.telemetrySnapshotReady.emit(snapshot)
+
+        when_all(futures, emit_snapshot)
+
     @pyqtSlot(int)
+    @device_command("HV")
     def setRGBState(self, state):
         """Set the RGB state using integer values."""
         try:
@@ -523,6 +1179,7 @@ class LIFUConnector(QObject):
             logger.error(f"Error setting RGB state: {e}")
             
     @pyqtSlot()
+    @device_command("HV")
     def queryRGBState(self):
         """Fetch and emit RGB state."""
         try:
@@ -535,6 +1192,7 @@ class LIFUConnector(QObject):
             logger.error(f"Error querying RGB state: {e}")
 
     @pyqtSlot()
+    @device_command("HV")
     def queryPowerStatus(self):
         """Fetch and emit HV state."""
         try:
@@ -546,6 +1204,7 @@ class LIFUConnector(QObject):
             logger.error(f"Error querying Power status: {e}")
     
     @pyqtSlot(bool)
+    @device_command("TX")
     def setAsyncMode(self, enable: bool):
         """Set the async mode for the interface."""
         try:
@@ -554,7 +1213,8 @@ class LIFUConnector(QObject):
         except Exception as e:
             logger.error(f"Error setting async mode: {e}")
 
-    @pyqtSlot(str, result=bool)
+    @pyqtSlot(str)
+    @device_command()
     def sendPingCommand(self, target: str):
         """Send a ping command to HV device."""
         try:
@@ -579,7 +1239,8 @@ class LIFUConnector(QObject):
             logger.error(f"Error sending ping command: {e}")
             return False
         
-    @pyqtSlot(str, result=bool)
+    @pyqtSlot(str)
+    @device_command()
     def sendLedToggleCommand(self, target: str):
         """Send a LED Toggle command to device."""
         try:
@@ -604,7 +1265,8 @@ class LIFUConnector(QObject):
             logger.error(f"Error sending Toggle command: {e}")
             return False
         
-    @pyqtSlot(str, result=bool)
+    @pyqtSlot(str)
+    @device_command()
     def sendEchoCommand(self, target: str):
         """Send Echo command to device."""
         try:
@@ -628,12 +1290,19 @@ class LIFUConnector(QObject):
             logger.error(f"Error sending Echo command: {e}")
             return False
     
-    @pyqtSlot(str, result=bool)
+    @pyqtSlot(str)
+    @device_command("HV")
     def setHVCommand(self, strval: str):
         """Set High voltage command to device."""
         try:
             voltage = float(strval)
+            digest = self._shadow.digest(voltage)
+            if self._shadow.holds("HV", "voltage", digest):
+                logger.info("Voltage already set, skipping")
+                return True
+            self._shadow.forget("HV", "voltage")
             if self.interface.hvcontroller.set_voltage(voltage=voltage):
+                self._shadow.record("HV", "voltage", digest)
                 logger.info(f"Voltage set successfully")
                 return True
             else:   
@@ -644,7 +1313,8 @@ class LIFUConnector(QObject):
             logger.error(f"Error setting High Voltage: {e}")
             return False
     
-    @pyqtSlot(int, int, result=bool)
+    @pyqtSlot(int, int)
+    @device_command("HV")
     def setFanLevel(self, fid: int, speed: int):
         """Set Fan Level to device."""
         try:
@@ -660,15 +1330,24 @@ class LIFUConnector(QObject):
             logger.error(f"Error setting Fan Speed: {e}")
             return False
     
-    @pyqtSlot(str, result=bool)
+    @pyqtSlot(str)
+    @device_command("TX")
     def setTrigger(self, triggerjson: str):
         """Set trigger settings on the device using JSON data."""
         try:
             json_trigger_data = json.loads(triggerjson)
-            
+            digest = self._shadow.digest(json_trigger_data)
+            if self._shadow.holds("TX", "trigger", digest):
+                logger.info("Trigger settings unchanged, skipping")
+                return True
+
+            # The trigger overrides the one the loaded solution programmed.
+            self._shadow.forget("TX", "trigger")
+            self._shadow.forget("TX", "solution")
             trigger_setting = self.interface.txdevice.set_trigger_json(data=json_trigger_data)
 
             if trigger_setting:
+                self._shadow.record("TX", "trigger", digest)
                 self._update_trigger_state(trigger_setting)  # Update trigger state dynamically
                 logger.info(f"Trigger Setting: {trigger_setting}")
                 return True
@@ -688,7 +1367,9 @@ class LIFUConnector(QObject):
             logger.error(f"Unexpected error while setting trigger: {e}")
             return False
 
-    @pyqtSlot(result=bool)
+    @pyqtSlot()
+    @device_command("TX", priority=lambda self: SAFETY if self._trigger_state else COMMAND,  # Stopping jumps the queue
+                    voidable=lambda self: not self._trigger_state)
     def toggleTrigger(self):
         """Toggle the trigger state (start or stop)."""
         try:
@@ -723,7 +1404,8 @@ class LIFUConnector(QObject):
             logger.error(f"Unexpected error while toggling trigger: {e}")
             return False
 
-    @pyqtSlot(result=bool)
+    @pyqtSlot()
+    @device_command("TX")
     def queryTriggerInfo(self):
         """Query the trigger status and update the state accordingly.
 
@@ -752,8 +1434,10 @@ class LIFUConnector(QObject):
             return False
         
     @pyqtSlot()
+    @device_command("HV")
     def softResetHV(self):
         """reset hardware HV device."""
+        self._shadow.forget("HV")
         try:
             if self.interface.hvcontroller.soft_reset():
                 logger.info(f"Software Reset Sent")
@@ -763,6 +1447,7 @@ class LIFUConnector(QObject):
             logger.error(f"Error Sending Software Reset: {e}")
 
     @pyqtSlot()
+    @device_command("HV", voidable=lambda self: not self._hv_on)
     def toggleHV(self):
         """Toggle HV on console."""
         try:
@@ -787,6 +1472,7 @@ class LIFUConnector(QObject):
             logger.error(f"Error toggling HV: {e}")
 
     @pyqtSlot()
+    @device_command("HV", priority=SAFETY)
     def turnOffHV(self):
         """Toggle HV on console."""
         try:
@@ -806,6 +1492,7 @@ class LIFUConnector(QObject):
             logger.error(f"Error toggling HV: {e}")
 
     @pyqtSlot()
+    @device_command("HV")
     def toggleV12(self):
         """Toggle V12 on console."""
         try:
@@ -830,19 +1517,23 @@ class LIFUConnector(QObject):
             logger.error(f"Error toggling HV: {e}")
 
     @pyqtSlot()
+    @device_command("HV")
     def getMonitorVoltages(self):
         """Get voltage monitor readings from console."""
         try:
             voltages = self.interface.hvcontroller.get_vmon_values()
-            logger.debug(f"Voltage readings: {voltages}")
+            logger.debug("Voltage readings: %s", voltages)
             # Emit the voltage readings to QML
             self.monVoltagesReceived.emit(voltages)
         except Exception as e:
             logger.error(f"Error getting voltages: {e}")
 
     @pyqtSlot()
+    @device_command("TX")
     def softResetTX(self):
         """reset hardware TX device."""
+        self._shadow.forget("TX")
+        self._clear_profiles()
         try:
             if self.interface.txdevice.soft_reset():
                 logger.info(f"Software Reset Sent")
@@ -852,12 +1543,132 @@ class LIFUConnector(QObject):
             logger.error(f"Error Sending Software Reset: {e}")
 
         
-    @pyqtProperty(str, constant=True)
-    def sdkVersion(self) -> str:
-        """Expose SDK version as a constant QML property."""
+    @pyqtSlot(result="QVariantMap")
+    def commandQueueStats(self):
+        """DeviceWorker.stats() of the TX and HV command queues."""
+        return {link: worker.stats() for link, worker in self._workers.items()}
+
+    def _publish_latency(self):
+        if self._latency.version != self._latency_version:
+            self._latency_version = self._latency.version
+            self.commandLatencyChanged.emit()
+
+    @pyqtProperty(list, notify=commandLatencyChanged)
+    def commandLatency(self):
+        """Round-trip latency per device and command: count, errors and p50/p95/p99/mean/max in ms."""
+        return self._latency.summary()
+
+    @pyqtSlot(str, result=str)
+    def dumpCommandLatency(self, path):
+        """Write the latency histograms as JSON to path (a new file under the data dir when empty).
+
+        Returns the path written, or an empty string on failure.
+        """
+        try:
+            if not path:
+                path = os.path.join(default_data_dir(), "latency", time.strftime("latency-%Y%m%d-%H%M%S.json"))
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, "w") as f:
+                f.write(self._latency.to_json())
+            logger.info(f"Command latency written to {path}")
+            return path
+        except Exception as e:
+            logger.error(f"Error writing command latency: {e}")
+            return ""
+
+    @pyqtSlot()
+    def resetCommandLatency(self):
+        self._latency.reset()
+        self._publish_latency()
+
+    @pyqtSlot(str, int, float, int, result=bool)
+    def startEchoStress(self, target, payload_size, seconds, count):
+        """Echo random payload_size-byte payloads back to back on "HV" or "TX".
+
+        Runs for `seconds` or `count` echoes (0 for no limit on either), with
+        progress and the result in echoStressResult. Returns False when the
+        test cannot start.
+        """
         try:
-            # Attempt to get SDK version from LIFUInterface
-            return LIFUInterface.get_sdk_version()
-        except (AttributeError, NameError):
-            # Fallback to default version if the function doesn't exist
-            return "0.3.2"
\ No newline at end of file
+            if self.echoStressRunning:
+                logger.error("Echo stress test already running")
+                return False
+            if target not in self._workers:
+                logger.error("Invalid target for echo stress test")
+                return False
+            if not (self._txConnected if target == "TX" else self._hvConnected):
+                logger.error(f"Echo stress test: {target} not connected")
+                return False
+            device = self.interface.txdevice if target == "TX" else self.interface.hvcontroller
+            stress = EchoStress(target, device.echo, self._workers[target], payload_size, seconds, count,
+                                progress=lambda result: self._echoStressProgress.emit(stress, result))
+        except ValueError as e:
+            logger.error(f"Error starting echo stress test: {e}")
+            return False
+        self._echo_stress = stress
+        self._on_echo_stress(stress.result())
+        stress.start()
+        return True
+
+    @pyqtSlot()
+    def stopEchoStress(self):
+        if self._echo_stress is not None:
+            self._echo_stress.stop()
+
+    def _on_echo_stress_progress(self, stress, result):
+        if stress is self._echo_stress:  # Not a late report from an earlier run
+            self._on_echo_stress(result)
+
+    def _on_echo_stress(self, result):
+        self._echo_stress_result = result
+        self.echoStressChanged.emit()
+
+    @pyqtProperty(bool, notify=echoStressChanged)
+    def echoStressRunning(self):
+        return self._echo_stress_result.get("running", False)
+
+    @pyqtProperty("QVariantMap", notify=echoStressChanged)
+    def echoStressResult(self):
+        """EchoStress.result() of the running or last echo stress test."""
+        return self._echo_stress_result
+
+    @pyqtSlot(result=list)
+    def telemetryChannels(self):
+        """Names of the telemetry channels that have history."""
+        return self._history.channels()
+
+    @pyqtSlot(str, int, float, result="QVariantMap")
+    def telemetrySeries(self, channel, points, seconds):
+        """History of a channel decimated to `points` min/max/mean buckets.
+
+        Covers the last `seconds`, or everything recorded when seconds <= 0.
+        Returns {"t": [...], "min": [...], "max": [...], "mean": [...]}.
+        """
+        return self._history.series(channel, points, seconds if seconds > 0 else None)
+
+    @pyqtProperty(int, notify=plotCacheStatsChanged)
+    def plotCacheHits(self):
+        """Number of plots served from the plot cache."""
+        return self._plots.hits
+
+    @pyqtProperty(int, notify=plotCacheStatsChanged)
+    def plotCacheMisses(self):
+        """Number of plots that had to be rendered."""
+        return self._plots.misses
+
+    @pyqtSlot()
+    def clearPlotCache(self):
+        """Drop all cached plots; the counters are kept."""
+        self._plots.clear()
+        self.plotCacheStatsChanged.emit()
+
+    @pyqtProperty(str, notify=sdkVersionChanged)
+    def sdkVersion(self) -> str:
+        """openlifu version, known once the device stack is imported."""
+        return self._sdk_version
+
+    @staticmethod
+    def _loaded_sdk_version():
+        # The imported package, whether installed or a PYTHONPATH checkout;
+        # never imported here, that would load all of openlifu up front.
+        return getattr(sys.modules.get("openlifu"), "__version__", None) or "unknown"
@@ -0,0 +1,53 @@
+import collections
+import threading
+
+import base58
+
+
+def device_id(hw_id) -> str:
+    """Display form (base58) of a hex hardware ID; 'N/A' when there is none."""
+    return base58.b58encode(bytes.fromhex(hw_id)).decode() if hw_id else "N/A"
+
+
+class DeviceInfo:
+    """Static facts about each connected link, read once per connection.
+
+    Firmware versions, hardware IDs and the TX module count cannot change
+    while a link stays connected, so they are read on the first request
+    after it connects and then served from memory. forget() on disconnect
+    also discards a read still in flight, so a slow read that finishes
+    after the link went away cannot fill the cache for the next connection.
+    """
+
+    def __init__(self):
+        self._items = {}  # link -> facts dict
+        self._generation = collections.Counter()  # link -> bumped by forget()
+        self._lock = threading.Lock()
+        self.reads = 0
+
+    def get(self, link: str, read):
+        """Return (facts, fresh): the cached facts for link, or read() them.
+
+        read runs on the calling thread, which should be the link's worker.
+        """
+        with self._lock:
+            facts = self._items.get(link)
+            generation = self._generation[link]
+        if facts is not None:
+            return facts, False
+        facts = read()
+        with self._lock:
+            self.reads += 1
+            if self._generation[link] == generation:
+                self._items[link] = facts
+        return facts, True
+
+    def peek(self, link: str):
+        """Cached facts for link, or None; never touches the device."""
+        with self._lock:
+            return self._items.get(link)
+
+    def forget(self, link: str):
+        with self._lock:
+            self._items.pop(link, None)
+            self._generation[link] += 1
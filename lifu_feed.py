@@ -0,0 +1,139 @@
+import collections
+import threading
+import time
+
+from PyQt6.QtCore import QAbstractListModel, QByteArray, QModelIndex, Qt, QTimer, pyqtProperty, pyqtSignal, pyqtSlot
+
+FRAME_INTERVAL_MS = 16  # Batches are delivered at most once per ~60 Hz frame
+
+
+def _format_time(timestamp: float) -> str:
+    # Formatted on demand, so only rows the view actually shows pay for it.
+    return time.strftime("%H:%M:%S", time.localtime(timestamp)) + f".{int(timestamp * 1000) % 1000:03d}"
+
+
+class MessageFeedModel(QAbstractListModel):
+    """Bounded list model of device messages, filled in frame-rate batches.
+
+    push() may be called from any thread (the UART read threads) and only
+    appends to a pending queue; the first push after a flush schedules one
+    flush on the model's thread, so a message flood costs one cross-thread
+    wakeup and one insert per frame rather than one signal per message.
+    Rows live in a fixed ring of `capacity` entries: the oldest rows are
+    removed as new ones arrive, and messages that would be evicted in the
+    same batch never reach the view.
+    """
+
+    TimeRole = Qt.ItemDataRole.UserRole + 1
+    DescriptorRole = Qt.ItemDataRole.UserRole + 2
+    MessageRole = Qt.ItemDataRole.UserRole + 3
+
+    countChanged = pyqtSignal()
+    batchAppended = pyqtSignal(int)  # Rows added by the last flush
+    _wake = pyqtSignal()
+
+    def __init__(self, capacity: int = 1000, interval_ms: int = FRAME_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self._capacity = capacity
+        self._rows = [None] * capacity  # (timestamp, descriptor, message)
+        self._start = 0
+        self._size = 0
+        self._pending = collections.deque(maxlen=capacity)
+        self._scheduled = False
+        self._received = 0
+        self._lock = threading.Lock()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+        self._wake.connect(self._timer.start)
+
+    def push(self, descriptor: str, message: str, timestamp: float = None):
+        """Queue a message for the next batch. Thread safe."""
+        item = (time.time() if timestamp is None else timestamp, descriptor, message)
+        with self._lock:
+            self._pending.append(item)
+            self._received += 1
+            wake = not self._scheduled
+            self._scheduled = True
+        if wake:
+            self._wake.emit()
+
+    @pyqtSlot()
+    def flush(self):
+        """Move pending messages into the model; runs on the model's thread."""
+        with self._lock:
+            batch = list(self._pending)
+            self._pending.clear()
+            self._scheduled = False
+        if not batch:
+            return
+        cap = self._capacity
+        size = self._size
+        batch = batch[-cap:]
+        n = len(batch)
+        overflow = self._size + n - cap
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            self._start = (self._start + overflow) % cap
+            self._size -= overflow
+            self.endRemoveRows()
+        self.beginInsertRows(QModelIndex(), self._size, self._size + n - 1)
+        end = self._start + self._size
+        for i, item in enumerate(batch):
+            self._rows[(end + i) % cap] = item
+        self._size += n
+        self.endInsertRows()
+        if self._size != size:
+            self.countChanged.emit()
+        self.batchAppended.emit(n)
+
+    @pyqtSlot()
+    def clear(self):
+        with self._lock:
+            self._pending.clear()
+        self.beginResetModel()
+        self._rows = [None] * self._capacity
+        self._start = self._size = 0
+        self.endResetModel()
+        self.countChanged.emit()
+
+    @pyqtProperty(int, notify=countChanged)
+    def count(self):
+        return self._size
+
+    @pyqtProperty(int, constant=True)
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def received(self):
+        """Messages pushed since creation, including ones never displayed."""
+        return self._received
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._size
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        row = index.row()
+        if not index.isValid() or not 0 <= row < self._size:
+            return None
+        timestamp, descriptor, message = self._rows[(self._start + row) % self._capacity]
+        if role == Qt.ItemDataRole.DisplayRole:
+            # One preformatted line: a single role lookup per delegate.
+            return f"{_format_time(timestamp)}  {descriptor}  {message}"
+        if role == self.TimeRole:
+            return _format_time(timestamp)
+        if role == self.DescriptorRole:
+            return descriptor
+        if role == self.MessageRole:
+            return message
+        return None
+
+    def roleNames(self):
+        return {
+            Qt.ItemDataRole.DisplayRole: QByteArray(b"display"),
+            self.TimeRole: QByteArray(b"time"),
+            self.DescriptorRole: QByteArray(b"descriptor"),
+            self.MessageRole: QByteArray(b"message"),
+        }
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import logging
+import os
+import time
+
+from PyQt6.QtCore import Qt
+
+from lifu_connector import RUNNING
+
+logger = logging.getLogger("LIFUConnector")
+
+DEFAULT_TIMEOUT = 60.0
+
+
+class ScriptError(Exception):
+    """A script step failed or timed out."""
+
+
+def load_script(path: str) -> list:
+    """Read an automation script: a JSON list of steps, or {"steps": [...]}."""
+    with open(path, encoding="utf-8") as f:
+        script = json.load(f)
+    steps = script.get("steps") if isinstance(script, dict) else script
+    if not isinstance(steps, list):
+        raise ScriptError(f"{path}: expected a list of steps")
+    return steps
+
+
+class ScriptRunner:
+    """Runs a scripted sequence of connector commands without any UI.
+
+    Steps are dicts with one action key:
+
+        {"call": "configure_transmitter", "args": [...]}  slot or method; waits
+            until the device workers are idle and fails when the command
+            reports failure through commandCompleted (unless "check": false)
+        {"wait_for": "txConnected", "equals": true}  poll a property
+        {"sleep": 5}
+        {"capture": "telemetry.json", "seconds": 60, "points": 600}
+            write every telemetry channel's history under output_dir
+        {"repeat": 10, "steps": [...]}
+
+    call and wait_for accept "timeout" (seconds, default 60). If the script
+    stops while sonicating, the sonication is stopped before returning.
+    """
+
+    def __init__(self, connector, steps, output_dir: str = "."):
+        self.connector = connector
+        self.steps = steps
+        self.output_dir = output_dir
+        self.steps_run = 0
+        self._failures = []  # (target, command) reported as failed
+        connector.commandCompleted.connect(self._on_command_completed, Qt.ConnectionType.DirectConnection)
+
+    def _on_command_completed(self, target, command, success):
+        if not success:
+            self._failures.append((target, command))
+
+    async def run(self) -> bool:
+        """Run every step; returns False on the first failing step."""
+        started = time.monotonic()
+        try:
+            await self._run_steps(self.steps)
+            logger.info(f"Script finished: {self.steps_run} steps in {time.monotonic() - started:.1f}s")
+            return True
+        except (ScriptError, asyncio.TimeoutError, AttributeError, TypeError, ValueError, OSError) as e:
+            logger.error(f"Script failed at step {self.steps_run}: {e}")
+            return False
+        finally:
+            await self._make_safe()
+
+    async def _run_steps(self, steps):
+        for step in steps:
+            self.steps_run += 1
+            if "repeat" in step:
+                for _ in range(int(step["repeat"])):
+                    await self._run_steps(step["steps"])
+            elif "call" in step:
+                await self._call(step)
+            elif "wait_for" in step:
+                await self._wait_for(step)
+            elif "sleep" in step:
+                await asyncio.sleep(float(step["sleep"]))
+            elif "capture" in step:
+                self._capture(step)
+            else:
+                raise ScriptError(f"Unknown step {step}")
+
+    async def _call(self, step):
+        name = step["call"]
+        logger.info(f"Script: {name}{tuple(step.get('args', []))}")
+        self._failures.clear()
+        result = getattr(self.connector, name)(*step.get("args", []))
+        if asyncio.iscoroutine(result):
+            result = await result
+        await asyncio.wait_for(asyncio.wrap_future(self.connector.drain()),
+                               step.get("timeout", DEFAULT_TIMEOUT))
+        if step.get("check", True) and (result is False or any(cmd == name for _, cmd in self._failures)):
+            raise ScriptError(f"{name} failed")
+
+    async def _wait_for(self, step):
+        name = step["wait_for"]
+        expected = step.get("equals", True)
+        deadline = time.monotonic() + step.get("timeout", DEFAULT_TIMEOUT)
+        while getattr(self.connector, name) != expected:
+            if time.monotonic() > deadline:
+                raise ScriptError(f"Timed out waiting for {name} == {expected!r}")
+            await asyncio.sleep(0.05)
+
+    def _capture(self, step):
+        seconds = float(step.get("seconds", 0))
+        points = int(step.get("points", 600))
+        series = {channel: self.connector.telemetrySeries(channel, points, seconds)
+                  for channel in self.connector.telemetryChannels()}
+        path = os.path.join(self.output_dir, step["capture"])
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"time": time.time(), "channels": series}, f)
+        logger.info(f"Telemetry captured to {path}")
+
+    async def _make_safe(self):
+        if self.connector.state == RUNNING:
+            logger.warning("Script ended while sonicating, stopping")
+            self.connector.stop_sonication()
+        elif self.connector.triggerEnabled:
+            logger.warning("Script ended with the trigger running, stopping it")
+            self.connector.toggleTrigger()
+        else:
+            return
+        try:
+            await asyncio.wait_for(asyncio.wrap_future(self.connector.drain()), DEFAULT_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.error("Timed out stopping sonication")
@@ -0,0 +1,180 @@
+import threading
+import time
+
+import numpy as np
+
+
+class _Level:
+    """One resolution of a TelemetryChannel: a ring of aggregated blocks."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.start = np.zeros(capacity)  # Block start time
+        self.vmin = np.zeros(capacity)
+        self.vmax = np.zeros(capacity)
+        self.vsum = np.zeros(capacity)
+        self.count = np.zeros(capacity, dtype=np.int64)
+        self.head = 0  # Next slot to write
+        self.size = 0
+        # Block still being filled from the level below: [start, min, max, sum, count, blocks]
+        self.open = None
+
+    def push(self, start, vmin, vmax, vsum, count):
+        i = self.head
+        self.start[i] = start
+        self.vmin[i] = vmin
+        self.vmax[i] = vmax
+        self.vsum[i] = vsum
+        self.count[i] = count
+        self.head = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def oldest(self):
+        return self.start[(self.head - self.size) % self.capacity] if self.size else np.inf
+
+    def ranges(self, t0, t1):
+        """Ring index ranges of the blocks starting in [t0, t1], oldest first."""
+        if not self.size:
+            return []
+        first = (self.head - self.size) % self.capacity
+        # The live part of the ring is at most two sorted runs.
+        if first + self.size <= self.capacity:
+            runs = [(first, first + self.size)]
+        else:
+            runs = [(first, self.capacity), (0, self.head)]
+        ranges = []
+        for lo, hi in runs:
+            a = lo + int(np.searchsorted(self.start[lo:hi], t0, side="left"))
+            b = lo + int(np.searchsorted(self.start[lo:hi], t1, side="right"))
+            if b > a:
+                ranges.append((a, b))
+        return ranges
+
+
+class TelemetryChannel:
+    """Fixed-memory history of one telemetry value.
+
+    Samples go into a preallocated ring (level 0). Every `factor` entries of
+    a level are folded into one min/max/sum/count block of the next, coarser
+    level, which is again a ring of the same capacity. Memory is fixed at
+    construction, recent data stays at full resolution and older data is
+    kept in progressively coarser form, so a channel can record for days.
+    Level 0 covers `capacity` samples, level k covers capacity * factor**k.
+    """
+
+    def __init__(self, capacity: int = 2048, factor: int = 8, levels: int = 5):
+        self.factor = factor
+        self.levels = [_Level(capacity) for _ in range(levels)]
+        self.latest = None  # (time, value)
+        self._lock = threading.Lock()
+
+    def append(self, value: float, timestamp: float = None):
+        timestamp = time.time() if timestamp is None else timestamp
+        value = float(value)
+        with self._lock:
+            self.latest = (timestamp, value)
+            block = (timestamp, value, value, value, 1)
+            self.levels[0].push(*block)
+            for level in self.levels[1:]:
+                if level.open is None:
+                    level.open = list(block) + [1]
+                else:
+                    acc = level.open
+                    acc[1] = min(acc[1], block[1])
+                    acc[2] = max(acc[2], block[2])
+                    acc[3] += block[3]
+                    acc[4] += block[4]
+                    acc[5] += 1
+                if level.open[5] < self.factor:
+                    break
+                block = tuple(level.open[:5])
+                level.open = None
+                level.push(*block)
+
+    def _select(self, t0, t1, budget):
+        """Pick the finest level that reaches back to t0 within budget blocks.
+
+        Returns (level number, ring indices); only binary searches are spent
+        on the levels that are passed over.
+        """
+        last = len(self.levels) - 1
+        for k, level in enumerate(self.levels):
+            reaches = level.size < level.capacity or level.oldest() <= t0
+            if not reaches and k < last:
+                continue
+            ranges = level.ranges(t0, t1)
+            if sum(b - a for a, b in ranges) <= budget or k == last:
+                idx = np.concatenate([np.arange(a, b) for a, b in ranges]) if ranges else np.empty(0, np.intp)
+                return k, idx[-budget:]
+
+    def series(self, points: int, seconds: float = None, end: float = None):
+        """Return up to `points` (time, min, max, mean) buckets.
+
+        The window is the last `seconds` before `end` (now by default), or
+        all recorded history. Work is bounded by points * factor regardless
+        of how long the channel has been recording.
+        """
+        points = max(1, int(points))
+        with self._lock:
+            if self.latest is None:
+                empty = np.empty(0)
+                return empty, empty, empty, empty
+            t1 = self.latest[0] if end is None else end
+            if seconds is None:
+                t0 = min(level.oldest() for level in self.levels)
+            else:
+                t0 = t1 - seconds
+
+            k, idx = self._select(t0, t1, points * self.factor)
+            level = self.levels[k]
+            start = level.start[idx]
+            vmin = level.vmin[idx]
+            vmax = level.vmax[idx]
+            vsum = level.vsum[idx]
+            count = level.count[idx]
+            # Blocks of finer levels that have not been folded into this one yet.
+            pending = [lvl.open for lvl in self.levels[1:k + 1] if lvl.open is not None and lvl.open[0] <= t1]
+            if pending:
+                pending.sort(key=lambda acc: acc[0])
+                extra = np.array([acc[:5] for acc in pending]).T
+                start, vmin, vmax, vsum, count = (np.concatenate([a, b]) for a, b in
+                                                  zip((start, vmin, vmax, vsum, count), extra))
+
+        if not len(start):
+            empty = np.empty(0)
+            return empty, empty, empty, empty
+        lo = min(t0, start[0])
+        width = max(t1 - lo, 1e-9) / points
+        bucket = np.minimum(((start - lo) / width).astype(np.int64), points - 1)
+        edges = np.flatnonzero(np.r_[True, np.diff(bucket) != 0])
+        return (lo + (bucket[edges] + 0.5) * width,
+                np.minimum.reduceat(vmin, edges),
+                np.maximum.reduceat(vmax, edges),
+                np.add.reduceat(vsum, edges) / np.add.reduceat(count, edges))
+
+
+class TelemetryHistory:
+    """Named TelemetryChannels, created on first sample."""
+
+    def __init__(self, capacity: int = 2048, factor: int = 8, levels: int = 5):
+        self._params = (capacity, factor, levels)
+        self._channels = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, value: float, timestamp: float = None):
+        channel = self._channels.get(name)
+        if channel is None:
+            with self._lock:
+                channel = self._channels.setdefault(name, TelemetryChannel(*self._params))
+        channel.append(value, timestamp)
+
+    def channels(self):
+        return sorted(self._channels)
+
+    def series(self, name: str, points: int, seconds: float = None) -> dict:
+        """Decimated series of a channel as plain lists, for QML charts."""
+        channel = self._channels.get(name)
+        if channel is None:
+            return {"t": [], "min": [], "max": [], "mean": []}
+        t, vmin, vmax, mean = channel.series(points, seconds)
+        return {"t": t.tolist(), "min": vmin.tolist(), "max": vmax.tolist(), "mean": mean.tolist()}
@@ -0,0 +1,155 @@
+import bisect
+import functools
+import inspect
+import json
+import math
+import threading
+import time
+
+# Log-spaced bucket upper bounds, 10 per decade from 10 us to 100 s (~26% wide).
+BUCKET_BOUNDS = tuple(10 ** (exponent / 10) for exponent in range(-50, 21))
+
+
+class LatencyHistogram:
+    """Round-trip times of one command, bucketed on BUCKET_BOUNDS.
+
+    Percentiles are interpolated (log-linearly) inside the bucket they fall
+    in, so they are accurate to well within a bucket width while memory
+    stays fixed however many calls are recorded.
+    """
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)  # Last one: above 100 s
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float, error: bool = False):
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.errors += error
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        """Latency in seconds below which a fraction q of the calls fall."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, n in enumerate(self.buckets):
+            if n and seen + n >= rank:
+                low = BUCKET_BOUNDS[index - 1] if index else self.min
+                high = BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else self.max
+                low, high = max(low, self.min), min(high, self.max)
+                fraction = (rank - seen) / n
+                return low * (high / low) ** fraction if low > 0 else high * fraction
+            seen += n
+        return self.max
+
+    def summary(self) -> dict:
+        """Counts and p50/p95/p99/mean/max in milliseconds."""
+        ms = 1000.0
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "p50": self.percentile(0.50) * ms,
+            "p95": self.percentile(0.95) * ms,
+            "p99": self.percentile(0.99) * ms,
+            "mean": self.total / self.count * ms if self.count else 0.0,
+            "max": self.max * ms,
+        }
+
+
+class CommandLatency:
+    """Per-device, per-command latency histograms. Thread safe.
+
+    A call counts as an error when it raises or returns False, the way
+    the openlifu interfaces report most failures.
+    """
+
+    def __init__(self):
+        self._histograms = {}  # (device, command) -> LatencyHistogram
+        self._lock = threading.Lock()
+        self.version = 0  # Bumped per record, to notice changes cheaply
+
+    def record(self, device: str, command: str, seconds: float, error: bool = False):
+        with self._lock:
+            histogram = self._histograms.get((device, command))
+            if histogram is None:
+                histogram = self._histograms[(device, command)] = LatencyHistogram()
+            histogram.record(seconds, error)
+            self.version += 1
+
+    def summary(self) -> list:
+        """[{device, command, count, errors, p50, p95, p99, mean, max}] sorted by device and command."""
+        with self._lock:
+            return [{"device": device, "command": command, **histogram.summary()}
+                    for (device, command), histogram in sorted(self._histograms.items())]
+
+    def to_json(self) -> str:
+        with self._lock:
+            histograms = [{"device": device, "command": command, **histogram.summary(),
+                           "buckets": {f"{bound * 1000:.4g}": n
+                                       for bound, n in zip(BUCKET_BOUNDS + (math.inf,), histogram.buckets) if n}}
+                          for (device, command), histogram in sorted(self._histograms.items())]
+        return json.dumps({"time": time.time(), "unit": "ms", "histograms": histograms}, indent=1)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self.version += 1
+
+
+class TimedDevice:
+    """Proxy that times every public method call of a device into CommandLatency.
+
+    Attributes that are not methods pass straight through, as do
+    coroutine functions, whose call only creates the coroutine.
+    """
+
+    def __init__(self, target, device: str, latency: CommandLatency):
+        self._target = target
+        self._device = device
+        self._latency = latency
+        self._methods = {}  # name -> timed wrapper
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        if name.startswith("_") or not inspect.ismethod(value) or inspect.iscoroutinefunction(value):
+            return value
+        timed = self._methods.get(name)
+        if timed is None:
+            timed = self._methods[name] = self._timed(name)
+        return timed
+
+    def _timed(self, name):
+        target, device, latency = self._target, self._device, self._latency
+
+        @functools.wraps(getattr(target, name))
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = getattr(target, name)(*args, **kwargs)
+            except Exception:
+                latency.record(device, name, time.perf_counter() - start, error=True)
+                raise
+            latency.record(device, name, time.perf_counter() - start, error=result is False)
+            return result
+        return timed
+
+
+class TimedInterface(TimedDevice):
+    """TimedDevice for a LIFUInterface, with its txdevice and hvcontroller timed too.
+
+    Interface-level calls (set_solution, stop_sonication, ...) span both
+    links and are recorded under device "LIFU".
+    """
+
+    def __init__(self, interface, latency: CommandLatency):
+        super().__init__(interface, "LIFU", latency)
+        self.txdevice = TimedDevice(interface.txdevice, "TX", latency)
+        self.hvcontroller = TimedDevice(interface.hvcontroller, "HV", latency)
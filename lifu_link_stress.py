@@ -0,0 +1,148 @@
+import logging
+import random
+import threading
+import time
+
+from lifu_latency import LatencyHistogram
+from lifu_worker import POLL
+
+logger = logging.getLogger("LIFUConnector")
+
+MAX_PAYLOAD = 0xFFFF  # The UART packet length field is 16 bits
+MAX_CONSECUTIVE_ERRORS = 10  # Give up on a link that stopped answering
+PROGRESS_INTERVAL_S = 0.5
+
+
+class EchoStress:
+    """Link throughput test: echo random payloads back to back on one link.
+
+    Each round trip is a separate POLL job on the link's worker, so user
+    commands and safety stops still get through between echoes, and the
+    latency is timed on the worker, without the queueing. Echoes are not
+    pipelined: openlifu's send_packet waits for each reply and the worker
+    owns the UART. Runs until `seconds` have passed or `count` echoes are
+    done (whichever is set and first; 0 means no limit), stop() is called,
+    or MAX_CONSECUTIVE_ERRORS echoes in a row fail.
+
+    A raised exception or no reply at all ((None, None), as TxDevice.echo
+    returns when disconnected) is an error; a reply that differs from the
+    payload is a mismatch. mismatchRate is over the echoes that got a
+    reply, and bytesPerSec counts matched payload bytes in one direction.
+    progress(result) is called from the driver thread about every
+    PROGRESS_INTERVAL_S and once at the end.
+    """
+
+    def __init__(self, target: str, echo, worker, payload_size: int, seconds: float = 0, count: int = 0,
+                 progress=None, seed=None):
+        if not 1 <= payload_size <= MAX_PAYLOAD:
+            raise ValueError(f"Payload size must be 1..{MAX_PAYLOAD} bytes, not {payload_size}")
+        if seconds <= 0 and count <= 0:
+            raise ValueError("Echo stress needs a duration or a count")
+        self.target = target
+        self.payload_size = payload_size
+        self.seconds = seconds
+        self.count = count
+        self._echo = echo
+        self._worker = worker
+        self._progress = progress
+        self._rng = random.Random(seed)
+        self._latency = LatencyHistogram()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.messages = 0
+        self.mismatches = 0
+        self.errors = 0
+        self.aborted = ""  # Why the run ended early, if it did
+        self._started = None
+        self._finished = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        self._started = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name=f"{self.target}-echo-stress", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def join(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _round_trip(self, payload: bytes):
+        """One echo on the worker thread: (seconds, matched); raises on link errors."""
+        start = time.perf_counter()
+        data, length = self._echo(echo_data=payload)
+        elapsed = time.perf_counter() - start
+        if data is None:
+            raise OSError(f"{self.target} sent no echo reply")
+        return elapsed, data == payload and length == len(payload)
+
+    def _run(self):
+        deadline = self._started + self.seconds if self.seconds > 0 else None
+        next_progress = self._started + PROGRESS_INTERVAL_S
+        failed = 0
+        while not self._stop.is_set():
+            if self.count > 0 and self.messages >= self.count:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            payload = self._rng.randbytes(self.payload_size)  # Fresh bytes catch stale replies
+            try:
+                elapsed, matched = self._worker.submit(self._round_trip, payload, priority=POLL).result()
+            except Exception as e:
+                if self._worker.closed:
+                    self.aborted = "worker shut down"
+                    break
+                failed += 1
+                with self._lock:
+                    self.messages += 1
+                    self.errors += 1
+                logger.warning(f"{self.target} echo failed ({failed} in a row): {e}")
+                if failed >= MAX_CONSECUTIVE_ERRORS:
+                    self.aborted = f"{failed} echoes in a row failed"
+                    break
+                continue
+            failed = 0
+            with self._lock:
+                self.messages += 1
+                self.mismatches += not matched
+                self._latency.record(elapsed, error=not matched)
+            if self._progress is not None and time.monotonic() >= next_progress:
+                next_progress += PROGRESS_INTERVAL_S
+                self._progress(self.result())
+        self._finished = time.monotonic()
+        result = self.result()
+        logger.info(f"{self.target} echo stress: {result['messages']} x {self.payload_size} B in "
+                    f"{result['seconds']:.1f}s, {result['bytesPerSec']:.0f} B/s, "
+                    f"p99 {result['latency']['p99']:.2f} ms, {result['mismatches']} mismatches, "
+                    f"{result['errors']} errors{', ' + self.aborted if self.aborted else ''}")
+        if self._progress is not None:
+            self._progress(result)
+
+    def result(self) -> dict:
+        """Counts, rates and the latency summary (ms) so far."""
+        with self._lock:
+            end = self._finished or time.monotonic()
+            seconds = end - self._started if self._started is not None else 0.0
+            replied = self.messages - self.errors
+            matched = replied - self.mismatches
+            return {
+                "target": self.target,
+                "payloadSize": self.payload_size,
+                "running": self._finished is None,
+                "messages": self.messages,
+                "mismatches": self.mismatches,
+                "errors": self.errors,
+                "mismatchRate": self.mismatches / replied if replied else 0.0,
+                "seconds": seconds,
+                "bytes": matched * self.payload_size,
+                "bytesPerSec": matched * self.payload_size / seconds if seconds > 0 else 0.0,
+                "messagesPerSec": self.messages / seconds if seconds > 0 else 0.0,
+                "latency": self._latency.summary(),
+                "aborted": self.aborted,
+            }
@@ -0,0 +1,134 @@
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class RateLimitFilter(logging.Filter):
+    """Token-bucket rate limit per message type.
+
+    Records are grouped by their `rate_key` extra (e.g. "rx.TX" for the
+    status stream). Each key may burst up to `burst` records and then pass
+    its rate per second (from key_rates by prefix, else `rate`); the rest
+    are dropped before they are queued or formatted. The next record that
+    passes for a key reports how many were dropped. Records without a
+    rate_key are only limited, per call site, when `rate` is set.
+    Warnings and errors are never limited.
+    """
+
+    def __init__(self, rate: float = None, burst: int = 50, key_rates=None):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.key_rates = dict(key_rates or {})  # key prefix -> records per second
+        self._buckets = {}  # key -> [tokens, last refill, suppressed]
+        self._lock = threading.Lock()
+
+    def _rate_for(self, key):
+        if isinstance(key, str):
+            for prefix, rate in self.key_rates.items():
+                if key.startswith(prefix):
+                    return rate
+        return self.rate
+
+    def _admit(self, key, consume: bool):
+        """Refill key's bucket; return the suppressed count, or None when over the limit."""
+        rate = self._rate_for(key)
+        if rate is None:
+            return 0
+        capacity = min(self.burst, max(rate, 1))
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [capacity, now, 0]
+            bucket[0] = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            if bucket[0] < 1:
+                bucket[2] += 1
+                return None
+            if not consume:
+                return 0
+            bucket[0] -= 1
+            suppressed, bucket[2] = bucket[2], 0
+            return suppressed
+
+    def ready(self, key) -> bool:
+        """Whether a record for key would pass now; counts it as suppressed if not."""
+        return self._admit(key, consume=False) is not None
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+        key = getattr(record, "rate_key", None)
+        if key is None:
+            if self.rate is None:
+                return True
+            key = (record.pathname, record.lineno)
+        suppressed = self._admit(key, consume=True)
+        if suppressed is None:
+            return False
+        if suppressed:
+            record.msg = f"{record.msg} ({suppressed} similar messages suppressed)"
+        return True
+
+
+_active_filter = None  # RateLimitFilter installed by configure_logging
+
+
+def sampled(logger: logging.Logger, key: str, level: int = logging.INFO) -> bool:
+    """Cheap call-site check for high-rate log lines.
+
+    False when the logger is not enabled for level or the rate limit for
+    key is used up, so the caller can skip building the record entirely.
+    Always True (when enabled) if configure_logging has not been called.
+    """
+    if not logger.isEnabledFor(level):
+        return False
+    limiter = _active_filter
+    return limiter is None or limiter.ready(key)
+
+
+class _LazyQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread.
+
+    The stock prepare() formats the message on the logging thread so the
+    record can be pickled; records here stay in process, so msg % args is
+    only evaluated by the background writer.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+def configure_logging(level=logging.INFO, status_rate: float = 1.0, rate: float = None, burst: int = 50,
+                      logger_name: str = "LIFUConnector"):
+    """Route logger_name through a queue to a background console writer.
+
+    status_rate limits the per-message "Data received" lines (per link).
+    rate, when set, limits every other INFO/DEBUG call site as well, with
+    burst; by default they are not limited. Replaces the logger's
+    existing handlers and returns the started QueueListener; call its
+    stop() on shutdown to flush.
+    """
+    log_queue = queue.SimpleQueue()
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter(LOG_FORMAT))
+    listener = logging.handlers.QueueListener(log_queue, console)
+
+    global _active_filter
+    _active_filter = RateLimitFilter(rate=rate, burst=burst, key_rates={"rx.": status_rate})
+    handler = _LazyQueueHandler(log_queue)
+    handler.addFilter(_active_filter)
+
+    logger = logging.getLogger(logger_name)
+    for old in list(logger.handlers):
+        logger.removeHandler(old)
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+    listener.start()
+    return listener
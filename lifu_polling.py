@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import math
+from typing import NamedTuple
+
+logger = logging.getLogger("LIFUConnector")
+
+MAX_BACKOFF_S = 60.0
+
+
+class PollChannel(NamedTuple):
+    """A telemetry channel and its poll interval (seconds) per mode.
+
+    Modes missing from intervals, or a None mode, are not polled.
+    """
+    name: str
+    link: str
+    intervals: dict
+
+
+class TelemetryPoller:
+    """Polls telemetry channels on the asyncio loop at mode-dependent rates.
+
+    mode(channel) names the current mode (e.g. "active" or "idle") or
+    returns None to stop polling the channel; poll(channel) starts a read
+    and returns a concurrent Future, normally from the link's worker.
+    Each channel runs on its own fixed grid (deadline += interval rather
+    than now + interval), so read time does not accumulate as drift; a
+    read that overruns skips the missed slots instead of bursting. Failed
+    reads back off exponentially, up to max_backoff. notify() (thread
+    safe) re-evaluates the modes at once, e.g. when sonication starts.
+    """
+
+    def __init__(self, channels, mode, poll, max_backoff: float = MAX_BACKOFF_S):
+        self.channels = list(channels)
+        self._mode = mode
+        self._poll = poll
+        self.max_backoff = max_backoff
+        self.polls = {channel.name: 0 for channel in self.channels}
+        self.failures = {channel.name: 0 for channel in self.channels}  # Consecutive
+        self._loop = None
+        self._wakes = {}
+        self._tasks = []
+
+    @property
+    def running(self):
+        return bool(self._tasks)
+
+    def start(self):
+        """Start polling; call from the running event loop."""
+        if self._tasks:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakes = {channel.name: asyncio.Event() for channel in self.channels}
+        self._tasks = [self._loop.create_task(self._run(channel)) for channel in self.channels]
+
+    def stop(self):
+        """Cancel polling; a read already queued on a worker still completes."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+
+    def notify(self, *_):
+        """Re-evaluate every channel's mode now; safe from any thread."""
+        loop = self._loop
+        if loop is None or loop.is_closed() or not self._tasks:
+            return
+        for wake in self._wakes.values():
+            loop.call_soon_threadsafe(wake.set)
+
+    def interval(self, channel):
+        """Seconds until the next read of channel, including backoff; None when idle."""
+        interval = channel.intervals.get(self._mode(channel))
+        failures = self.failures[channel.name]
+        if interval is None or not failures:
+            return interval
+        return min(interval * 2 ** failures, max(interval, self.max_backoff))
+
+    async def _wait(self, channel, timeout=None):
+        """Sleep up to timeout; True if woken early by notify()."""
+        wake = self._wakes[channel.name]
+        try:
+            await asyncio.wait_for(wake.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            wake.clear()
+
+    async def _run(self, channel):
+        loop = self._loop
+        deadline = loop.time()
+        mode = None
+        while True:
+            if self._mode(channel) != mode:
+                # Poll at once on a mode change (connect, sonication start/stop)
+                mode = self._mode(channel)
+                self.failures[channel.name] = 0
+                deadline = loop.time()
+            interval = self.interval(channel)
+            if interval is None:
+                await self._wait(channel)
+                continue
+            delay = deadline - loop.time()
+            if delay > 0 and await self._wait(channel, delay):
+                continue
+            try:
+                await asyncio.wrap_future(self._poll(channel))
+                self.failures[channel.name] = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures[channel.name] += 1
+                logger.warning(f"Polling {channel.name} failed ({self.failures[channel.name]} in a row): {e}")
+            self.polls[channel.name] += 1
+            step = self.interval(channel)
+            if step is None:
+                continue
+            deadline += step
+            now = loop.time()
+            if deadline < now:  # Overran: skip the missed slots
+                deadline += math.ceil((now - deadline) / step) * step
@@ -0,0 +1,68 @@
+import logging
+from typing import NamedTuple
+
+import numpy as np
+
+logger = logging.getLogger("LIFUConnector")
+
+# TX7332 delay profiles (LIFUTXDevice.VALID_DELAY_PROFILES); pulse profiles
+# go up to 32. Not read from openlifu so importing this module stays cheap.
+MAX_PROFILES = 16
+
+
+class ProfileSlot(NamedTuple):
+    """A solution held in a device profile slot (1-based)."""
+    slot: int
+    tx_digest: str  # DeviceShadow digest of the TX part of the solution
+    sequence: dict
+    trigger_mode: str
+    voltage: float
+
+
+def load_profiles(txdevice, solutions):
+    """Program each solution dict into its own TX7332 profile slot.
+
+    Slot i + 1 holds solutions[i]; slot 1 is left active. The pulse and
+    delay profiles of all slots are computed host side and written in a
+    single register pass, the same way TxDevice.set_solution writes one.
+    Raises ValueError for more than MAX_PROFILES solutions and OSError
+    when the device rejects a register write.
+    """
+    from openlifu.io.LIFUTXDevice import (DEFAULT_PATTERN_DUTY_CYCLE, NUM_CHANNELS, Tx7332DelayProfile,
+                                          Tx7332PulseProfile)
+
+    if not 0 < len(solutions) <= MAX_PROFILES:
+        raise ValueError(f"Between 1 and {MAX_PROFILES} solutions can be preloaded, got {len(solutions)}")
+    elements = np.asarray(solutions[0]["delays"]).size
+    txdevice.enum_tx7332_devices(num_devices=elements // NUM_CHANNELS)
+    registers = txdevice.tx_registers
+    for slot, solution in enumerate(solutions, start=1):
+        pulse = solution["pulse"]
+        delays = np.asarray(solution["delays"], dtype=float).reshape(-1)
+        apodizations = np.asarray(solution["apodizations"], dtype=float).reshape(-1)
+        duty_cycle = DEFAULT_PATTERN_DUTY_CYCLE * apodizations.max() * pulse.get("amplitude", 1.0)
+        registers.add_pulse_profile(Tx7332PulseProfile(profile=slot, frequency=pulse["frequency"],
+                                                       cycles=int(pulse["duration"] * pulse["frequency"]),
+                                                       duty_cycle=duty_cycle), activate=slot == 1)
+        registers.add_delay_profile(Tx7332DelayProfile(profile=slot, delays=delays, apodizations=apodizations),
+                                    activate=slot == 1)
+    if not txdevice.apply_all_registers():
+        raise OSError("Failed to write TX profile registers")
+
+
+def activate_profile(txdevice, slot: int):
+    """Switch the TX7332s to a preloaded profile slot.
+
+    Only the delay select, apodization and pulse control registers of each
+    transmitter are rewritten; the profile data is already on the chips.
+    """
+    from openlifu.io.LIFUTXDevice import pack_registers
+
+    registers = txdevice.tx_registers
+    registers.activate_delay_profile(slot)
+    registers.activate_pulse_profile(slot)
+    controls = zip(registers.get_delay_control_registers(), registers.get_pulse_control_registers())
+    for identifier, (delay_control, pulse_control) in enumerate(controls):
+        for address, values in pack_registers({**delay_control, **pulse_control}, pack_single=True).items():
+            if not txdevice.write_block(identifier=identifier, start_address=address, reg_values=values):
+                raise OSError(f"Failed to select profile {slot} on TX7332 {identifier}")
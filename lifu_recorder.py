@@ -0,0 +1,268 @@
+import bisect
+import glob
+import heapq
+import itertools
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from lifu_status import StatusDecoder
+
+logger = logging.getLogger("LIFUConnector")
+
+MAGIC = b"LIFUREC2"
+SUFFIX = ".lrec"
+INDEX_SUFFIX = ".idx"
+
+MESSAGE = 1  # Raw message from a device link
+STATUS = 2  # Decoded TX status record
+SAMPLE = 3  # Named telemetry value
+
+MAX_SKEW_S = 1.0  # How far out of timestamp order records from different threads can be written
+
+_FILE_HEADER = struct.Struct("<8sd")  # magic, first timestamp
+_RECORD_HEADER = struct.Struct("<dBI")  # timestamp, kind, payload length
+_SAMPLE = struct.Struct("<d")
+INDEX_DTYPE = np.dtype([("timestamp", "<f8"), ("offset", "<u8")])
+
+
+class Record(NamedTuple):
+    """One recorded entry.
+
+    source is the link for MESSAGE and STATUS records and the channel name
+    for SAMPLE records; value is the message text, a StatusRecord or a float.
+    STATUS records and the status.* samples are derived from TX messages
+    when reading, so a status line is stored once.
+    """
+    timestamp: float
+    kind: int
+    source: str
+    value: Any
+
+
+def _short_str(text: str) -> bytes:
+    data = text.encode("utf-8")[:255]
+    return bytes([len(data)]) + data
+
+
+def _read_short_str(payload, offset: int):
+    end = offset + 1 + payload[offset]
+    return bytes(payload[offset + 1:end]).decode("utf-8", "replace"), end
+
+
+class SessionRecorder:
+    """Append-only binary capture of the device data stream.
+
+    Records go to <directory>/session-<time>-<seq>.lrec, a 16-byte header
+    followed by (timestamp, kind, length, payload) records. Every
+    index_every bytes a (timestamp, offset) pair is appended to the sidecar
+    .idx file, which SessionReader uses to seek without scanning. Files
+    rotate at max_bytes and only the newest max_files are kept.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 64 * 1024 * 1024, max_files: int = 32,
+                 index_every: int = 64 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.index_every = index_every
+        self.path = None
+        self._file = None
+        self._index = None
+        self._size = 0
+        self._indexed_at = None  # Offset of the last index entry
+        self._seq = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def record_message(self, descriptor: str, message: str, timestamp: float = None):
+        payload = _short_str(descriptor) + message.encode("utf-8", "replace")
+        self._write(MESSAGE, payload, timestamp)
+
+    def record_sample(self, channel: str, value: float, timestamp: float = None):
+        self._write(SAMPLE, _SAMPLE.pack(value) + channel.encode("utf-8"), timestamp)
+
+    def _write(self, kind: int, payload: bytes, timestamp: float = None):
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            if self._closed:
+                return  # A late write from another thread after close()
+            if self._file is None or self._size >= self.max_bytes:
+                self._rotate(timestamp)
+            if self._indexed_at is None or self._size - self._indexed_at >= self.index_every:
+                self._index.write(np.array([(timestamp, self._size)], dtype=INDEX_DTYPE).tobytes())
+                self._indexed_at = self._size
+            self._file.write(_RECORD_HEADER.pack(timestamp, kind, len(payload)))
+            self._file.write(payload)
+            self._size += _RECORD_HEADER.size + len(payload)
+
+    def _rotate(self, timestamp: float):
+        self._close_files()
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(timestamp))
+        while True:
+            self.path = os.path.join(self.directory, f"session-{stamp}-{self._seq:04d}{SUFFIX}")
+            self._seq += 1
+            if not os.path.exists(self.path):
+                break
+        self._file = open(self.path, "wb")
+        self._index = open(self.path + INDEX_SUFFIX, "wb")
+        self._file.write(_FILE_HEADER.pack(MAGIC, timestamp))
+        self._size = _FILE_HEADER.size
+        self._indexed_at = None
+        logger.info(f"Recording session to {self.path}")
+        self._prune()
+
+    def _prune(self):
+        paths = sorted(glob.glob(os.path.join(self.directory, f"session-*{SUFFIX}")),
+                       key=lambda p: (os.path.getmtime(p), p))
+        for path in paths[:-self.max_files]:
+            for stale in (path, path + INDEX_SUFFIX):
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                self._index.flush()
+
+    def _close_files(self):
+        if self._file is not None:
+            self._file.close()
+            self._index.close()
+            self._file = self._index = None
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._close_files()
+
+
+class SessionReader:
+    """Random access to recorded sessions by timestamp.
+
+    Files are memory-mapped; the sidecar index narrows a seek down to at
+    most index_every bytes of record headers, so nothing is loaded or
+    decoded much before the requested start time. The TX and HV threads
+    write records slightly out of timestamp order, so a range is scanned
+    MAX_SKEW_S past either end and re-sorted.
+    """
+
+    def __init__(self, path: str):
+        if os.path.isdir(path):
+            paths = glob.glob(os.path.join(path, f"session-*{SUFFIX}"))
+        else:
+            paths = [path]
+        files = []
+        for p in paths:
+            try:
+                with open(p, "rb") as f:
+                    magic, start = _FILE_HEADER.unpack(f.read(_FILE_HEADER.size))
+            except (OSError, struct.error):
+                continue
+            if magic == MAGIC:
+                files.append((start, p))
+        files.sort()
+        self._starts = [start for start, _ in files]
+        self.paths = [p for _, p in files]
+        self._status_decoder = StatusDecoder()
+
+    def records(self, start: float = None, end: float = None, kinds=None):
+        """Yield Records with start <= timestamp <= end, oldest first.
+
+        Records with equal timestamps keep the order they were written in.
+        """
+        low = None if start is None else start - MAX_SKEW_S
+        high = None if end is None else end + MAX_SKEW_S
+        first = 0
+        if low is not None:
+            first = max(0, bisect.bisect_left(self._starts, low) - 1)
+        pending = []  # heap of (timestamp, seq, Record) not yet known to be in order
+        seq = itertools.count()
+        for file_start, path in zip(self._starts[first:], self.paths[first:]):
+            if high is not None and file_start > high:
+                break
+            for record in self._file_records(path, low, high, kinds):
+                heapq.heappush(pending, (record.timestamp, next(seq), record))
+                # Nothing older than this can still follow
+                while pending[0][0] < record.timestamp - MAX_SKEW_S:
+                    yield from self._in_range(heapq.heappop(pending)[2], start, end)
+        while pending:
+            yield from self._in_range(heapq.heappop(pending)[2], start, end)
+
+    @staticmethod
+    def _in_range(record: Record, start, end):
+        if (start is None or record.timestamp >= start) and (end is None or record.timestamp <= end):
+            yield record
+
+    def _seek_offset(self, path: str, start: float) -> int:
+        """Offset from which every record with timestamp >= start + MAX_SKEW_S follows.
+
+        Index entries are out of order just like the records, so this
+        searches their running maximum: nothing before an entry is more
+        than MAX_SKEW_S newer than the newest entry up to it.
+        """
+        try:
+            index = np.fromfile(path + INDEX_SUFFIX, dtype=INDEX_DTYPE)
+        except (OSError, ValueError):
+            return _FILE_HEADER.size
+        # Last entry strictly before start, so ties at start are not skipped.
+        i = np.searchsorted(np.maximum.accumulate(index["timestamp"]), start, side="left") - 1
+        return int(index["offset"][i]) if i >= 0 else _FILE_HEADER.size
+
+    def _file_records(self, path: str, start, end, kinds):
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size <= _FILE_HEADER.size:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                offset = _FILE_HEADER.size if start is None else self._seek_offset(path, start)
+                size = len(data)
+                while offset + _RECORD_HEADER.size <= size:
+                    timestamp, kind, length = _RECORD_HEADER.unpack_from(data, offset)
+                    body = offset + _RECORD_HEADER.size
+                    if body + length > size:
+                        break  # Truncated tail of a file still being written
+                    offset = body + length
+                    if start is not None and timestamp < start:
+                        continue
+                    if end is not None and timestamp > end:
+                        return
+                    if kinds is None or kind in kinds:
+                        yield Record(timestamp, kind, *self._decode(kind, data[body:offset]))
+                    if kind == MESSAGE:
+                        yield from self._derive(timestamp, data[body:offset], kinds)
+
+    def _derive(self, timestamp: float, payload, kinds):
+        """STATUS and status.* SAMPLE records for a TX status message."""
+        if kinds is not None and STATUS not in kinds and SAMPLE not in kinds:
+            return
+        descriptor, message = self._decode(MESSAGE, payload)
+        if descriptor != "TX":
+            return
+        record = self._status_decoder.decode(message)
+        if record is None:
+            return
+        if kinds is None or STATUS in kinds:
+            yield Record(timestamp, STATUS, "TX", record)
+        if kinds is None or SAMPLE in kinds:
+            for channel, value in record.samples():
+                yield Record(timestamp, SAMPLE, channel, value)
+
+    @staticmethod
+    def _decode(kind: int, payload: bytes):
+        if kind == MESSAGE:
+            descriptor, offset = _read_short_str(payload, 0)
+            return descriptor, payload[offset:].decode("utf-8", "replace")
+        if kind == SAMPLE:
+            (value,) = _SAMPLE.unpack_from(payload, 0)
+            return payload[_SAMPLE.size:].decode("utf-8", "replace"), value
+        return "", bytes(payload)
@@ -0,0 +1,53 @@
+import threading
+
+from lifu_solution_cache import SolutionCache
+
+
+class DeviceShadow:
+    """Digests of the settings last written to each device link.
+
+    Lets the connector skip writes the device already holds. Items are
+    keyed by (link, name), e.g. ("TX", "solution") or ("HV", "voltage").
+    An item is only recorded after a successful write and is forgotten
+    before a write is attempted, so a failed or interrupted write never
+    leaves a stale match behind. Links are forgotten wholesale when they
+    disconnect or are reset.
+    """
+
+    def __init__(self):
+        self._items = {}  # (link, name) -> digest
+        self._lock = threading.Lock()
+        self.skipped = 0
+        self.sent = 0
+
+    @staticmethod
+    def digest(value) -> str:
+        """Hash JSON-serializable settings."""
+        return SolutionCache.make_key(value)
+
+    def holds(self, link: str, name: str, digest: str) -> bool:
+        """Whether the device already holds digest for this item; counts skips."""
+        with self._lock:
+            same = self._items.get((link, name)) == digest
+            if same:
+                self.skipped += 1
+            return same
+
+    def current(self, link: str, name: str):
+        """Digest the device holds for this item, or None; not counted as a skip."""
+        with self._lock:
+            return self._items.get((link, name))
+
+    def record(self, link: str, name: str, digest: str):
+        with self._lock:
+            self._items[(link, name)] = digest
+            self.sent += 1
+
+    def forget(self, link: str, name: str = None):
+        """Drop one item, or everything known about link."""
+        with self._lock:
+            if name is not None:
+                self._items.pop((link, name), None)
+            else:
+                for key in [key for key in self._items if key[0] == link]:
+                    del self._items[key]
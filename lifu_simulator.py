@@ -0,0 +1,372 @@
+import asyncio
+import copy
+import logging
+import random
+import threading
+import time
+
+from openlifu.io.LIFUSignal import LIFUSignal
+from openlifu.io.LIFUTXDevice import TRANSMITTERS_PER_MODULE, TxDeviceRegisters
+
+logger = logging.getLogger("LIFUConnector")
+
+
+class SimulatedLink:
+    """Latency model shared by the simulated devices on one UART.
+
+    Every command holds the link for latency +/- jitter seconds, and
+    commands on the same link are serialized like on the real UART.
+    """
+
+    def __init__(self, descriptor: str, latency: float = 0.002, jitter: float = 0.0005, seed=None):
+        self.descriptor = descriptor
+        self.latency = latency
+        self.jitter = jitter
+        self.connected = False
+        self.commands = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def transact(self):
+        with self._lock:
+            if not self.connected:
+                raise ValueError(f"{self.descriptor} Device not connected")
+            self.commands += 1
+            delay = self.latency + self._rng.uniform(-self.jitter, self.jitter)
+            if delay > 0:
+                time.sleep(delay)
+
+
+class SimulatedHVController:
+    """Stand-in for openlifu's HVController."""
+
+    def __init__(self, link: SimulatedLink):
+        self.link = link
+        self.hv_on = False
+        self.v12_on = False
+        self.voltage = 0.0
+        self.rgb = 0
+        self.fans = {}
+
+    def is_connected(self):
+        return self.link.connected
+
+    def ping(self):
+        self.link.transact()
+        return True
+
+    def echo(self, echo_data=None):
+        self.link.transact()
+        return echo_data, len(echo_data or b"")
+
+    def toggle_led(self):
+        self.link.transact()
+        return True
+
+    def get_version(self):
+        self.link.transact()
+        return "v0.0.0-sim"
+
+    def get_hardware_id(self):
+        self.link.transact()
+        return "53494d2d48562d3030303031"
+
+    def get_temperature1(self):
+        self.link.transact()
+        return round(32.0 + random.uniform(-0.5, 0.5), 2)
+
+    def get_temperature2(self):
+        self.link.transact()
+        return round(30.0 + random.uniform(-0.5, 0.5), 2)
+
+    def get_hv_status(self):
+        self.link.transact()
+        return self.hv_on
+
+    def get_12v_status(self):
+        self.link.transact()
+        return self.v12_on
+
+    def turn_hv_on(self):
+        self.link.transact()
+        self.hv_on = True
+        return True
+
+    def turn_hv_off(self):
+        self.link.transact()
+        self.hv_on = False
+        return True
+
+    def turn_12v_on(self):
+        self.link.transact()
+        self.v12_on = True
+        return True
+
+    def turn_12v_off(self):
+        self.link.transact()
+        self.v12_on = False
+        return True
+
+    def set_voltage(self, voltage):
+        self.link.transact()
+        self.voltage = float(voltage)
+        return True
+
+    def get_rgb_led(self):
+        self.link.transact()
+        return self.rgb
+
+    def set_rgb_led(self, rgb_state):
+        self.link.transact()
+        self.rgb = rgb_state
+        return rgb_state
+
+    def set_fan_speed(self, fan_id=0, fan_speed=50):
+        self.link.transact()
+        self.fans[fan_id] = fan_speed
+        return fan_speed
+
+    def get_vmon_values(self):
+        self.link.transact()
+        return [{"channel": channel, "raw_adc": 0, "voltage": 0.0,
+                 "converted_voltage": round(self.voltage if self.hv_on else 0.0, 3)}
+                for channel in range(8)]
+
+    def soft_reset(self):
+        self.link.transact()
+        return True
+
+
+class SimulatedTxDevice:
+    """Stand-in for openlifu's TxDevice."""
+
+    def __init__(self, link: SimulatedLink, num_modules: int = 1):
+        self.link = link
+        self.num_modules = num_modules
+        self.async_enabled = False
+        self.solution = None
+        self.module_invert = False
+        self.tx_registers = None  # Host-side register model, as on TxDevice
+        self.registers = {}  # (transmitter, address) -> value written
+        self.registers_written = 0
+        self.trigger = {
+            "TriggerMode": 1,
+            "TriggerFrequencyHz": 10,
+            "TriggerPulseCount": 0,
+            "TriggerPulseWidthUsec": 20000,
+            "TriggerPulseTrainInterval": 0,
+            "TriggerPulseTrainCount": 0,
+            "TriggerStatus": "STOPPED",
+        }
+
+    @property
+    def running(self):
+        return self.trigger["TriggerStatus"] == "RUNNING"
+
+    def is_connected(self):
+        return self.link.connected
+
+    def ping(self):
+        self.link.transact()
+        return True
+
+    def echo(self, echo_data=None):
+        self.link.transact()
+        return echo_data, len(echo_data or b"")
+
+    def toggle_led(self):
+        self.link.transact()
+        return True
+
+    def get_version(self, module=0):
+        self.link.transact()
+        return "v0.0.0-sim"
+
+    def get_hardware_id(self, module=0):
+        self.link.transact()
+        return f"53494d2d54582d{module:010x}"
+
+    def get_temperature(self, module=0):
+        self.link.transact()
+        return round(38.0 + random.uniform(-0.5, 0.5), 2)
+
+    def get_ambient_temperature(self, module=0):
+        self.link.transact()
+        return round(25.0 + random.uniform(-0.5, 0.5), 2)
+
+    def get_tx_module_count(self):
+        self.link.transact()
+        return self.num_modules
+
+    def get_trigger_json(self):
+        self.link.transact()
+        return copy.deepcopy(self.trigger)
+
+    def set_trigger_json(self, data=None):
+        self.link.transact()
+        self.trigger.update(data or {})
+        return copy.deepcopy(self.trigger)
+
+    def start_trigger(self):
+        self.link.transact()
+        self.trigger["TriggerStatus"] = "RUNNING"
+        return True
+
+    def stop_trigger(self):
+        self.link.transact()
+        self.trigger["TriggerStatus"] = "STOPPED"
+        return True
+
+    def set_trigger(self, pulse_interval, pulse_count=1, pulse_width=20000, pulse_train_interval=0.0,
+                    pulse_train_count=1, trigger_mode="sequence", profile_index=0, profile_increment=True):
+        modes = {"sequence": 1, "continuous": 0, "single": 2}
+        return self.set_trigger_json({
+            "TriggerFrequencyHz": 1 / pulse_interval,
+            "TriggerPulseCount": pulse_count,
+            "TriggerPulseWidthUsec": pulse_width,
+            "TriggerPulseTrainInterval": pulse_train_interval * 1000000,
+            "TriggerPulseTrainCount": pulse_train_count,
+            "TriggerMode": modes[trigger_mode.lower()],
+        })
+
+    def enum_tx7332_devices(self, num_devices=None):
+        self.link.transact()
+        detected = self.num_modules * TRANSMITTERS_PER_MODULE
+        if num_devices is not None and num_devices != detected:
+            raise ValueError(f"Expected {num_devices} devices, but detected {detected} devices")
+        self.tx_registers = TxDeviceRegisters(num_transmitters=detected, module_invert=self.module_invert)
+        return detected
+
+    def write_block(self, identifier, start_address, reg_values):
+        self.link.transact()
+        self.registers_written += len(reg_values)
+        for offset, value in enumerate(reg_values):
+            self.registers[(identifier, start_address + offset)] = value
+        return True
+
+    def write_register(self, identifier, address, value):
+        return self.write_block(identifier, address, [value])
+
+    def apply_all_registers(self):
+        registers = self.tx_registers.get_registers(pack=True, pack_single=True)
+        for identifier, blocks in enumerate(registers):
+            for address, values in blocks.items():
+                if not self.write_block(identifier, address, values):
+                    return False
+        return True
+
+    def async_mode(self, enable=None):
+        self.link.transact()
+        if enable is not None:
+            self.async_enabled = bool(enable)
+        return self.async_enabled
+
+    def soft_reset(self):
+        self.link.transact()
+        return True
+
+
+class SimulatedLIFUInterface:
+    """Hardware-free LIFUInterface for load testing the connector.
+
+    Mirrors the parts of LIFUInterface that LIFUConnector uses. Device calls
+    block for the configured latency and jitter. start_monitoring "plugs
+    in" both links. While the trigger runs, or always when
+    stream_when_stopped is set, STATUS lines are emitted through
+    signal_data_received at status_rate per second from a background
+    thread, like the UART read thread does.
+    """
+
+    def __init__(self, num_modules: int = 1, latency: float = 0.002, jitter: float = 0.0005,
+                 status_rate: float = 10.0, stream_when_stopped: bool = False, seed=None):
+        self.signal_connect = LIFUSignal()
+        self.signal_disconnect = LIFUSignal()
+        self.signal_data_received = LIFUSignal()
+        self._tx_link = SimulatedLink("TX", latency, jitter, seed)
+        self._hv_link = SimulatedLink("HV", latency, jitter, None if seed is None else seed + 1)
+        self.txdevice = SimulatedTxDevice(self._tx_link, num_modules)
+        self.hvcontroller = SimulatedHVController(self._hv_link)
+        self.status_rate = status_rate
+        self.stream_when_stopped = stream_when_stopped
+        self.messages_sent = 0
+        self._stop = threading.Event()
+        self._stream_thread = None
+        self._monitoring = False
+
+    @staticmethod
+    def get_sdk_version():
+        return "simulated"
+
+    def connect(self):
+        """Bring both links up and start the status stream."""
+        for link in (self._tx_link, self._hv_link):
+            if not link.connected:
+                link.connected = True
+                self.signal_connect.emit(link.descriptor, f"SIM-{link.descriptor}")
+        if self._stream_thread is None:
+            self._stop.clear()
+            self._stream_thread = threading.Thread(target=self._stream, name="SIM-TX-status", daemon=True)
+            self._stream_thread.start()
+
+    def disconnect(self):
+        """Stop the status stream and drop both links."""
+        self._stop.set()
+        if self._stream_thread is not None:
+            self._stream_thread.join()
+            self._stream_thread = None
+        for link in (self._tx_link, self._hv_link):
+            if link.connected:
+                link.connected = False
+                self.signal_disconnect.emit(link.descriptor, f"SIM-{link.descriptor}")
+
+    async def start_monitoring(self, interval: int = 1):
+        self._monitoring = True
+        self.connect()
+        while self._monitoring:
+            await asyncio.sleep(interval)
+
+    def stop_monitoring(self):
+        self._monitoring = False
+        self.disconnect()
+
+    def is_device_connected(self):
+        return self._tx_link.connected, self._hv_link.connected
+
+    def set_solution(self, solution, profile_index=1, profile_increment=True, trigger_mode="sequence"):
+        self._tx_link.transact()
+        self.txdevice.solution = solution
+        voltage = solution["voltage"] if isinstance(solution, dict) else solution.voltage
+        self.hvcontroller.set_voltage(voltage)  # Like openlifu: no result, failures raise
+
+    def stop_sonication(self):
+        stopped = self.txdevice.stop_trigger()
+        hv_off = self.hvcontroller.turn_hv_off()
+        self.txdevice.async_mode(False)
+        return stopped and hv_off
+
+    def status_line(self, index: int) -> str:
+        trigger = self.txdevice.trigger
+        total = max(int(trigger.get("TriggerPulseTrainCount") or 0), 1)
+        return (f"STATUS:{trigger['TriggerStatus']},MODE:SEQUENCE,"
+                f"PULSE_TRAIN:[{index % total}/{total}],PULSE:[{index % 10}/10],"
+                f"TEMP_TX:{38.0 + (index % 7) * 0.1:.1f},TEMP_AMBIENT:{25.0 + (index % 5) * 0.1:.1f}")
+
+    def _stream(self):
+        # Pace by elapsed time rather than one sleep per line, so high rates
+        # are emitted in small bursts instead of being capped by timer
+        # resolution.
+        start = time.perf_counter()
+        sent = 0
+        while not self._stop.is_set():
+            rate = self.status_rate
+            if rate <= 0 or not (self.stream_when_stopped or self.txdevice.running):
+                start, sent = time.perf_counter(), 0
+                self._stop.wait(0.05)
+                continue
+            due = int((time.perf_counter() - start) * rate) - sent
+            for _ in range(due):
+                self.signal_data_received.emit("TX", self.status_line(self.messages_sent))
+                self.messages_sent += 1
+            sent += max(due, 0)
+            next_due = start + (sent + 1) / rate
+            self._stop.wait(max(0.0, min(next_due - time.perf_counter(), 0.05)))
@@ -0,0 +1,143 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from openlifu.plan.solution import Solution
+
+logger = logging.getLogger("LIFUConnector")
+
+
+class SolutionCache:
+    """Content-addressed store of built solutions, kept on local disk.
+
+    Keys are hashes of the configuration parameters, values are the solution
+    JSON. A hit returns the solution as the dict LIFUInterface.set_solution
+    accepts, so neither the openlifu objects nor the delays are rebuilt.
+    Files are evicted least-recently-used once max_entries is exceeded; file
+    mtimes record use, so recency survives restarts.
+    """
+
+    def __init__(self, directory: str, max_entries: int = 256, memory_entries: int = 32):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()  # key -> solution dict
+        self._index = None  # key -> last use, loaded from disk on first access
+        self._clock = 0.0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(params: dict) -> str:
+        """Hash JSON-serializable configuration parameters into a cache key."""
+        blob = json.dumps(params, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _load_index(self):
+        if self._index is not None:
+            return
+        self._index = {}
+        if os.path.isdir(self.directory):
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(".json"):
+                    self._index[entry.name[:-5]] = entry.stat().st_mtime
+            self._clock = max(self._index.values(), default=0.0)
+
+    @staticmethod
+    def _to_device_dict(solution_json: str) -> dict:
+        solution = json.loads(solution_json)
+        solution["delays"] = np.array(solution["delays"], ndmin=2)
+        solution["apodizations"] = np.array(solution["apodizations"], ndmin=2)
+        return solution
+
+    def _remember(self, key: str, solution: dict):
+        self._memory[key] = solution
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str):
+        """Return the cached solution dict for key, or None."""
+        with self._lock:
+            self._load_index()
+            solution = self._memory.get(key)
+            if solution is None and key in self._index:
+                try:
+                    with open(self._path(key), encoding="utf-8") as f:
+                        solution = self._to_device_dict(f.read())
+                except (OSError, ValueError, KeyError) as e:
+                    logger.error(f"Dropping unreadable cached solution {key}: {e}")
+                    self._discard(key)
+                    solution = None
+
+            if solution is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._remember(key, solution)
+            self._touch(key)
+            return solution
+
+    def put(self, key: str, solution: "Solution") -> dict:
+        """Store solution under key and return its set_solution dict."""
+        solution_json = solution.to_json(include_simulation_data=False, compact=True)
+        device_dict = self._to_device_dict(solution_json)
+        with self._lock:
+            self._load_index()
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                tmp_path = self._path(key) + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(solution_json)
+                os.replace(tmp_path, self._path(key))
+                self._touch(key)
+                self._evict()
+            except OSError as e:
+                # The disk copy is only an optimization; keep going without it.
+                logger.error(f"Failed to write cached solution: {e}")
+            self._remember(key, device_dict)
+        return device_dict
+
+    def clear(self):
+        """Remove every cached solution from memory and disk."""
+        with self._lock:
+            self._load_index()
+            for key in list(self._index):
+                self._discard(key)
+            self._memory.clear()
+
+    def _touch(self, key: str):
+        # Strictly increasing, so back-to-back uses never tie on a coarse clock.
+        self._clock = max(time.time(), self._clock + 1e-3)
+        try:
+            os.utime(self._path(key), (self._clock, self._clock))
+            self._index[key] = self._clock
+        except OSError:
+            self._index.pop(key, None)
+
+    def _discard(self, key: str):
+        self._index.pop(key, None)
+        self._memory.pop(key, None)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _evict(self):
+        excess = len(self._index) - self.max_entries
+        if excess > 0:
+            for key in sorted(self._index, key=self._index.get)[:excess]:
+                self._discard(key)
@@ -0,0 +1,44 @@
+import logging
+import time
+
+logger = logging.getLogger("LIFUConnector")
+
+# Budget for importing lifu_connector in a fresh interpreter; heavy
+# dependencies (openlifu, matplotlib, scipy) must stay out of this path.
+COLD_IMPORT_BUDGET_S = 1.0
+# Budget from process start to the first rendered frame (--startup-profile
+# "first frame"); the device stack imports after it, in the background.
+FIRST_FRAME_BUDGET_S = 3.0
+
+
+class StartupProfile:
+    """Wall-clock timings of the startup phases, for --startup-profile.
+
+    mark() closes the current phase; phases are sequential on the UI thread
+    except ones recorded with since=, which started at an earlier mark
+    (e.g. the device stack importing in the background).
+    """
+
+    def __init__(self, start: float = None):
+        self.start = time.perf_counter() if start is None else start
+        self._last = self.start
+        self._marks = {}  # phase -> perf_counter at its end
+        self.phases = []  # (phase, seconds, seconds since start)
+
+    def mark(self, phase: str, since: str = None):
+        now = time.perf_counter()
+        begin = self._marks[since] if since is not None else self._last
+        self.phases.append((phase, now - begin, now - self.start))
+        self._marks[phase] = now
+        if since is None:
+            self._last = now
+
+    def report(self) -> str:
+        width = max((len(phase) for phase, _, _ in self.phases), default=0)
+        lines = ["Startup profile (phase, duration, elapsed):"]
+        lines += [f"  {phase:<{width}}  {seconds * 1000:8.1f} ms  {elapsed * 1000:8.1f} ms"
+                  for phase, seconds, elapsed in self.phases]
+        return "\n".join(lines)
+
+    def log(self):
+        logger.info(self.report())
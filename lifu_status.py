@@ -0,0 +1,89 @@
+import re
+from typing import NamedTuple, Optional
+
+
+class StatusRecord(NamedTuple):
+    """One decoded TX status message."""
+    status: str
+    mode: str
+    pulse_train_current: int
+    pulse_train_total: int
+    pulse_current: Optional[int]  # None when the firmware omits PULSE
+    pulse_total: Optional[int]
+    temp_tx: float
+    temp_ambient: float
+
+    @property
+    def pulse_train_percent(self) -> float:
+        if self.pulse_train_total > 0:
+            return self.pulse_train_current / self.pulse_train_total * 100
+        return 0
+
+    @property
+    def pulse_percent(self) -> Optional[float]:
+        if self.pulse_total is None:
+            return None
+        if self.pulse_total > 0:
+            return self.pulse_current / self.pulse_total * 100
+        return 0
+
+    def samples(self) -> tuple:
+        """(channel, value) telemetry pairs derived from this status."""
+        return (
+            ("status.temp_tx", self.temp_tx),
+            ("status.temp_ambient", self.temp_ambient),
+            ("status.pulse_train_percent", self.pulse_train_percent),
+        )
+
+    def to_dict(self) -> dict:
+        """Return the dict layout used by LIFUConnector.parse_status_string."""
+        return {
+            "status": self.status,
+            "mode": self.mode,
+            "pulse_train_percent": self.pulse_train_percent,
+            "pulse_percent": self.pulse_percent,
+            "temp_tx": self.temp_tx,
+            "temp_ambient": self.temp_ambient,
+        }
+
+
+class StatusDecoder:
+    """Decode the TX async status stream in a single regex pass.
+
+    The PULSE field is optional in the pattern, so messages with and without
+    it are handled by the same match instead of trying two patterns.
+    """
+
+    PREFIX = "STATUS:"
+    PATTERN = re.compile(
+        r"\s*STATUS:(\w+),"
+        r"MODE:(\w+),"
+        r"PULSE_TRAIN:\[(\d+)/(\d+)\],"
+        r"(?:PULSE:\[(\d+)/(\d+)\],)?"
+        r"TEMP_TX:([0-9.]+),"
+        r"TEMP_AMBIENT:([0-9.]+)"
+    )
+
+    def decode(self, message: str) -> Optional[StatusRecord]:
+        """Return a StatusRecord, or None if message is not a status line."""
+        if self.PREFIX not in message:
+            return None
+        match = self.PATTERN.match(message)
+        if match is None:
+            return None
+
+        status, mode, pt_current, pt_total, p_current, p_total, temp_tx, temp_ambient = match.groups()
+        try:
+            return StatusRecord(
+                status,
+                mode,
+                int(pt_current),
+                int(pt_total),
+                None if p_current is None else int(p_current),
+                None if p_total is None else int(p_total),
+                float(temp_tx),
+                float(temp_ambient),
+            )
+        except ValueError:
+            # e.g. a temperature like "1.2.3" slips through [0-9.]+
+            return None
@@ -0,0 +1,112 @@
+import hashlib
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from openlifu.xdc import Transducer
+
+logger = logging.getLogger("LIFUConnector")
+
+SPEED_OF_SOUND = 1500  # Speed of sound in tissue, m/s
+DELAY_CHUNK_BYTES = 64 * 1024 * 1024  # Working-set cap for compute_focus_delays
+
+
+def compute_focus_delays(positions, foci, speed_of_sound=SPEED_OF_SOUND, chunk_bytes=DELAY_CHUNK_BYTES):
+    """Compute per-element delays and apodizations for many foci at once.
+
+    Args:
+        positions: (elements, 3) element positions in mm.
+        foci: (N, 3) focus positions in mm (a single (3,) focus is accepted).
+        speed_of_sound: Speed of sound in m/s.
+        chunk_bytes: Upper bound on the temporary arrays per chunk of foci.
+
+    Returns:
+        (delays, apodizations), both (N, elements). Delays are in seconds and
+        relative to the farthest element of each focus, as in
+        configure_transmitter; apodizations are all ones.
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    foci = np.atleast_2d(np.asarray(foci, dtype=np.float64))
+    if foci.ndim != 2 or foci.shape[1] != 3:
+        raise ValueError(f"foci must have shape (N, 3), got {foci.shape}")
+
+    num_foci, num_elements = foci.shape[0], positions.shape[0]
+    delays = np.empty((num_foci, num_elements))
+    # |f - p|^2 = |f|^2 + |p|^2 - 2 f.p keeps each chunk at (chunk, elements)
+    # instead of materializing the (chunk, elements, 3) difference array.
+    pos_sq = np.einsum("ij,ij->i", positions, positions)
+    chunk = max(1, chunk_bytes // (2 * num_elements * delays.itemsize))
+
+    for start in range(0, num_foci, chunk):
+        block = foci[start:start + chunk]
+        dist_sq = np.einsum("ij,ij->i", block, block)[:, None] + pos_sq[None, :]
+        dist_sq -= 2.0 * (block @ positions.T)
+        np.maximum(dist_sq, 0.0, out=dist_sq)
+        tof = np.sqrt(dist_sq, out=dist_sq)
+        tof *= 1e-3 / speed_of_sound
+        delays[start:start + chunk] = tof.max(axis=1, keepdims=True) - tof
+
+    apodizations = np.ones((num_foci, num_elements))
+    return delays, apodizations
+
+
+class CachedTransducer(NamedTuple):
+    """A loaded pinmap together with its element positions."""
+    transducer: "Transducer"
+    positions: np.ndarray  # (elements, 3) in mm, C-contiguous and read-only
+    path: str
+    digest: str  # sha256 of the pinmap file, for keying derived results
+    axes: np.ndarray  # (elements, 3, 3) width, length and normal unit vectors
+    sizes: np.ndarray  # (elements, 2) width and length in mm
+
+
+class TransducerCache:
+    """Keep parsed pinmap_<n>x.json transducers in memory.
+
+    Entries are keyed on module count and revalidated against the file's
+    mtime and size, so an edited pinmap is picked up without a restart while
+    repeated configures skip the JSON parse and position rebuild entirely.
+    """
+
+    def __init__(self, directory: str = os.curdir):
+        self.directory = directory
+        self._entries = {}  # num_modules -> (file stamp, CachedTransducer)
+        self._lock = threading.Lock()
+
+    def path_for(self, num_modules: int) -> str:
+        return os.path.join(self.directory, f"pinmap_{num_modules}x.json")
+
+    def get(self, num_modules: int) -> CachedTransducer:
+        """Return the transducer for num_modules, loading it on first use."""
+        path = self.path_for(num_modules)
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(num_modules)
+            if entry is not None and entry[0] == stamp:
+                return entry[1]
+
+            with open(path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            from openlifu.xdc.util import load_transducer_from_file  # Deferred: openlifu is slow to import
+            transducer = load_transducer_from_file(path)
+            positions = np.ascontiguousarray(transducer.get_positions(units="mm"), dtype=np.float64)
+            # Element matrix columns are the local width, length and normal axes.
+            axes = np.stack([el.get_matrix(units="mm")[:3, :3].T for el in transducer.elements])
+            sizes = np.array([el.get_size(units="mm") for el in transducer.elements], dtype=np.float64)
+            for array in (positions, axes, sizes):
+                array.setflags(write=False)
+            cached = CachedTransducer(transducer, positions, path, digest, axes, sizes)
+            self._entries[num_modules] = (stamp, cached)
+            logger.info(f"{num_modules}x config file loaded")
+            return cached
+
+    def invalidate(self):
+        """Drop every cached transducer, e.g. after the module count changed."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,226 @@
+import functools
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+logger = logging.getLogger("LIFUConnector")
+
+# Job priorities; lower runs first, FIFO within a priority.
+SAFETY = 0  # Stops that must not wait behind other commands
+COMMAND = 1  # User commands
+POLL = 2  # Background telemetry
+PRIORITY_NAMES = {SAFETY: "safety", COMMAND: "command", POLL: "poll"}
+
+DEFAULT_MAX_DEPTH = 64  # Queued non-safety jobs per link
+DEFAULT_MAX_WAIT = {SAFETY: None, COMMAND: 30.0, POLL: None}  # Seconds a job may sit queued
+
+_running = threading.local()  # .priority of the job running on this thread
+
+
+class QueueFull(RuntimeError):
+    """A link already has max_depth jobs queued."""
+
+
+class Voided(RuntimeError):
+    """A queued job was dropped because a safety command came in after it."""
+
+
+class DeviceWorker:
+    """Single-threaded prioritized queue that owns all traffic for one device link.
+
+    Each UART ("TX" or "HV") gets its own worker so commands on one link are
+    serialized while the two links still run concurrently, and neither blocks
+    the Qt/asyncio event loop. Queued jobs run by priority: a SAFETY job
+    waits for at most the one command already on the wire. Jobs queued
+    longer than their max_wait fail with TimeoutError without being sent,
+    and non-safety jobs beyond max_depth are rejected with QueueFull.
+    Submitting a SAFETY job voids the voidable jobs (starts, HV on) still
+    queued, so a stop cannot be overtaken by the start it was meant to
+    stop; they fail with Voided.
+    Queue wait and run times are kept per priority (stats()).
+    """
+
+    def __init__(self, descriptor: str, max_depth: int = DEFAULT_MAX_DEPTH):
+        self.descriptor = descriptor
+        self.max_depth = max_depth
+        self._queue = []  # heap of (priority, seq, future, fn, args, kwargs, queued at, max_wait, voidable)
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._stats = {priority: {"submitted": 0, "completed": 0, "failed": 0, "expired": 0, "rejected": 0,
+                                  "voided": 0, "total_wait": 0.0, "max_wait": 0.0, "max_run": 0.0}
+                       for priority in PRIORITY_NAMES}
+        self._thread = threading.Thread(target=self._run, name=f"LIFU-{descriptor}", daemon=True)
+        self._thread.start()
+
+    def in_worker(self) -> bool:
+        """Return True when called from this worker's own thread."""
+        return threading.get_ident() == self._thread.ident
+
+    @property
+    def closed(self) -> bool:
+        """True once shutdown() was called."""
+        return self._closed
+
+    def submit(self, fn, *args, priority=None, max_wait=None, voidable=False, **kwargs) -> Future:
+        """Queue fn on the link; runs inline if already on the worker thread.
+
+        priority defaults to that of the job running on the calling thread,
+        so a TX job that calls into HV keeps its priority there, else
+        COMMAND. max_wait defaults to DEFAULT_MAX_WAIT for the priority.
+        A voidable job is dropped by any SAFETY job submitted before it runs.
+        """
+        if self.in_worker():
+            future = Future()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        if priority is None:
+            priority = getattr(_running, "priority", COMMAND)
+        if max_wait is None:
+            max_wait = DEFAULT_MAX_WAIT[priority]
+        if priority == SAFETY:
+            self.void()
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError(f"{self.descriptor} worker is shut down")
+            stats = self._stats[priority]
+            stats["submitted"] += 1
+            if priority != SAFETY and sum(job[0] != SAFETY for job in self._queue) >= self.max_depth:
+                stats["rejected"] += 1
+                future.set_exception(QueueFull(f"{self.descriptor} queue is full ({self.max_depth} jobs)"))
+                logger.warning(f"{self.descriptor} queue full, rejected {getattr(fn, '__name__', fn)}")
+                return future
+            heapq.heappush(self._queue, (priority, next(self._seq), future, fn, args, kwargs,
+                                         time.monotonic(), max_wait, voidable))
+            self._cond.notify()
+        future.add_done_callback(self._log_failure)
+        return future
+
+    def call(self, fn, *args, timeout=None, **kwargs):
+        """Run fn on the link and wait for its result.
+
+        Only meant for use from another worker thread (e.g. a TX job that has
+        to switch HV on first); never call this from the GUI thread.
+        """
+        return self.submit(fn, *args, **kwargs).result(timeout=timeout)
+
+    def void(self) -> int:
+        """Fail the queued voidable jobs with Voided; returns how many there were."""
+        with self._cond:
+            voided = [job for job in self._queue if job[8]]
+            if not voided:
+                return 0
+            self._queue = [job for job in self._queue if not job[8]]
+            heapq.heapify(self._queue)
+            for job in voided:
+                self._stats[job[0]]["voided"] += 1
+        for job in voided:
+            job[2].set_exception(Voided(f"{getattr(job[3], '__name__', job[3])} on {self.descriptor} "
+                                        "was voided by a safety command"))
+        return len(voided)
+
+    def stats(self) -> dict:
+        """Per-priority counters and queue wait / run times (seconds)."""
+        with self._cond:
+            result = {"depth": len(self._queue), "max_depth": self.max_depth}
+            for priority, name in PRIORITY_NAMES.items():
+                stats = dict(self._stats[priority])
+                done = stats["completed"] + stats["failed"]
+                stats["mean_wait"] = stats.pop("total_wait") / done if done else 0.0
+                result[name] = stats
+            return result
+
+    def shutdown(self, wait: bool = False):
+        """Stop accepting work and drop anything still queued."""
+        with self._cond:
+            self._closed = True
+            queued, self._queue = self._queue, []
+            self._cond.notify()
+        for job in queued:
+            job[2].cancel()
+        if wait and not self.in_worker():
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                priority, _, future, fn, args, kwargs, queued, max_wait, _ = heapq.heappop(self._queue)
+            if not future.set_running_or_notify_cancel():
+                continue
+            started = time.monotonic()
+            waited = started - queued
+            stats = self._stats[priority]
+            if max_wait is not None and waited > max_wait:
+                with self._cond:
+                    stats["expired"] += 1
+                future.set_exception(TimeoutError(
+                    f"{getattr(fn, '__name__', fn)} waited {waited:.1f}s on {self.descriptor}, limit {max_wait}s"))
+                continue
+            _running.priority = priority
+            try:
+                result, error = fn(*args, **kwargs), None
+            except Exception as e:
+                result, error = None, e
+            finally:
+                del _running.priority
+            with self._cond:
+                stats["failed" if error is not None else "completed"] += 1
+                stats["total_wait"] += waited
+                stats["max_wait"] = max(stats["max_wait"], waited)
+                stats["max_run"] = max(stats["max_run"], time.monotonic() - started)
+            # Done callbacks run here, outside the job's priority
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def _log_failure(self, future: Future):
+        if future.cancelled():
+            return
+        e = future.exception()
+        if isinstance(e, TimeoutError):
+            logger.warning(f"Dropped stale command on {self.descriptor}: {e}")
+        elif isinstance(e, Voided):
+            logger.warning(str(e))
+        elif e is not None:
+            logger.error(f"Unhandled error on {self.descriptor} worker: {e}", exc_info=e)
+
+
+def when_all(futures, callback):
+    """Call callback(results) once every future is done, without blocking.
+
+    Results keep the order of `futures`; a failed or cancelled future
+    contributes None. The callback runs on whichever thread finishes last.
+    """
+    futures = list(futures)
+    results = [None] * len(futures)
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    if not futures:
+        callback(results)
+        return
+
+    def done(index, future):
+        if not future.cancelled() and future.exception() is None:
+            results[index] = future.result()
+        with lock:
+            remaining[0] -= 1
+            finished = remaining[0] == 0
+        if finished:
+            callback(results)
+
+    for index, future in enumerate(futures):
+        future.add_done_callback(functools.partial(done, index))
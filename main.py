@@ -1,13 +1,15 @@
+import time
+_STARTED = time.perf_counter()  # Before the other imports, for --startup-profile
 import sys
 import os
+import importlib
 import asyncio
 import warnings
 import logging
 import argparse
-from PyQt6.QtGui import QGuiApplication, QIcon
-from PyQt6.QtQml import QQmlApplicationEngine
-from qasync import QEventLoop
 from lifu_connector import LIFUConnector
+from lifu_logging import configure_logging
+from lifu_startup import StartupProfile
 from pathlib import Path
 
 # run with lab supply
@@ -32,10 +34,123 @@ def parse_arguments():
         action="store_true",
         help="Enable HV test mode for LIFUConnector",
     )
+    parser.add_argument(
+        "--simulate",
+        action="store_true",
+        help="Run against a simulated device instead of the USB hardware",
+    )
+    parser.add_argument(
+        "--sim-status-rate",
+        type=float,
+        default=10.0,
+        help="STATUS messages per second from the simulated TX while triggered",
+    )
+    parser.add_argument(
+        "--sim-latency",
+        type=float,
+        default=0.002,
+        help="Per-command latency of the simulated device, in seconds",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Connector log level",
+    )
+    parser.add_argument(
+        "--status-log-rate",
+        type=float,
+        default=1.0,
+        help="Max 'Data received' log lines per second per device link (messages beyond it are counted, not logged)",
+    )
+    parser.add_argument(
+        "--log-rate",
+        type=float,
+        help="Max INFO/DEBUG log lines per second from any other call site (default: not limited)",
+    )
+    parser.add_argument(
+        "--headless",
+        metavar="SCRIPT",
+        help="Run the JSON automation script without the GUI (no QML engine) and exit",
+    )
+    parser.add_argument(
+        "--output-dir",
+        help="Directory for headless script outputs (default: the script's directory)",
+    )
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="Log how long each startup phase (imports, QML load, first frame, device stack) took",
+    )
     return parser.parse_args()
 
+def create_interface(args):
+    """The simulated interface when requested, else the USB hardware one."""
+    if args.simulate:
+        from lifu_simulator import SimulatedLIFUInterface
+        return SimulatedLIFUInterface(status_rate=args.sim_status_rate, latency=args.sim_latency)
+    from openlifu.io.LIFUInterface import LIFUInterface
+    return LIFUInterface(HV_test_mode=args.hv_test_mode, run_async=True)
+
+async def create_interface_async(args):
+    """create_interface(), importing the device stack on a worker thread.
+
+    openlifu takes seconds to import; the interface itself is still created
+    on the event loop thread, which LIFUUart expects.
+    """
+    module = "lifu_simulator" if args.simulate else "openlifu.io.LIFUInterface"
+    await asyncio.get_running_loop().run_in_executor(None, importlib.import_module, module)
+    return create_interface(args)
+
+def run_headless(args) -> int:
+    """Run an automation script on a plain Qt core loop; returns the exit code."""
+    from PyQt6.QtCore import QCoreApplication
+    from lifu_headless import ScriptRunner, load_script
+
+    app = QCoreApplication(sys.argv)
+    steps = load_script(args.headless)
+    lifu_connector = LIFUConnector(hv_test_mode=args.hv_test_mode, interface=create_interface(args))
+    output_dir = args.output_dir or os.path.dirname(os.path.abspath(args.headless))
+    runner = ScriptRunner(lifu_connector, steps, output_dir=output_dir)
+
+    async def pump_qt_events():
+        # A plain asyncio loop; Qt only needs to deliver queued signals and
+        # timers, so qasync (which loads QtWidgets) is not needed.
+        while True:
+            app.processEvents()
+            await asyncio.sleep(0.01)
+
+    async def session():
+        pump = asyncio.ensure_future(pump_qt_events())
+        monitor = asyncio.ensure_future(lifu_connector.start_monitoring())
+        try:
+            return await runner.run()
+        finally:
+            lifu_connector.stop_monitoring()
+            lifu_connector.stopRecording()
+            lifu_connector.shutdown_workers()
+            for task in (monitor, pump):
+                task.cancel()
+            await asyncio.gather(monitor, pump, return_exceptions=True)
+
+    return 0 if asyncio.run(session()) else 1
+
 def main():
+    profile = StartupProfile(start=_STARTED)
+    profile.mark("imports")
     args = parse_arguments()
+    log_listener = configure_logging(level=getattr(logging, args.log_level), status_rate=args.status_log_rate,
+                                     rate=args.log_rate)
+    if args.headless:
+        try:
+            sys.exit(run_headless(args))
+        finally:
+            log_listener.stop()
+
+    from PyQt6.QtGui import QGuiApplication, QIcon
+    from PyQt6.QtQml import QQmlApplicationEngine
+    from qasync import QEventLoop
+    profile.mark("Qt modules")
 
     os.environ["QT_QUICK_CONTROLS_STYLE"] = "Material"
     os.environ["QT_QUICK_CONTROLS_MATERIAL_THEME"] = "Dark"
@@ -43,12 +158,14 @@ def main():
 
     app = QGuiApplication(sys.argv)
     app.setWindowIcon(QIcon("assets/images/favicon.png"))
+    profile.mark("QGuiApplication")
 
     engine = QQmlApplicationEngine()
 
-    # Initialize LIFUConnector with hv_test_mode from command-line argument
-    lifu_connector = LIFUConnector(hv_test_mode=args.hv_test_mode)
-    
+    # The device interface is attached once the window is up (main_async)
+    lifu_connector = LIFUConnector(hv_test_mode=args.hv_test_mode, defer_interface=True)
+    profile.mark("connector")
+
     # Expose to QML
     engine.rootContext().setContextProperty("LIFUConnector", lifu_connector)
     engine.rootContext().setContextProperty("appVersion", "1.0.12")
@@ -58,12 +175,31 @@ def main():
     if not engine.rootObjects():
         print("Error: Failed to load QML file")
         sys.exit(-1)
+    profile.mark("QML load")
 
     loop = QEventLoop(app)
     asyncio.set_event_loop(loop)
+    pending_phases = {"first frame", "device stack"}
+
+    def startup_phase_done(phase, since):
+        profile.mark(phase, since=since)
+        pending_phases.discard(phase)
+        if args.startup_profile and not pending_phases:
+            profile.log()
+
+    window = engine.rootObjects()[0]
+
+    def on_first_frame():
+        window.frameSwapped.disconnect(on_first_frame)
+        startup_phase_done("first frame", "QML load")
+
+    window.frameSwapped.connect(on_first_frame)
 
     async def main_async():
-        """Start LIFU monitoring before event loop runs."""
+        """Attach the device interface and start LIFU monitoring."""
+        interface = await create_interface_async(args)
+        lifu_connector.attach_interface(interface)
+        startup_phase_done("device stack", "QML load")
         logger.info("Starting LIFU monitoring...")
         await lifu_connector.start_monitoring()
 
@@ -71,6 +207,8 @@ def main():
         """Ensure LIFUConnector stops monitoring before closing."""
         logger.info("Shutting down LIFU monitoring...")
         lifu_connector.stop_monitoring()
+        lifu_connector.shutdown_workers()
+        lifu_connector.stopRecording()
 
         pending_tasks = [t for t in asyncio.all_tasks() if not t.done()]
         if pending_tasks:
@@ -103,6 +241,7 @@ def main():
         logger.info("Application interrupted.")
     finally:
         loop.close()
+        log_listener.stop()  # Flush queued log records
 
 if __name__ == "__main__":
     main()
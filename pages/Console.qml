@@ -13,8 +13,9 @@ Rectangle {
     opacity: 0.95
 
     // Properties for dynamic data
-    property string firmwareVersion: "N/A"
-    property string deviceId: "N/A"
+    // Read once per connection by the connector; no query on page load
+    property string firmwareVersion: LIFUConnector.hvFirmwareVersion
+    property string deviceId: LIFUConnector.hvDeviceId
     property real temperature1: 0.0
     property real temperature2: 0.0
     property string rgbState: "Off" // Add property for RGB state
@@ -23,10 +24,7 @@ Rectangle {
 
     function updateStates() {
         console.log("Updating all states...")
-        LIFUConnector.queryHvInfo()
-        LIFUConnector.queryHvTemperature()
-        LIFUConnector.queryPowerStatus() // Query power status
-        LIFUConnector.queryRGBState() // Query RGB state
+        LIFUConnector.queryTelemetrySnapshot("HV") // Temperatures, power, RGB and voltages in one pass, HV link only
     }
 
     // Run refresh logic immediately on page load if HV is already connected
@@ -37,27 +35,15 @@ Rectangle {
         }
     }
 
-    Timer {
-        id: infoTimer
-        interval: 500   // Delay to ensure HV is stable before fetching info
-        running: false
-        onTriggered: {
-            console.log("Fetching Firmware Version and Device ID...")
-            updateStates()
-        }
-    }
-
     Connections {
         target: LIFUConnector
 
         // Handle HV Connected state
         function onHvConnectedChanged() {
             if (LIFUConnector.hvConnected) {
-                infoTimer.start()          // One-time info fetch
+                // The connector polls HV telemetry while connected
             } else {
                 console.log("HV Disconnected - Clearing Data...")
-                firmwareVersion = "N/A"
-                deviceId = "N/A"
                 temperature1 = 0.0
                 temperature2 = 0.0
                 rgbState = "Off" // Reset RGB state
@@ -70,12 +56,6 @@ Rectangle {
             }
         }
 
-        // Handle device info response
-        function onHvDeviceInfoReceived(fwVersion, devId) {
-            firmwareVersion = fwVersion
-            deviceId = devId
-        }
-
         // Handle temperature updates
         function onTemperatureHvUpdated(temp1, temp2) {
             temperature1 = temp1
@@ -118,6 +98,38 @@ Rectangle {
             rgbLedResult.text = stateText  // Display the state as text
             rgbLedDropdown.currentIndex = stateValue  // Sync ComboBox to received state
         }
+
+        // Handle results of commands run on the HV worker
+        function onCommandCompleted(target, command, success) {
+            if (target !== "HV")
+                return
+
+            switch (command) {
+            case "sendPingCommand":
+                pingResult.text = success ? "Ping SUCCESS" : "Ping FAILED"
+                pingResult.color = success ? "green" : "red"
+                break
+            case "sendLedToggleCommand":
+                toggleLedResult.text = success ? "LED Toggled" : "LED Toggle FAILED"
+                toggleLedResult.color = success ? "green" : "red"
+                break
+            case "sendEchoCommand":
+                echoResult.text = success ? "Echo SUCCESS" : "Echo FAILED"
+                echoResult.color = success ? "green" : "red"
+                break
+            case "setHVCommand":
+                if (success) {
+                    console.log("Voltage set successfully");
+                } else {
+                    console.log("Failed to set voltage. Resetting ComboBox to '0'");
+                    hvDropdown.currentIndex = 0; // Index 0 corresponds
+                }
+                break
+            case "setFanLevel":
+                console.log(success ? "Fan speed set successfully" : "Failed to set fan speed")
+                break
+            }
+        }
     }
 
     ColumnLayout {
@@ -219,13 +231,7 @@ Rectangle {
 
                                 onClicked: {                                  
                                     pingResult.text = ""
-                                    if(LIFUConnector.sendPingCommand("HV")){                                        
-                                        pingResult.text = "Ping SUCCESS"
-                                        pingResult.color = "green"
-                                    }else{
-                                        pingResult.text = "Ping FAILED"
-                                        pingResult.color = "red"
-                                    }
+                                    LIFUConnector.sendPingCommand("HV")
                                 }
                             }
                             Text {
@@ -274,15 +280,7 @@ Rectangle {
 
                                 onClicked: {
                                     toggleLedResult.text = ""
-                                    if(LIFUConnector.sendLedToggleCommand("HV"))
-                                    {
-                                        toggleLedResult.text = "LED Toggled"
-                                        toggleLedResult.color = "green"
-                                    }
-                                    else{
-                                        toggleLedResult.text = "LED Toggle FAILED"
-                                        toggleLedResult.color = "red"
-                                    }
+                                    LIFUConnector.sendLedToggleCommand("HV")
                                 }
                             }
                             Text {
@@ -328,15 +326,7 @@ Rectangle {
 
                                 onClicked: {
                                     echoResult.text = ""
-                                    if(LIFUConnector.sendEchoCommand("HV"))
-                                    {
-                                        echoResult.text = "Echo SUCCESS"
-                                        echoResult.color = "green"
-                                    }
-                                    else{
-                                        echoResult.text = "Echo FAILED"
-                                        echoResult.color = "red"
-                                    }
+                                    LIFUConnector.sendEchoCommand("HV")
                                 } 
                             }
                             Text {
@@ -455,13 +445,7 @@ Rectangle {
                                 onActivated: {
                                     var selectedValue = hvDropdown.currentText;
                                     if (selectedValue !== "0") {
-                                        var success = LIFUConnector.setHVCommand(selectedValue);
-                                        if (success) {
-                                            console.log("Voltage set successfully");
-                                        }  else {
-                                            console.log("Failed to set voltage. Resetting ComboBox to '0'");
-                                            hvDropdown.currentIndex = 0; // Index 0 corresponds
-                                        }
+                                        LIFUConnector.setHVCommand(selectedValue);
                                     }
                                     else {
                                         if(LIFUConnector.hvState == "On")
@@ -770,12 +754,7 @@ Rectangle {
                                         userIsSliding = false
                                         // Call the backend method with fan_id and speed
                                         let fanId = 1; // Example fan ID (adjust as needed) TOP
-                                        let success = LIFUConnector.setFanLevel(fanId, snappedValue);
-                                        if (success) {
-                                            console.log("Fan speed set successfully");
-                                        } else {
-                                            console.log("Failed to set fan speed");
-                                        }
+                                        LIFUConnector.setFanLevel(fanId, snappedValue);
                                     }
                                 }
                             }
@@ -817,12 +796,7 @@ Rectangle {
                                         userIsSliding = false
                                         // Call the backend method with fan_id and speed
                                         let fanId = 0; // Example fan ID (adjust as needed) Bottom
-                                        let success = LIFUConnector.setFanLevel(fanId, snappedValue);
-                                        if (success) {
-                                            console.log("Fan speed set successfully");
-                                        } else {
-                                            console.log("Failed to set fan speed");
-                                        }
+                                        LIFUConnector.setFanLevel(fanId, snappedValue);
                                     }
                                 }
                             }
@@ -893,7 +867,6 @@ Rectangle {
                                     enabled: parent.enabled  // MouseArea also disabled when button is disabled
                                     onClicked: {
                                         console.log("Manual Refresh Triggered")
-                                        LIFUConnector.queryHvInfo()
                                         LIFUConnector.queryHvTemperature()
                                     }
 
@@ -946,6 +919,50 @@ Rectangle {
                             }
                         }
 
+                        // Device message feed: bounded model, filled once per frame
+                        Text {
+                            text: "Device Messages (" + LIFUConnector.dataFeed.count + ")"
+                            color: "#BDC3C7"
+                            font.pixelSize: 14
+                        }
+
+                        ListView {
+                            id: feedView
+                            Layout.fillWidth: true
+                            Layout.fillHeight: true
+                            Layout.minimumHeight: 80
+                            clip: true
+                            reuseItems: true
+                            cacheBuffer: 0  // Rows change every frame under load; don't prebuild offscreen ones
+                            boundsBehavior: Flickable.StopAtBounds
+                            model: LIFUConnector.dataFeed
+
+                            // Follow new messages unless the user scrolled back
+                            property bool follow: true
+                            onMovementEnded: follow = atYEnd
+
+                            delegate: Text {
+                                width: ListView.view.width
+                                height: 16
+                                text: display
+                                textFormat: Text.PlainText
+                                color: "#BDC3C7"
+                                font.pixelSize: 11
+                                font.family: "monospace"
+                                elide: Text.ElideRight
+                            }
+
+                            ScrollBar.vertical: ScrollBar {}
+
+                            Connections {
+                                target: LIFUConnector.dataFeed
+                                function onBatchAppended(rows) {
+                                    if (feedView.follow)
+                                        feedView.positionViewAtEnd()
+                                }
+                            }
+                        }
+
                         // Soft Reset Button
                         Rectangle {
                             Layout.fillWidth: true
@@ -369,10 +369,6 @@ Rectangle {
             statusText.text = "Disconnected: " + descriptor + " from " + port;
         }
 
-        function onSignalDataReceived(descriptor, message) {
-            console.log("Data from " + descriptor + ": " + message);
-        }
-
         function onTriggerStateChanged(state) {
             triggerStatus.text = state ? "On" : "Off";
             triggerStatus.color = state ? "green" : "red";
@@ -387,7 +383,8 @@ Rectangle {
         function onPlotGenerated(imageData) {
             console.log("Received image data for display.");
             ultrasoundGraph.updateImage("data:image/png;base64," + imageData);
-            statusText.text = "Status: Plot updated!";
+            statusText.text = "Status: Plot updated! (cache hits: " + LIFUConnector.plotCacheHits
+                    + ", misses: " + LIFUConnector.plotCacheMisses + ")";
         }
     }
 
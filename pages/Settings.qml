@@ -25,7 +25,7 @@ Rectangle {
             Layout.alignment: Qt.AlignHCenter
         }
 
-        // Content Section
+        // Command round-trip latency per device, for spotting slow hubs or firmware
         Rectangle {
             Layout.fillWidth: true
             Layout.fillHeight: true
@@ -34,13 +34,140 @@ Rectangle {
             border.color: "#3E4E6F"
             border.width: 2
 
-            Text {
-                text: "Settings"
-                font.pixelSize: 16
-                color: "#BDC3C7"
-                horizontalAlignment: Text.AlignHCenter
-                verticalAlignment: Text.AlignVCenter
-                anchors.centerIn: parent
+            ColumnLayout {
+                anchors.fill: parent
+                anchors.margins: 15
+                spacing: 6
+
+                Text {
+                    text: "Command Latency (ms)"
+                    color: "#BDC3C7"
+                    font.pixelSize: 16
+                    font.weight: Font.Bold
+                }
+
+                Text {
+                    text: "Device  Command                     Count  Errors     p50     p95     p99     Max"
+                    color: "#7F8C8D"
+                    font.pixelSize: 12
+                    font.family: "monospace"
+                }
+
+                ListView {
+                    Layout.fillWidth: true
+                    Layout.fillHeight: true
+                    clip: true
+                    boundsBehavior: Flickable.StopAtBounds
+                    model: LIFUConnector.commandLatency
+
+                    delegate: Text {
+                        width: ListView.view.width
+                        height: 18
+                        text: modelData.device.padEnd(8) + modelData.command.padEnd(28)
+                              + String(modelData.count).padStart(5) + String(modelData.errors).padStart(8)
+                              + modelData.p50.toFixed(2).padStart(8) + modelData.p95.toFixed(2).padStart(8)
+                              + modelData.p99.toFixed(2).padStart(8) + modelData.max.toFixed(2).padStart(8)
+                        textFormat: Text.PlainText
+                        color: modelData.errors > 0 ? "#E74C3C" : "#BDC3C7"
+                        font.pixelSize: 12
+                        font.family: "monospace"
+                        elide: Text.ElideRight
+                    }
+
+                    ScrollBar.vertical: ScrollBar {}
+                }
+
+                Text {
+                    id: latencyStatus
+                    text: ""
+                    color: "#7F8C8D"
+                    font.pixelSize: 12
+                }
+            }
+        }
+
+        // Link throughput: echo random payloads back to back for a fixed time
+        Rectangle {
+            Layout.fillWidth: true
+            Layout.preferredHeight: 110
+            color: "#1E1E20"
+            radius: 10
+            border.color: "#3E4E6F"
+            border.width: 2
+
+            ColumnLayout {
+                anchors.fill: parent
+                anchors.margins: 15
+                spacing: 8
+
+                RowLayout {
+                    spacing: 10
+
+                    Text {
+                        text: "Echo Stress Test"
+                        color: "#BDC3C7"
+                        font.pixelSize: 16
+                        font.weight: Font.Bold
+                    }
+
+                    ComboBox {
+                        id: stressTarget
+                        Layout.preferredWidth: 80
+                        Layout.preferredHeight: 30
+                        model: ["HV", "TX"]
+                        enabled: !LIFUConnector.echoStressRunning
+                    }
+
+                    Text { text: "Payload (bytes)"; color: "#BDC3C7" }
+                    SpinBox {
+                        id: stressPayload
+                        from: 1
+                        to: 65535
+                        value: 256
+                        editable: true
+                        enabled: !LIFUConnector.echoStressRunning
+                    }
+
+                    Text { text: "Duration (s)"; color: "#BDC3C7" }
+                    SpinBox {
+                        id: stressSeconds
+                        from: 1
+                        to: 3600
+                        value: 10
+                        editable: true
+                        enabled: !LIFUConnector.echoStressRunning
+                    }
+
+                    Button {
+                        text: LIFUConnector.echoStressRunning ? "Stop" : "Start"
+                        enabled: LIFUConnector.echoStressRunning
+                                 || (stressTarget.currentText === "HV" ? LIFUConnector.hvConnected : LIFUConnector.txConnected)
+                        onClicked: {
+                            if (LIFUConnector.echoStressRunning)
+                                LIFUConnector.stopEchoStress();
+                            else
+                                LIFUConnector.startEchoStress(stressTarget.currentText, stressPayload.value, stressSeconds.value, 0);
+                        }
+                    }
+                }
+
+                Text {
+                    property var result: LIFUConnector.echoStressResult
+                    text: result.target === undefined ? "" :
+                          result.target + (result.running ? " running: " : ": ")
+                          + result.messages + " echoes in " + result.seconds.toFixed(1) + " s, "
+                          + (result.bytesPerSec / 1024).toFixed(1) + " KiB/s, "
+                          + result.messagesPerSec.toFixed(0) + " msg/s, "
+                          + "p50/p95/p99 " + result.latency.p50.toFixed(2) + "/" + result.latency.p95.toFixed(2)
+                          + "/" + result.latency.p99.toFixed(2) + " ms, "
+                          + result.mismatches + " mismatches (" + (result.mismatchRate * 100).toFixed(2) + "%), "
+                          + result.errors + " errors" + (result.aborted ? " - " + result.aborted : "")
+                    color: result.mismatches > 0 || result.errors > 0 ? "#E74C3C" : "#BDC3C7"
+                    font.pixelSize: 12
+                    font.family: "monospace"
+                    wrapMode: Text.Wrap
+                    Layout.fillWidth: true
+                }
             }
         }
 
@@ -50,16 +177,18 @@ Rectangle {
             spacing: 20
 
             Button {
-                text: "Action 1"
+                text: "Reset Latency"
                 onClicked: {
-                    console.log("Action 1 clicked");
+                    LIFUConnector.resetCommandLatency();
+                    latencyStatus.text = "";
                 }
             }
 
             Button {
-                text: "Action 2"
+                text: "Save Latency JSON"
                 onClicked: {
-                    console.log("Action 2 clicked");
+                    var path = LIFUConnector.dumpCommandLatency("");
+                    latencyStatus.text = path ? "Saved to " + path : "Saving failed";
                 }
             }
         }
@@ -15,23 +15,22 @@ Rectangle {
     // Properties for dynamic data
     property var modules: {
         return {
-            "module_1": {firmwareVersion: "N/A",
-                        deviceId: "N/A",
-                        tx_temperature: 0.0,
+            "module_1": {tx_temperature: 0.0,
                         amb_temperature: 0.0 },
-            "module_2": {firmwareVersion: "N/A",
-                        deviceId: "N/A",
-                        tx_temperature: 0.0,
+            "module_2": {tx_temperature: 0.0,
                         amb_temperature: 0.0 }
         }
     }
 
+    // Firmware version / device ID of a TX module, read once per connection by the connector
+    function moduleInfo(module, field) {
+        let info = LIFUConnector.txModules[module - 1]
+        return info ? info[field] : "N/A"
+    }
+
     function updateStates() {
         console.log("Updating all states...")
-        LIFUConnector.queryNumModules()
-        LIFUConnector.queryTxInfo()
-        LIFUConnector.queryTxTemperature()
-        LIFUConnector.queryTriggerInfo()
+        LIFUConnector.queryTelemetrySnapshot("TX") // Temperatures and trigger in one pass, TX link only
     }
 
     // Run refresh logic immediately on page load if TX is already connected
@@ -42,33 +41,19 @@ Rectangle {
         }
     }
 
-    Timer {
-        id: infoTimer
-        interval: 1500   // Delay to ensure TX is stable before fetching info
-        running: false
-        onTriggered: {
-            console.log("Fetching Firmware Version and Device ID...")
-            updateStates()
-        }
-    }
-
     Connections {
         target: LIFUConnector
 
         // Handle TX Connected state
         onTxConnectedChanged: {
         if (LIFUConnector.txConnected) {
-            infoTimer.start()  // One-time info fetch
+            // The connector polls TX telemetry while connected
         } else {
             console.log("TX Disconnected - Clearing Data...")
 
-        modules["module_1"].firmwareVersion = "N/A"
-        modules["module_1"].deviceId = "N/A"
         modules["module_1"].tx_temp = 0.0
         modules["module_1"].amb_temp = 0.0
 
-        modules["module_2"].firmwareVersion = "N/A"
-        modules["module_2"].deviceId = "N/A"
         modules["module_2"].tx_temp = 0.0
         modules["module_2"].amb_temp = 0.0
 
@@ -78,16 +63,6 @@ Rectangle {
     }
 }
 
-        // Handle device info response
-        onTxDeviceInfoReceived: (module, fwVersion, devId) => {
-            let index = "module_" + module.toString()
-            modules[index].firmwareVersion = fwVersion
-            modules[index].deviceId = devId
-
-            // Update modules object so QML detects the change
-            modules = JSON.parse(JSON.stringify(modules))
-        }
-
         // Handle temperature updates
         onTemperatureTxUpdated: (module, tx_temp, amb_temp) => {
             let index = "module_" + module.toString()
@@ -107,6 +82,33 @@ Rectangle {
             txconfigStatus.text = state ? "Configured" : "NOT Configured";
             txconfigStatus.color = state ? "green" : "red";
         }
+
+        // Handle results of commands run on the TX worker
+        onCommandCompleted: (target, command, success) => {
+            if (target !== "TX")
+                return;
+
+            switch (command) {
+            case "sendPingCommand":
+                pingResult.text = success ? "Ping SUCCESS" : "Ping FAILED";
+                pingResult.color = success ? "green" : "red";
+                break;
+            case "sendLedToggleCommand":
+                toggleLedResult.text = success ? "LED Toggled" : "LED Toggle FAILED";
+                toggleLedResult.color = success ? "green" : "red";
+                break;
+            case "sendEchoCommand":
+                echoResult.text = success ? "Echo SUCCESS" : "Echo FAILED";
+                echoResult.color = success ? "green" : "red";
+                break;
+            case "setTrigger":
+                console.log(success ? "Trigger configured." : "Failed to set trigger configuration");
+                break;
+            case "toggleTrigger":
+                console.log(success ? "Trigger toggled successfully." : "Failed to toggle trigger.");
+                break;
+            }
+        }
     }
 
     ColumnLayout {
@@ -210,13 +212,7 @@ Rectangle {
                                 }
 
                                 onClicked: {
-                                    if(LIFUConnector.sendPingCommand("TX")){                                        
-                                        pingResult.text = "Ping SUCCESS"
-                                        pingResult.color = "green"
-                                    }else{
-                                        pingResult.text = "Ping FAILED"
-                                        pingResult.color = "red"
-                                    }
+                                    LIFUConnector.sendPingCommand("TX")
                                 }
                             }
                             Text {
@@ -265,15 +261,7 @@ Rectangle {
                                 }
 
                                 onClicked: {
-                                    if(LIFUConnector.sendLedToggleCommand("TX"))
-                                    {
-                                        toggleLedResult.text = "LED Toggled"
-                                        toggleLedResult.color = "green"
-                                    }
-                                    else{
-                                        toggleLedResult.text = "LED Toggle FAILED"
-                                        toggleLedResult.color = "red"
-                                    }
+                                    LIFUConnector.sendLedToggleCommand("TX")
                                 }
                             }
                             
@@ -321,15 +309,7 @@ Rectangle {
 
                                 onClicked: {
 
-                                    if(LIFUConnector.sendEchoCommand("TX"))
-                                    {
-                                        echoResult.text = "Echo SUCCESS"
-                                        echoResult.color = "green"
-                                    }
-                                    else{
-                                        echoResult.text = "Echo FAILED"
-                                        echoResult.color = "red"
-                                    }
+                                    LIFUConnector.sendEchoCommand("TX")
                                 } 
                             }
                             Text {
@@ -550,12 +530,7 @@ Rectangle {
                                     };
 
                                     var jsonString = JSON.stringify(json_trigger_data);
-                                    var success = LIFUConnector.setTrigger(jsonString);
-                                    if (success) {
-                                        console.log("Trigger configured:", jsonString);
-                                    } else {
-                                        console.log("Failed to set trigger configuration");
-                                    }
+                                    LIFUConnector.setTrigger(jsonString);
                                 }
                             }
                             Item { }
@@ -588,12 +563,7 @@ Rectangle {
                                 }
 
                                 onClicked: {
-                                    var success = LIFUConnector.toggleTrigger();
-                                    if (success) {
-                                        console.log("Trigger toggled successfully.");
-                                    } else {
-                                        console.log("Failed to toggle trigger.");
-                                    }
+                                    LIFUConnector.toggleTrigger();
                                 }
                             }
 
@@ -837,13 +807,13 @@ Rectangle {
                                 RowLayout {
                                     spacing: 8
                                     Text { text: "Device ID:"; color: "#BDC3C7"; font.pixelSize: 14 }
-                                    Text { text: modules["module_1"].deviceId; color: "#3498DB"; font.pixelSize: 14 }
+                                    Text { text: moduleInfo(1, "deviceId"); color: "#3498DB"; font.pixelSize: 14 }
                                 }
 
                                 RowLayout {
                                     spacing: 8
                                     Text { text: "Firmware Version:"; color: "#BDC3C7"; font.pixelSize: 14 }
-                                    Text { text: modules["module_1"].firmwareVersion; color: "#2ECC71"; font.pixelSize: 14 }
+                                    Text { text: moduleInfo(1, "firmwareVersion"); color: "#2ECC71"; font.pixelSize: 14 }
                                 }
                             }
 
@@ -854,13 +824,13 @@ Rectangle {
                                 RowLayout {
                                     spacing: 8
                                     Text { text: "Device ID:"; color: "#BDC3C7"; font.pixelSize: 14 }
-                                    Text { text: modules["module_2"].deviceId; color: "#3498DB"; font.pixelSize: 14 }
+                                    Text { text: moduleInfo(2, "deviceId"); color: "#3498DB"; font.pixelSize: 14 }
                                 }
 
                                 RowLayout {
                                     spacing: 8
                                     Text { text: "Firmware Version:"; color: "#BDC3C7"; font.pixelSize: 14 }
-                                    Text { text: modules["module_2"].firmwareVersion; color: "#2ECC71"; font.pixelSize: 14 }
+                                    Text { text: moduleInfo(2, "firmwareVersion"); color: "#2ECC71"; font.pixelSize: 14 }
                                 }
                             }
                         }
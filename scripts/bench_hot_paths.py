@@ -0,0 +1,229 @@
+"""Benchmarks for the connector hot paths, with local baselines.
+
+    python scripts/bench_hot_paths.py                    # just report timings
+    python scripts/bench_hot_paths.py --save             # record a baseline
+    python scripts/bench_hot_paths.py --compare          # compare against it
+    python scripts/bench_hot_paths.py --compare --only plot_buffer --threshold 1.2
+
+Each benchmark reports its best time per operation over several repeats.
+With --compare it exits with status 1 when any benchmark is slower than
+threshold x its baseline. Baselines are machine specific, so they are not
+committed: record one with --save on the machine that runs the comparison.
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+BASELINE_PATH = os.path.join(REPO_DIR, "scripts", "bench_baseline.json")
+DEFAULT_THRESHOLD = 1.5
+
+STATUS_LINE = "STATUS:RUNNING,MODE:SEQUENCE,PULSE_TRAIN:[3/10],PULSE:[42/100],TEMP_TX:31.25,TEMP_AMBIENT:24.50"
+CONFIGURE_ARGS = ("0", "0", "50", "400e3", "12", "10", "5", "1", "1", "2e-5", "sequence")
+
+
+class _Fixture:
+    """Connector on a zero-latency simulated device, in a scratch directory."""
+
+    def __init__(self):
+        from PyQt6.QtCore import QCoreApplication
+        from lifu_connector import LIFUConnector
+        from lifu_simulator import SimulatedLIFUInterface
+        from lifu_solution_cache import SolutionCache
+        from lifu_transducer import TransducerCache
+
+        self.app = QCoreApplication.instance() or QCoreApplication([])
+        self.tmp = tempfile.mkdtemp(prefix="lifu-bench-")
+        self.sim = SimulatedLIFUInterface(num_modules=1, latency=0.0, jitter=0.0, status_rate=0)
+        self.connector = LIFUConnector(interface=self.sim)
+        # Keep logging in the measured path, but not on the terminal.
+        self.devnull = open(os.devnull, "w")
+        self.streams = [(handler, handler.setStream(self.devnull))
+                        for handler in logging.getLogger("LIFUConnector").handlers
+                        if isinstance(handler, logging.StreamHandler)]
+        self.connector._transducers = TransducerCache(directory=REPO_DIR)
+        self.connector._solutions = SolutionCache(os.path.join(self.tmp, "solutions"))
+        self.sim.connect()
+
+    def close(self):
+        self.sim.disconnect()
+        self.connector.shutdown_workers()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+        for handler, stream in self.streams:
+            handler.setStream(stream)
+        self.devnull.close()
+
+
+def _configure(fixture):
+    # Run the undecorated slot on the TX worker and wait, so it can be timed.
+    from lifu_connector import LIFUConnector
+    configure = LIFUConnector.configure_transmitter.__wrapped__
+    worker = fixture.connector._workers["TX"]
+    return lambda: worker.call(configure, fixture.connector, *CONFIGURE_ARGS)
+
+
+def bench_parse_status_string(fixture):
+    return lambda: fixture.connector.parse_status_string(STATUS_LINE), 20000
+
+
+def bench_on_data_received(fixture):
+    return lambda: fixture.connector.on_data_received("TX", STATUS_LINE), 5000
+
+
+def bench_configure_transmitter_build(fixture):
+    configure = _configure(fixture)
+    solutions = fixture.connector._solutions
+    shadow = fixture.connector._shadow
+
+    def run():
+        solutions.clear()
+        shadow.forget("TX")
+        configure()
+    return run, 20
+
+
+def bench_configure_transmitter_cached(fixture):
+    configure = _configure(fixture)
+    shadow = fixture.connector._shadow
+    configure()
+
+    def run():
+        shadow.forget("TX")  # Force the upload, from the solution cache
+        configure()
+    return run, 200
+
+
+def bench_configure_transmitter_unchanged(fixture):
+    configure = _configure(fixture)
+    configure()
+    return configure, 200
+
+
+def bench_pinmap_load(fixture):
+    from lifu_transducer import TransducerCache
+    cache = TransducerCache(directory=REPO_DIR)
+
+    def run():
+        cache.invalidate()
+        cache.get(2)
+    return run, 20
+
+
+def bench_plot_file(fixture):
+    from scripts.generate_ultrasound_plot import generate_ultrasound_plot
+    cwd = os.getcwd()
+
+    def run():
+        os.chdir(fixture.tmp)
+        try:
+            generate_ultrasound_plot(0, 0, 50, 400e3, 5, 10, "file")
+        finally:
+            os.chdir(cwd)
+    run()  # Draw the static frame outside the timing
+    return run, 10
+
+
+def bench_plot_buffer(fixture):
+    from scripts.generate_ultrasound_plot import generate_ultrasound_plot
+    generate_ultrasound_plot(0, 0, 50, 400e3, 5, 10, "buffer")
+    return lambda: generate_ultrasound_plot(0, 0, 50, 400e3, 5, 10, "buffer"), 10
+
+
+def bench_plot_field(fixture):
+    from lifu_field import BeamField
+    from lifu_transducer import TransducerCache
+    from scripts.generate_ultrasound_plot import generate_ultrasound_plot
+    field = BeamField(TransducerCache(directory=REPO_DIR).get(2), (0, 0, 50), 400e3)
+    generate_ultrasound_plot(0, 0, 50, 400e3, 5, 10, "buffer", field=field)
+    return lambda: generate_ultrasound_plot(0, 0, 50, 400e3, 5, 10, "buffer", field=field), 5
+
+
+BENCHMARKS = {
+    name[len("bench_"):]: fn for name, fn in sorted(globals().items()) if name.startswith("bench_")
+}
+
+
+def run(names=None, repeat=5, scale=1.0):
+    """Return {name: best seconds per operation} for the selected benchmarks.
+
+    scale multiplies each benchmark's iteration count (at least one).
+    """
+    fixture = _Fixture()
+    results = {}
+    try:
+        for name in names or BENCHMARKS:
+            fn, number = BENCHMARKS[name](fixture)
+            number = max(1, int(number * scale))
+            results[name] = min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+    finally:
+        fixture.close()
+    return results
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return [(name, seconds, baseline seconds, ratio, regressed)] rows."""
+    rows = []
+    for name, seconds in results.items():
+        base = baseline.get(name)
+        ratio = seconds / base if base else None
+        rows.append((name, seconds, base, ratio, ratio is not None and ratio > threshold))
+    return rows
+
+
+def load_baseline(path=BASELINE_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="Compare against the baseline; exit 1 on regression")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Run only these benchmarks")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Fail when slower than threshold x baseline (default %(default)s)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    args = parser.parse_args(argv)
+
+    results = run(args.only, repeat=args.repeat)
+
+    if args.save:
+        baseline = load_baseline(args.baseline)
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        for name, seconds in results.items():
+            print(f"{name:>28}: {seconds * 1e6:12.2f} us")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not args.compare:
+        for name, seconds in results.items():
+            print(f"{name:>28}: {seconds * 1e6:12.2f} us")
+        return 0
+
+    regressed = False
+    for name, seconds, base, ratio, slow in compare(results, load_baseline(args.baseline), args.threshold):
+        base_text = f"{base * 1e6:12.2f} us" if base else "   (no baseline)"
+        ratio_text = f"{ratio:5.2f}x" if ratio is not None else "     "
+        print(f"{name:>28}: {seconds * 1e6:12.2f} us  baseline {base_text}  {ratio_text}"
+              f"{'  REGRESSION' if slow else ''}")
+        regressed = regressed or slow
+    return 1 if regressed else 0
+
+
+# If running as script
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lifu_status import StatusDecoder
+
+MESSAGES = {
+    "with_pulse": "STATUS:RUNNING,MODE:SEQUENCE,PULSE_TRAIN:[3/10],PULSE:[42/100],TEMP_TX:31.25,TEMP_AMBIENT:24.50",
+    "without_pulse": "STATUS:STOPPED,MODE:CONTINUOUS,PULSE_TRAIN:[10/10],TEMP_TX:30.00,TEMP_AMBIENT:24.00",
+    "not_status": "Demo Response",
+}
+
+
+def benchmark(number=200000, repeat=5):
+    """Return {variant: messages per second} for StatusDecoder.decode."""
+    decoder = StatusDecoder()
+    results = {}
+    for name, message in MESSAGES.items():
+        best = min(timeit.repeat(lambda: decoder.decode(message), number=number, repeat=repeat))
+        results[name] = number / best
+    return results
+
+
+# If running as script
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    for name, rate in benchmark(number=number).items():
+        print(f"{name:>14}: {rate:,.0f} msg/s ({1e6 / rate:.2f} us/msg)")
@@ -1,72 +1,310 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.special import j1
 import sys
 import os
 import time
 import base64
+import threading
+from collections import OrderedDict
 from io import BytesIO
+from typing import NamedTuple
 
-# ✅ Fix: Set the non-GUI backend before using matplotlib
-import matplotlib
-matplotlib.use("Agg")  # Prevents QWidget errors
+# matplotlib, scipy and PIL take most of a second to import, so they are
+# imported by the BeamRenderer methods that use them, not at module load.
 
-def generate_ultrasound_plot(x_focus, y_focus, z_focus, frequency, cycles, trigger, mode="file"):
-    try:
-        # Convert input values
-        x_focus = float(x_focus)
-        y_focus = float(y_focus)
-        z_focus = float(z_focus)
-        frequency = float(frequency)
-        cycles = int(cycles)
-        trigger = float(trigger)
+FRAME_BUDGET_S = 0.05  # Target time for one rendered frame (compute + encode)
+PLOT_CACHE_BYTES = 64 * 1024 * 1024  # Memory cap for PlotCache
 
-        # Constants
-        wavelength = 1500 / frequency  # Speed of sound in tissue ~1500 m/s
-        beam_width = 5  # Beam width in mm
 
-        # Generate grid
-        x = np.linspace(-20, 20, 100)
-        z = np.linspace(0, 100, 100)
-        X_grid, Z_grid = np.meshgrid(x, z)
+class BeamRenderer:
+    """Persistent renderer for the 2D beam preview.
+
+    The figure frame (axes, ticks, labels, colorbar) is drawn once and kept
+    as a pixel buffer. Each frame evaluates the beam directly at the plot
+    area's pixel centres, maps it through a precomputed colormap lookup
+    table and pastes it into a copy of that frame, so matplotlib never
+    redraws or resamples anything after the first call.
+    """
+
+    def __init__(self, x_range=(-20, 20), z_range=(0, 100), resolution=100,
+                 cmap="plasma", threshold=0.01, beam_width=5, dpi=100, frame_budget=FRAME_BUDGET_S):
+        self.x_range = x_range
+        self.z_range = z_range
+        self.x = np.linspace(x_range[0], x_range[1], resolution)
+        self.z = np.linspace(z_range[0], z_range[1], resolution)
+        import matplotlib
+        matplotlib.use("Agg")  # Non-GUI backend; prevents QWidget errors
+        self.cmap = matplotlib.colormaps[cmap]
+        self.threshold = threshold
+        self.beam_width = beam_width  # Beam width in mm
+        self.dpi = dpi
+        self.frame_budget = frame_budget
+        self.last_frame_time = 0.0
+
+        # 256-entry RGBA lookup table for normalized intensity, plus a
+        # transparent entry for NaN, packed one pixel per uint32 so a frame is
+        # a single take().
+        lut = np.zeros((257, 4), dtype=np.uint8)
+        lut[:256] = self.cmap(np.linspace(0, 1, 256), bytes=True)
+        self.lut = lut
+        self._lut32 = lut.view(np.uint32).ravel()
+
+        self._frame = None  # (H, W, 3) uint8 with an empty plot area
+        self._plot_area = None  # (row slice, column slice) of the plot area
+        self._pixel_x = None  # x (mm) at each plot-area column
+        self._pixel_z = None  # z (mm) at each plot-area row, top to bottom
+        self._lock = threading.Lock()
+
+    def compute_intensity(self, x_focus, z_focus, frequency, x=None, z=None):
+        """Return the normalized (z, x) intensity grid, NaN below threshold.
+
+        x and z default to the renderer's own grid.
+        """
+        from scipy.special import j1
 
-        # Compute beam intensity using Gaussian approximation
-        r = np.sqrt((X_grid - x_focus)**2)
-        z_rel = Z_grid - z_focus
+        x = self.x if x is None else x
+        z = self.z if z is None else z
+        wavelength = 1500 / frequency  # Speed of sound in tissue ~1500 m/s
 
-        # Bessel-Gaussian Beam Profile
+        # The Bessel term only depends on x and the Gaussian only on z, so
+        # compute each on its 1D axis and combine with an outer product.
+        r = np.abs(x - x_focus)
+        arg = 2 * np.pi * r / self.beam_width
         with np.errstate(divide='ignore', invalid='ignore'):  # Avoid warnings
-            bessel_term = j1(2 * np.pi * r / beam_width) / (2 * np.pi * r / beam_width)
-            bessel_term[r == 0] = 0.5  # Handling singularity at r = 0
+            bessel_term = j1(arg) / arg
+        bessel_term[r == 0] = 0.5  # Handling singularity at r = 0
+
+        z_rel = z - z_focus
+        intensity = np.outer(np.exp(-((z_rel / self.beam_width)**2)), bessel_term**2)
+        return self.normalize(intensity)
+
+    def normalize(self, intensity):
+        """Scale an intensity grid to a peak of 1, in place; NaN below threshold."""
+        peak = np.max(intensity)
+        if peak > 0:
+            intensity /= peak
+        intensity[intensity < self.threshold] = np.nan  # Apply threshold to enhance visibility
+        return intensity
+
+    @staticmethod
+    def _interpolation_matrix(source, target):
+        """(len(target), len(source)) weights for linear interpolation."""
+        index = np.clip(np.searchsorted(source, target) - 1, 0, len(source) - 2)
+        weight = np.clip((target - source[index]) / (source[index + 1] - source[index]), 0, 1)
+        matrix = np.zeros((len(target), len(source)))
+        rows = np.arange(len(target))
+        matrix[rows, index] = 1 - weight
+        matrix[rows, index + 1] = weight
+        return matrix
 
-        intensity = (bessel_term**2) * np.exp(-((z_rel / beam_width)**2))
-        intensity /= np.max(intensity)
-        intensity[intensity < 0.01] = np.nan  # Apply threshold to enhance visibility
+    def to_rgba(self, intensity):
+        """Map an intensity grid to a (z, x, 4) uint8 image; NaN is transparent.
 
-        # Create plot
-        fig, ax = plt.subplots(figsize=(10, 6))
-        c = ax.contourf(X_grid, Z_grid, intensity, levels=50, cmap='plasma')
-        plt.colorbar(c, label='Normalized Intensity')
+        Rows follow the grid order, i.e. row 0 is the first z value.
+        """
+        visible = ~np.isnan(intensity)
+        index = np.full(intensity.shape, 256, dtype=np.uint16)
+        index[visible] = np.clip(intensity[visible], 0, 1) * 255
+        return self._lut32.take(index).view(np.uint8).reshape(intensity.shape + (4,))
+
+    def _build_frame(self):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.cm import ScalarMappable
+        from matplotlib.colors import Normalize
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(10, 6), dpi=self.dpi)
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        ax.set_xlim(*self.x_range)
+        ax.set_ylim(*self.z_range)
+        fig.colorbar(ScalarMappable(norm=Normalize(0, 1), cmap=self.cmap), ax=ax, label='Normalized Intensity')
         ax.set_xlabel("X (mm)")
         ax.set_ylabel("Z (mm)")
         ax.set_title("Focused Ultrasound Beam 2D Profile")
+        fig.tight_layout()
+        canvas.draw()
+
+        frame = np.asarray(canvas.buffer_rgba())[..., :3].copy()
+        height = frame.shape[0]
+        # Pixel rows count down from the top; stay one pixel inside the spines.
+        x0, y0, x1, y1 = ax.bbox.extents
+        rows = slice(int(np.ceil(height - y1)) + 1, int(np.floor(height - y0)) - 1)
+        cols = slice(int(np.ceil(x0)) + 1, int(np.floor(x1)) - 1)
+
+        to_data = ax.transData.inverted()
+        col_centres = np.arange(cols.start, cols.stop) + 0.5
+        row_centres = height - (np.arange(rows.start, rows.stop) + 0.5)
+        self._pixel_x = to_data.transform(np.column_stack([col_centres, np.full_like(col_centres, y0)]))[:, 0]
+        self._pixel_z = to_data.transform(np.column_stack([np.full_like(row_centres, x0), row_centres]))[:, 1]
+        self._plot_area = (rows, cols)
+        # Fields too costly to evaluate per pixel are sampled on the x/z grid
+        # and interpolated up: pixel = rows @ grid @ cols.T
+        self._resample = (self._interpolation_matrix(self.z, self._pixel_z),
+                          self._interpolation_matrix(self.x, self._pixel_x).T)
+        self._frame = frame
+
+    def compute_frame_intensity(self, x_focus, z_focus, frequency, field=None):
+        """Intensity sampled at the plot area's pixels (row 0 = top = max z).
+
+        field, if given, is a callable taking x and z axes (mm) and returning
+        the raw (len(z), len(x)) intensity, such as lifu_field.BeamField. It
+        is evaluated on the renderer's x/z grid and interpolated to pixels;
+        otherwise the built-in analytic beam model is used.
+        """
+        with self._lock:
+            if self._frame is None:
+                self._build_frame()
+        if field is None:
+            return self.compute_intensity(x_focus, z_focus, frequency, x=self._pixel_x, z=self._pixel_z)
+        rows, cols = self._resample
+        return self.normalize(rows @ field(self.x, self.z) @ cols)
+
+    def render_png(self, intensity):
+        """Encode a compute_frame_intensity grid as a PNG with axes and colorbar."""
+        from PIL import Image
+
+        rgba = self.to_rgba(intensity)
+        visible = rgba[..., 3] > 0
+        frame = self._frame.copy()
+        frame[self._plot_area][visible] = rgba[visible, :3]
+        buffer = BytesIO()
+        Image.fromarray(frame).save(buffer, format="PNG", compress_level=1)
+        return buffer.getvalue()
+
+    def render(self, x_focus, z_focus, frequency, field=None):
+        """Compute and render one frame, recording how long it took."""
+        start = time.perf_counter()
+        png = self.render_png(self.compute_frame_intensity(x_focus, z_focus, frequency, field))
+        self.last_frame_time = time.perf_counter() - start
+        return png
+
+    @property
+    def within_budget(self):
+        return self.last_frame_time <= self.frame_budget
+
+    @property
+    def config(self):
+        """Everything besides the focus and frequency that affects a frame."""
+        return (self.x_range, self.z_range, self.threshold, self.beam_width, self.dpi, self.cmap.name)
+
+
+class PlotEntry(NamedTuple):
+    intensity: np.ndarray  # Read-only compute_frame_intensity grid
+    png: bytes
+
+
+class PlotCache:
+    """Bounded LRU of rendered beam plots.
+
+    Entries are keyed on the focus, frequency and renderer config, and hold
+    both the intensity grid and the encoded PNG. The least recently used
+    entries are dropped once either max_entries or max_bytes is exceeded.
+    """
+
+    def __init__(self, max_entries=64, max_bytes=PLOT_CACHE_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> PlotEntry
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(renderer, x_focus, z_focus, frequency, field=None):
+        field_key = None if field is None else field.key
+        return (float(x_focus), float(z_focus), float(frequency), renderer.config, field_key)
+
+    @staticmethod
+    def _size(entry):
+        return entry.intensity.nbytes + len(entry.png)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the PlotEntry for key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, intensity, png):
+        """Store a rendered plot and return its PlotEntry."""
+        intensity = intensity.copy()
+        intensity.setflags(write=False)
+        entry = PlotEntry(intensity, png)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.nbytes -= self._size(previous)
+            self._entries[key] = entry
+            self.nbytes += self._size(entry)
+            while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= self._size(evicted)
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+_renderer = None
+_renderer_lock = threading.Lock()
+
+
+def get_renderer():
+    """Return the shared BeamRenderer, creating it on first use."""
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            _renderer = BeamRenderer()
+        return _renderer
+
+
+def render_plot(x_focus, z_focus, frequency, cache=None, field=None):
+    """Return the PNG for one focus, going through cache when given."""
+    renderer = get_renderer()
+    if cache is None:
+        return renderer.render(x_focus, z_focus, frequency, field)
+
+    key = cache.make_key(renderer, x_focus, z_focus, frequency, field)
+    entry = cache.get(key)
+    if entry is None:
+        intensity = renderer.compute_frame_intensity(x_focus, z_focus, frequency, field)
+        entry = cache.put(key, intensity, renderer.render_png(intensity))
+    return entry.png
+
+
+def generate_ultrasound_plot(x_focus, y_focus, z_focus, frequency, cycles, trigger, mode="file", cache=None,
+                             field=None):
+    try:
+        # Convert input values
+        x_focus = float(x_focus)
+        y_focus = float(y_focus)
+        z_focus = float(z_focus)
+        frequency = float(frequency)
+        cycles = int(cycles)
+        trigger = float(trigger)
+
+        png = render_plot(x_focus, z_focus, frequency, cache, field)
 
         if mode == "file":
             # Save plot as file
             output_path = os.path.abspath("generated_plot.png")
-            plt.savefig(output_path, dpi=100, bbox_inches='tight')
-            plt.close()
+            with open(output_path, "wb") as f:
+                f.write(png)
             return output_path + f"?v={int(time.time())}"
 
         elif mode == "buffer":
-            # Save to a BytesIO buffer instead of a file
-            buffer = BytesIO()
-            plt.savefig(buffer, format="png", dpi=100, bbox_inches='tight')
-            plt.close()
-            
             # Encode image in Base64
-            buffer.seek(0)
-            base64_image = base64.b64encode(buffer.getvalue()).decode("utf-8")
+            base64_image = base64.b64encode(png).decode("utf-8")
             return base64_image
 
     except Exception as e:
@@ -0,0 +1,62 @@
+import os
+
+import pytest
+from PyQt6.QtCore import QCoreApplication
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """The process-wide Qt application that queued signals are delivered through."""
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.fixture
+def sim_connector(qapp):
+    """Make (simulator, connector) pairs; disconnected and shut down after the test.
+
+    Keyword arguments go to SimulatedLIFUInterface, which defaults here to
+    no latency and no status stream.
+    """
+    from lifu_connector import LIFUConnector
+    from lifu_simulator import SimulatedLIFUInterface
+
+    made = []
+
+    def make(**options):
+        sim = SimulatedLIFUInterface(**{"latency": 0.0, "jitter": 0.0, "status_rate": 0, **options})
+        connector = LIFUConnector(interface=sim)
+        made.append((sim, connector))
+        return sim, connector
+
+    yield make
+    for sim, connector in made:
+        sim.disconnect()
+        connector.shutdown_workers()
+
+
+@pytest.fixture
+def cached_connector(sim_connector, tmp_path):
+    """sim_connector with the repo's pinmaps and a solution cache under tmp_path."""
+    from lifu_solution_cache import SolutionCache
+    from lifu_transducer import TransducerCache
+
+    def make(**options):
+        sim, connector = sim_connector(**options)
+        connector._transducers = TransducerCache(directory=REPO)
+        connector._solutions = SolutionCache(str(tmp_path / "solutions"))
+        return sim, connector
+
+    return make
+
+
+@pytest.fixture
+def tx_call():
+    """Run fn(connector, *args) on the TX worker: (result, TX commands sent, HV commands sent)."""
+    def call(sim, connector, fn, *args):
+        before = sim._tx_link.commands, sim._hv_link.commands
+        result = connector._workers["TX"].call(fn, connector, *args)
+        return result, sim._tx_link.commands - before[0], sim._hv_link.commands - before[1]
+
+    return call
@@ -0,0 +1,56 @@
+import os
+
+import numpy as np
+
+from lifu_connector import LIFUConnector
+from lifu_field import BeamField, compute_pressure, plane_points
+from lifu_transducer import TransducerCache
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_field_peaks_at_steered_focus():
+    xdc = TransducerCache(directory=REPO_DIR).get(2)
+    field = BeamField(xdc, (5, 0, 50), 400e3)
+    x = np.linspace(-20, 20, 161)
+    z = np.linspace(10, 90, 161)
+
+    intensity = field(x, z)
+    assert intensity.shape == (z.size, x.size)
+    row, col = np.unravel_index(np.argmax(intensity), intensity.shape)
+    assert abs(x[col] - 5) <= 1 and abs(z[row] - 50) <= 3
+
+
+def test_chunked_volume_matches_single_chunk():
+    xdc = TransducerCache(directory=REPO_DIR).get(1)
+    field = BeamField(xdc, (0, 0, 40), 400e3)
+    x = np.linspace(-10, 10, 9)
+    volume = np.stack([plane_points(x, np.linspace(20, 60, 7), y) for y in (-5, 0, 5)])
+
+    whole = compute_pressure(xdc, field.delays, field.apodizations, 400e3, volume)
+    # One point per chunk spread over threads must give the same answer.
+    chunked = compute_pressure(xdc, field.delays, field.apodizations, 400e3, volume, chunk_bytes=1, workers=3)
+    assert whole.shape == (3, 7, 9)
+    np.testing.assert_allclose(chunked, whole)
+
+
+def test_preview_uses_the_programmed_solution(cached_connector, tx_call):
+    sim, connector = cached_connector(num_modules=2)
+    sim.connect()
+    connector.drain().result(timeout=5)
+    args = ("0", "0", "50", "400e3", "12", "10", "5", "1", "1", "2e-5", "sequence")
+    assert tx_call(sim, connector, LIFUConnector.configure_transmitter.__wrapped__, *args)[0]
+    key, num_modules = next(iter(connector._uploaded.values()))[:2]
+    assert num_modules == 2
+    solution = connector._solutions.get(key)
+    solution["apodizations"][0][::2] = 0.0  # As if the uploaded solution were apodized
+
+    field = connector._beam_field("0", "0", "50", "400e3")
+    np.testing.assert_array_equal(field.apodizations, solution["apodizations"][0])
+    assert connector._beam_field("0", "0", "50", "400e3") is field  # Kept per solution key
+
+    steered = connector._beam_field("5", "0", "50", "400e3")  # Not what the device holds
+    assert steered is not field and steered.apodizations.min() == 1.0
+
+    sim.disconnect()
+    assert connector._beam_field("0", "0", "50", "400e3") is not field
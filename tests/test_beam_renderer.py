@@ -0,0 +1,52 @@
+import io
+
+import numpy as np
+from PIL import Image
+
+from scripts.generate_ultrasound_plot import BeamRenderer, PlotCache
+
+
+def test_lut_maps_nan_to_transparent():
+    renderer = BeamRenderer()
+    intensity = np.array([[np.nan, 0.0, 1.0]])
+    rgba = renderer.to_rgba(intensity)
+
+    assert rgba.shape == (1, 3, 4)
+    assert rgba[0, 0, 3] == 0
+    np.testing.assert_array_equal(rgba[0, 1], renderer.cmap(0.0, bytes=True))
+    np.testing.assert_array_equal(rgba[0, 2], renderer.cmap(1.0, bytes=True))
+
+
+def test_render_places_peak_at_focus():
+    renderer = BeamRenderer()
+    png = renderer.render(5, 60, 400e3)
+    assert renderer.last_frame_time > 0
+
+    image = np.asarray(Image.open(io.BytesIO(png)).convert("RGB"))
+    assert image.shape == renderer._frame.shape
+
+    intensity = renderer.compute_frame_intensity(5, 60, 400e3)
+    row, col = np.unravel_index(np.nanargmax(intensity), intensity.shape)
+    assert abs(renderer._pixel_x[col] - 5) < 0.1
+    assert abs(renderer._pixel_z[row] - 60) < 0.2
+    rows, cols = renderer._plot_area
+    peak = image[rows, cols][row, col]
+    np.testing.assert_array_equal(peak, renderer.cmap(1.0, bytes=True)[:3])
+
+
+def test_plot_cache_hits_and_byte_cap():
+    renderer = BeamRenderer()
+    intensity = renderer.compute_intensity(0, 50, 400e3)
+    cache = PlotCache(max_entries=8, max_bytes=2 * intensity.nbytes + 10)
+
+    for z in (30, 40, 50):
+        key = cache.make_key(renderer, 0, z, 400e3)
+        assert cache.get(key) is None
+        cache.put(key, intensity, b"png")
+
+    # The byte cap only fits two entries, so the oldest focus is gone.
+    assert len(cache) == 2 and cache.nbytes <= cache.max_bytes
+    assert cache.get(cache.make_key(renderer, 0, 30, 400e3)) is None
+    entry = cache.get(cache.make_key(renderer, "0", "50.0", "400000"))
+    assert entry.png == b"png" and not entry.intensity.flags.writeable
+    assert (cache.hits, cache.misses) == (1, 4)
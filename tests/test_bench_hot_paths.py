@@ -0,0 +1,12 @@
+from scripts import bench_hot_paths
+
+
+def test_every_benchmark_runs():
+    results = bench_hot_paths.run(repeat=1, scale=0)
+    assert set(results) == set(bench_hot_paths.BENCHMARKS)
+    assert all(seconds > 0 for seconds in results.values())
+
+
+def test_compare_flags_regressions_over_threshold():
+    rows = bench_hot_paths.compare({"fast": 1.0, "slow": 2.0, "new": 1.0}, {"fast": 1.0, "slow": 1.0}, threshold=1.5)
+    assert [(name, slow) for name, *_, slow in rows] == [("fast", False), ("slow", True), ("new", False)]
@@ -0,0 +1,48 @@
+from PyQt6.QtCore import Qt
+
+from lifu_device_info import DeviceInfo
+
+
+def test_device_info_is_read_once_per_connection(sim_connector):
+    sim, connector = sim_connector(num_modules=2)
+    received = []
+    connector.txDeviceInfoReceived.connect(lambda *info: received.append(info), Qt.ConnectionType.DirectConnection)
+    sim.connect()
+    connector.drain().result(timeout=5)
+    assert connector.hvFirmwareVersion == "v0.0.0-sim"
+    assert [m["module"] for m in connector.txModules] == [1, 2]
+    assert connector.queryNumModulesConnected == 2
+
+    before = sim._tx_link.commands, sim._hv_link.commands
+    for _ in range(5):  # Pages re-query on every tab switch
+        connector.queryTxInfo()
+        connector.queryHvInfo()
+        connector.queryNumModules()
+    connector.drain().result(timeout=5)
+    assert (sim._tx_link.commands, sim._hv_link.commands) == before
+    assert len(received) == 10
+
+    sim.disconnect()
+    assert connector.hvDeviceId == "N/A" and connector.txModules == []
+
+
+def test_read_in_flight_when_the_link_drops_is_not_cached():
+    info = DeviceInfo()
+    facts, fresh = info.get("HV", lambda: info.forget("HV") or {"firmwareVersion": "old"})
+    assert fresh and facts == {"firmwareVersion": "old"}
+    assert info.peek("HV") is None
+
+
+def test_first_configure_after_connect_uses_the_module_count(cached_connector):
+    sim, connector = cached_connector(num_modules=2)
+    completed = []
+    connector.commandCompleted.connect(lambda *done: completed.append(done), Qt.ConnectionType.DirectConnection)
+    sim.connect()
+    # Straight away, before the device info read on connect has run
+    connector.configure_transmitter("0", "0", "50", "400e3", "12", "10", "5", "1", "1", "2e-5", "sequence")
+    sim.set_solution = lambda solution, **kwargs: None  # The page passes no solution yet
+    connector.configureSolution("demo", 1.0)
+    connector.drain().result(timeout=5)
+    assert ("TX", "configure_transmitter", True) in completed
+    assert ("TX", "configureSolution", True) in completed  # set_solution returns None
+    assert connector._num_modules_connected == 2
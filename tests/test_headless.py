@@ -0,0 +1,38 @@
+import asyncio
+import json
+
+from lifu_headless import ScriptRunner
+
+
+def _run(sim_connector, steps, output_dir):
+    sim, connector = sim_connector()
+    sim.connect()
+    runner = ScriptRunner(connector, steps, str(output_dir))
+    return asyncio.run(runner.run()), runner, connector
+
+
+def test_script_runs_and_stops_the_trigger_it_left_running(sim_connector, tmp_path):
+    steps = [
+        {"wait_for": "txConnected", "timeout": 5},
+        {"repeat": 2, "steps": [{"call": "toggleTrigger"}, {"call": "toggleTrigger"}]},
+        {"call": "toggleTrigger"},
+        {"wait_for": "triggerEnabled", "timeout": 5},
+        {"capture": "out/telemetry.json"},
+    ]
+    ok, runner, connector = _run(sim_connector, steps, tmp_path)
+    assert ok
+    assert runner.steps_run == 9  # the repeat step counts once
+    assert not connector.triggerEnabled
+    capture = json.loads((tmp_path / "out" / "telemetry.json").read_text())
+    assert "channels" in capture
+
+
+def test_failing_command_stops_the_script(sim_connector, tmp_path):
+    steps = [
+        {"call": "activateProfile", "args": [3]},  # nothing preloaded
+        {"capture": "never.json"},
+    ]
+    ok, runner, _ = _run(sim_connector, steps, tmp_path)
+    assert not ok
+    assert runner.steps_run == 1
+    assert not (tmp_path / "never.json").exists()
@@ -0,0 +1,54 @@
+import json
+import random
+
+from lifu_latency import CommandLatency, LatencyHistogram
+
+
+def test_percentiles_within_a_bucket_of_exact():
+    rng = random.Random(1)
+    samples = sorted(rng.lognormvariate(-6, 1) for _ in range(20000))
+    histogram = LatencyHistogram()
+    for sample in samples:
+        histogram.record(sample)
+    for q in (0.5, 0.95, 0.99):
+        exact = samples[int(q * len(samples)) - 1]
+        assert abs(histogram.percentile(q) / exact - 1) < 0.1
+    assert histogram.percentile(1.0) == samples[-1]
+    assert histogram.summary()["count"] == 20000
+
+    latency = CommandLatency()
+    latency.record("HV", "ping", 0.002)
+    latency.record("HV", "ping", 0.004, error=True)
+    (row,) = latency.summary()
+    assert (row["device"], row["command"], row["count"], row["errors"]) == ("HV", "ping", 2, 1)
+    assert row["mean"] == 3.0
+
+
+def test_connector_times_every_interface_call(sim_connector, tmp_path):
+    sim, connector = sim_connector(latency=0.005)
+    notified = []
+    connector.commandLatencyChanged.connect(lambda: notified.append(True))
+    connector.sendPingCommand("HV")  # Not connected: raises inside the call
+    connector.drain().result(timeout=5)
+    sim.connect()
+    connector.drain().result(timeout=5)
+    for _ in range(5):
+        connector.sendPingCommand("HV")
+        connector.sendPingCommand("TX")
+    connector.drain().result(timeout=5)
+    connector._publish_latency()
+    rows = {(row["device"], row["command"]): row for row in connector.commandLatency}
+    assert rows[("HV", "ping")]["count"] == 6
+    assert rows[("HV", "ping")]["errors"] == 1
+    assert rows[("TX", "ping")]["count"] == 5
+    assert 4.0 < rows[("TX", "ping")]["p50"] < 20.0
+    assert ("TX", "get_version") in rows  # Device info read on connect
+    assert notified
+
+    path = connector.dumpCommandLatency(str(tmp_path / "latency.json"))
+    dumped = json.load(open(path))
+    assert {(h["device"], h["command"]) for h in dumped["histograms"]} == set(rows)
+    assert sum(dumped["histograms"][0]["buckets"].values()) == dumped["histograms"][0]["count"]
+
+    connector.resetCommandLatency()
+    assert connector.commandLatency == []
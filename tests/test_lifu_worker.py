@@ -0,0 +1,164 @@
+import threading
+import time
+
+import pytest
+from PyQt6.QtCore import Qt
+
+from lifu_connector import READY, RUNNING
+from lifu_worker import POLL, SAFETY, DeviceWorker, QueueFull, when_all
+
+
+def test_jobs_run_off_caller_thread_in_order():
+    worker = DeviceWorker("TX")
+    caller = threading.get_ident()
+    seen = []
+
+    def job(i):
+        time.sleep(0.001)
+        seen.append((i, threading.get_ident()))
+
+    futures = [worker.submit(job, i) for i in range(20)]
+    for f in futures:
+        f.result(timeout=5)
+    worker.shutdown(wait=True)
+
+    assert [i for i, _ in seen] == list(range(20))
+    assert len({tid for _, tid in seen}) == 1
+    assert seen[0][1] != caller
+
+
+def test_nested_submit_runs_inline():
+    worker = DeviceWorker("HV")
+
+    def outer():
+        # Would deadlock a single-thread executor if it were queued.
+        return worker.call(lambda: threading.get_ident()) == threading.get_ident()
+
+    assert worker.call(outer, timeout=5) is True
+    worker.shutdown(wait=True)
+
+
+def test_links_run_concurrently():
+    tx, hv = DeviceWorker("TX"), DeviceWorker("HV")
+    barrier = threading.Barrier(2, timeout=5)
+
+    futures = [tx.submit(barrier.wait), hv.submit(barrier.wait)]
+    for f in futures:
+        f.result(timeout=5)
+    tx.shutdown(wait=True)
+    hv.shutdown(wait=True)
+
+
+def test_when_all_collects_results_in_order():
+    tx, hv = DeviceWorker("TX"), DeviceWorker("HV")
+    gathered = []
+    done = threading.Event()
+
+    def fail():
+        raise RuntimeError("link down")
+
+    futures = [hv.submit(lambda: "hv"), tx.submit(fail), tx.submit(lambda: "tx")]
+    when_all(futures, lambda results: (gathered.extend(results), done.set()))
+
+    assert done.wait(5)
+    assert gathered == ["hv", None, "tx"]
+    tx.shutdown(wait=True)
+    hv.shutdown(wait=True)
+
+
+def test_priorities_expiry_and_depth_limit():
+    tx, hv = DeviceWorker("TX", max_depth=3), DeviceWorker("HV")
+    release = threading.Event()
+    order = []
+    tx.submit(release.wait, 5)  # Occupies the link while the rest queue up
+    time.sleep(0.05)
+    futures = [tx.submit(order.append, "poll", priority=POLL),
+               tx.submit(order.append, "command"),
+               tx.submit(time.sleep, 0, max_wait=0.01),  # Stale by the time it could run
+               tx.submit(lambda: hv.call(lambda: order.append(("hv", hv.stats()["depth"]))), priority=SAFETY)]
+    rejected = tx.submit(order.append, "overflow")
+    stop = tx.submit(order.append, "stop", priority=SAFETY)  # Never rejected
+    with pytest.raises(QueueFull):
+        rejected.result(timeout=0)
+
+    time.sleep(0.05)
+    release.set()
+    stop.result(timeout=5)
+    futures[1].result(timeout=5)
+    futures[0].result(timeout=5)
+    with pytest.raises(TimeoutError):
+        futures[2].result(timeout=5)
+    assert order == [("hv", 0), "stop", "command", "poll"]
+
+    stats = tx.stats()
+    assert stats["safety"]["completed"] == 2 and stats["command"]["rejected"] == 1
+    assert stats["command"]["expired"] == 1 and stats["poll"]["completed"] == 1
+    assert stats["safety"]["max_wait"] < stats["poll"]["max_wait"]
+    assert hv.stats()["safety"]["completed"] == 1  # The HV call kept the caller's priority
+    assert hv.stats()["command"]["submitted"] == 0
+    tx.shutdown(wait=True)
+    hv.shutdown(wait=True)
+
+
+def test_stop_does_not_wait_behind_queued_commands(sim_connector):
+    sim, connector = sim_connector()
+    completed, stopped_after = [], []
+    connector.commandCompleted.connect(lambda *done: completed.append(done[1]), Qt.ConnectionType.DirectConnection)
+    sim.connect()
+    connector.drain().result(timeout=5)
+    connector.stateChanged.connect(lambda _: stopped_after.append(len(completed)),
+                                   Qt.ConnectionType.DirectConnection)
+    sim._tx_link.latency = sim._hv_link.latency = 0.01
+    connector._set_state(RUNNING)
+    for _ in range(30):
+        connector.sendPingCommand("TX")
+    connector.stop_sonication()
+    connector.drain().result(timeout=5)
+
+    assert connector.state != RUNNING and len(completed) == 30
+    assert stopped_after[-1] <= 1  # At most the ping already on the wire ran first
+    stats = connector.commandQueueStats()["TX"]
+    assert stats["safety"]["max_wait"] < 0.1 < stats["command"]["max_wait"]
+
+
+def test_stop_voids_a_start_still_queued(sim_connector):
+    sim, connector = sim_connector()
+    completed = []
+    connector.commandCompleted.connect(lambda *done: completed.append(done), Qt.ConnectionType.DirectConnection)
+    release = threading.Event()
+    sim.connect()
+    connector.drain().result(timeout=5)
+    connector._set_state(READY)
+    connector._workers["TX"].submit(release.wait, 5)  # A command still on the wire
+    try:
+        connector.start_sonication()
+        connector.stop_sonication()  # Pressed before the start got its turn
+    finally:
+        release.set()
+    connector.drain().result(timeout=5)
+
+    assert connector.state == READY
+    assert not sim.txdevice.running and not sim.hvcontroller.hv_on
+    assert ("TX", "start_sonication", False) in completed
+    assert connector.commandQueueStats()["TX"]["command"]["voided"] == 1
+
+
+def test_every_failed_command_reports_completion(sim_connector):
+    sim, connector = sim_connector()
+    completed = []
+    connector.commandCompleted.connect(lambda *done: completed.append(done), Qt.ConnectionType.DirectConnection)
+    sim.connect()
+    connector.drain().result(timeout=5)
+    connector._set_state(READY)
+
+    def broken_trigger():
+        raise OSError("UART write failed")
+
+    sim.txdevice.start_trigger = broken_trigger
+    connector.start_sonication()  # Returns nothing when it works; raises here
+    connector.drain().result(timeout=5)
+    assert completed == [("TX", "start_sonication", False)]
+
+    connector.shutdown_workers()
+    connector.sendPingCommand("TX")  # A QML slot fired during teardown
+    assert completed[-1] == ("TX", "sendPingCommand", False)
@@ -0,0 +1,76 @@
+import time
+
+from PyQt6.QtCore import QCoreApplication, QThread
+
+from lifu_link_stress import EchoStress
+from lifu_worker import DeviceWorker
+
+
+def _wait(predicate, timeout=5):
+    # Progress reaches the connector through its event loop
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        QCoreApplication.processEvents()
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_echo_stress_counts_mismatches_and_gives_up_on_a_dead_link():
+    worker = DeviceWorker("TX")
+    calls = []
+
+    def echo(echo_data=None):
+        calls.append(echo_data)
+        if len(calls) % 4 == 0:
+            return echo_data[:-1] + bytes([echo_data[-1] ^ 1]), len(echo_data)  # Corrupted reply
+        return echo_data, len(echo_data)
+
+    try:
+        stress = EchoStress("TX", echo, worker, 100, count=40)
+        stress.start()
+        stress.join(5)
+        result = stress.result()
+        assert not result["running"]
+        assert (result["messages"], result["mismatches"], result["errors"]) == (40, 10, 0)
+        assert result["mismatchRate"] == 0.25
+        assert result["bytes"] == 30 * 100
+        assert result["latency"]["count"] == 40
+        assert len(set(calls)) == 40  # A fresh payload per echo
+
+        def dead(echo_data=None):
+            return None, None  # What TxDevice.echo returns when not connected
+
+        stress = EchoStress("TX", dead, worker, 100, seconds=30)
+        stress.start()
+        stress.join(5)
+        result = stress.result()
+        assert (result["errors"], result["mismatches"], result["mismatchRate"]) == (10, 0, 0.0)
+        assert stress.aborted
+    finally:
+        worker.shutdown()
+
+
+def test_connector_runs_echo_stress_for_a_duration(sim_connector):
+    sim, connector = sim_connector(latency=0.001)
+    threads = set()
+    connector.echoStressChanged.connect(lambda: threads.add(QThread.currentThread()))
+    assert not connector.startEchoStress("HV", 64, 0.3, 0)  # Not connected
+    sim.connect()
+    assert not connector.startEchoStress("HV", 0, 0.3, 0)
+    assert connector.startEchoStress("HV", 512, 0.3, 0)
+    assert connector.echoStressRunning
+    assert not connector.startEchoStress("HV", 512, 0.3, 0)  # One at a time
+    assert _wait(lambda: not connector.echoStressRunning)
+    result = connector.echoStressResult
+    assert 0.3 <= result["seconds"] < 1.0
+    assert result["messages"] > 20 and result["mismatches"] == 0
+    assert result["bytesPerSec"] > 20 * 512 / 0.3 / 2
+    assert 1.0 <= result["latency"]["p50"] < 10.0
+    assert threads == {connector.thread()}  # Never from the stress driver thread
+
+    assert connector.startEchoStress("TX", 16, 0, 0) is False  # No limit given
+    assert connector.startEchoStress("TX", 16, 60, 0)
+    time.sleep(0.1)
+    connector.stopEchoStress()
+    assert _wait(lambda: not connector.echoStressRunning, 1)
+    assert connector.echoStressResult["target"] == "TX"
@@ -0,0 +1,67 @@
+import io
+import logging
+
+import lifu_logging
+from lifu_logging import RateLimitFilter, configure_logging, sampled
+
+
+def _record(msg, level=logging.INFO, rate_key=None):
+    record = logging.LogRecord("LIFUConnector", level, __file__, 1, msg, (), None)
+    if rate_key is not None:
+        record.rate_key = rate_key
+    return record
+
+
+def test_rate_limit_filter_counts_suppressed_records(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("lifu_logging.time.monotonic", lambda: now[0])
+    limiter = RateLimitFilter(rate=100, burst=100, key_rates={"rx.": 1})
+
+    passed = [limiter.filter(_record("status", rate_key="rx.TX")) for _ in range(50)]
+    assert passed.count(True) == 1
+    # Other keys and warnings have their own budget
+    assert limiter.filter(_record("other"))
+    assert limiter.filter(_record("status", logging.WARNING, rate_key="rx.TX"))
+
+    now[0] += 1.0
+    record = _record("status", rate_key="rx.TX")
+    assert limiter.filter(record)
+    assert record.getMessage() == "status (49 similar messages suppressed)"
+
+
+def test_queued_pipeline_formats_on_listener(monkeypatch):
+    monkeypatch.setattr(lifu_logging, "_active_filter", None)
+    name = "LIFUConnector.test"
+    listener = configure_logging(status_rate=1, logger_name=name)
+    stream = io.StringIO()
+    listener.handlers[0].setStream(stream)
+    logger = logging.getLogger(name)
+    try:
+        for i in range(1000):
+            logger.info("Data received from %s: %s", "TX", i, extra={"rate_key": "rx.TX"})
+        assert not sampled(logger, "rx.TX")
+        assert not sampled(logger, "rx.HV", logging.DEBUG)
+        logger.warning("kept")
+    finally:
+        listener.stop()
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 2
+    assert lines[0].endswith("Data received from TX: 0")
+    assert lines[1].endswith("WARNING - kept")
+
+
+def test_only_sampled_paths_are_limited_by_default(monkeypatch):
+    monkeypatch.setattr(lifu_logging, "_active_filter", None)
+    name = "LIFUConnector.test.default"
+    listener = configure_logging(status_rate=1, logger_name=name)
+    stream = io.StringIO()
+    listener.handlers[0].setStream(stream)
+    try:
+        for i in range(200):
+            logging.getLogger(name).info("command %d", i)
+    finally:
+        listener.stop()
+    assert len(stream.getvalue().splitlines()) == 200
+
+    limiter = RateLimitFilter(rate=5, burst=5)  # --log-rate opts call sites in
+    assert [limiter.filter(_record("command")) for _ in range(10)].count(True) == 5
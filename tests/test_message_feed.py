@@ -0,0 +1,64 @@
+import threading
+
+from PyQt6.QtCore import Qt
+
+from lifu_feed import MessageFeedModel
+
+
+def _messages(model):
+    index = model.index
+    return [model.data(index(row), MessageFeedModel.MessageRole) for row in range(model.rowCount())]
+
+
+def test_feed_keeps_newest_rows_in_bounded_ring(qapp):
+    model = MessageFeedModel(capacity=5)
+    inserted, removed, batches = [], [], []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    model.rowsRemoved.connect(lambda parent, first, last: removed.append((first, last)))
+    model.batchAppended.connect(batches.append)
+
+    for i in range(3):
+        model.push("TX", f"m{i}", timestamp=i)
+    model.flush()
+    assert _messages(model) == ["m0", "m1", "m2"]
+
+    for i in range(3, 20):
+        model.push("TX", f"m{i}", timestamp=i)
+    model.flush()
+    # One remove and one insert per batch, whatever its size
+    assert inserted == [(0, 2), (0, 4)]
+    assert removed == [(0, 2)]
+    assert batches == [3, 5]
+    assert _messages(model) == [f"m{i}" for i in range(15, 20)]
+    assert model.count == 5 and model.received == 20
+    assert model.data(model.index(4), Qt.ItemDataRole.DisplayRole).endswith("  TX  m19")
+    assert model.rowCount(model.index(0)) == 0
+
+    model.clear()
+    assert model.rowCount() == 0
+
+
+def test_feed_coalesces_pushes_from_other_threads(qapp):
+    model = MessageFeedModel(capacity=100, interval_ms=0)
+    batches = []
+    model.batchAppended.connect(batches.append)
+
+    thread = threading.Thread(target=lambda: [model.push("TX", str(i)) for i in range(1000)])
+    thread.start()
+    thread.join()
+    for _ in range(5):
+        qapp.processEvents()
+
+    assert len(batches) == 1
+    assert model.count == 100
+    assert _messages(model)[-1] == "999"
+
+
+def test_connector_still_emits_data_received_to_its_listeners(sim_connector):
+    _, connector = sim_connector()
+    received = []
+    connector.on_data_received("HV", "unheard")  # No listener yet
+    connector.signalDataReceived.connect(lambda *message: received.append(message))
+    connector.on_data_received("TX", "STATUS:STOPPED")
+    assert received == [("TX", "STATUS:STOPPED")]
+    assert connector.dataFeed.received == 2
@@ -0,0 +1,91 @@
+import asyncio
+from concurrent.futures import Future
+
+import lifu_connector
+from lifu_polling import PollChannel, TelemetryPoller
+
+
+def _done(error=None):
+    future = Future()
+    if error is None:
+        future.set_result(None)
+    else:
+        future.set_exception(error)
+    return future
+
+
+def test_poller_follows_mode_and_backs_off():
+    channel = PollChannel("temp", "HV", {"active": 0.01, "idle": 0.1})
+    state = {"mode": "idle", "fail": False}
+    times = []
+
+    def poll(_):
+        times.append(loop.time())
+        return _done(OSError("link down") if state["fail"] else None)
+
+    poller = TelemetryPoller([channel], lambda _: state["mode"], poll, max_backoff=0.16)
+
+    async def scenario():
+        poller.start()
+        await asyncio.sleep(0.35)
+        idle = len(times)
+        state["mode"] = "active"
+        poller.notify()
+        await asyncio.sleep(0.2)
+        active = len(times) - idle
+        state["fail"] = True
+        await asyncio.sleep(0.5)
+        assert poller.failures["temp"] >= 3
+        failed = len(times) - idle - active
+        state["mode"] = None
+        poller.notify()
+        await asyncio.sleep(0.05)
+        off = len(times)
+        await asyncio.sleep(0.2)
+        poller.stop()
+        return idle, active, failed, off
+
+    loop = asyncio.new_event_loop()
+    try:
+        idle, active, failed, off = loop.run_until_complete(scenario())
+    finally:
+        loop.close()
+    assert 3 <= idle <= 5  # t = 0, 0.1, 0.2, 0.3
+    # Polls sit on a fixed grid from the first one instead of drifting
+    assert all(abs(t - times[0] - i * 0.1) < 0.03 for i, t in enumerate(times[:idle]))
+    assert active >= 10
+    assert failed <= 8  # 0.01, 0.02, 0.04, 0.08, then capped at 0.16
+    assert len(times) == off
+
+
+def test_connector_polls_faster_while_triggered(sim_connector, monkeypatch):
+    monkeypatch.setattr(lifu_connector, "POLL_CHANNELS", (
+        PollChannel("tx.temperature", "TX", {"active": 0.02, "idle": 0.2}),
+        PollChannel("hv.voltages", "HV", {"active": 0.02, "idle": 0.2}),
+    ))
+    sim, connector = sim_connector()
+
+    def samples():
+        return connector._poller.polls["tx.temperature"]
+
+    async def scenario():
+        monitor = asyncio.ensure_future(connector.start_monitoring())
+        await asyncio.sleep(0.5)
+        idle = samples()
+        assert sim.txdevice.start_trigger()
+        connector._update_trigger_state({"TriggerStatus": "RUNNING"})
+        await asyncio.sleep(0.5)
+        active = samples() - idle
+        connector.stop_monitoring()
+        await asyncio.sleep(0.05)
+        stopped = samples()
+        await asyncio.sleep(0.2)
+        monitor.cancel()
+        await asyncio.gather(monitor, return_exceptions=True)
+        return idle, active, stopped
+
+    idle, active, stopped = asyncio.run(scenario())
+    assert 2 <= idle <= 4
+    assert active >= 5 * idle
+    assert samples() == stopped
+    assert connector.telemetrySeries("hv.vmon0", 100, 0)["t"]  # Readings reach the history
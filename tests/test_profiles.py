@@ -0,0 +1,49 @@
+import functools
+import json
+
+from lifu_connector import LIFUConnector
+
+
+def test_preloaded_profiles_switch_with_control_registers_only(cached_connector, tx_call):
+    sim, connector = cached_connector()
+    commands = functools.partial(tx_call, sim, connector)
+    preload = LIFUConnector.preloadProfiles.__wrapped__
+    activate = LIFUConnector.activateProfile.__wrapped__
+    base = {"x": 0, "y": 0, "frequency": 400e3, "voltage": 12, "triggerHz": 10, "pulseCount": 5,
+            "trainInterval": 1, "trainCount": 1, "duration": 2e-5}
+    profiles = [dict(base, z=z) for z in (30, 40, 50)]
+    profiles[2]["voltage"] = 20
+
+    sim.connect()
+    connector.drain().result(timeout=5)
+    ok, tx_load, hv_load = commands(preload, json.dumps(profiles))
+    assert ok and connector.profileCount == 3 and connector.activeProfile == 1
+    registers = dict(sim.txdevice.registers)
+    written = sim.txdevice.registers_written
+
+    ok, tx_switch, hv_switch = commands(activate, 2)
+    assert ok and connector.activeProfile == 2
+    assert (tx_switch, hv_switch) == (8, 0)  # Four control register blocks on each of two TX7332s
+    assert tx_switch < tx_load
+    assert (sim.txdevice.registers_written - written) * 10 < written
+    changed = {key for key, value in sim.txdevice.registers.items() if registers.get(key) != value}
+    assert changed and all(key[1] < 0x20 for key in changed)  # No profile data rewritten
+
+    assert commands(activate, 3)[1:] == (8, 1)  # Different voltage
+    assert sim.hvcontroller.voltage == 20
+    assert commands(activate, 4)[0] is False
+
+    set_voltage = sim.hvcontroller.set_voltage
+    sim.hvcontroller.set_voltage = lambda voltage: False  # OW_ERROR
+    assert commands(activate, 1)[0] is False
+    assert connector.activeProfile == 3
+    sim.hvcontroller.set_voltage = set_voltage
+    assert commands(activate, 1)[0] and sim.hvcontroller.voltage == 12  # Not skipped as held
+    assert commands(activate, 3)[0]
+
+    # Configuring the active profile's settings is a no-op
+    configure = LIFUConnector.configure_transmitter.__wrapped__
+    args = ["0", "0", "50", "400e3", "20", "10", "5", "1", "1", "2e-5", "sequence"]
+    assert commands(configure, *args)[1:] == (0, 0)
+    sim.disconnect()
+    assert connector.profileCount == 0
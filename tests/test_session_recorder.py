@@ -0,0 +1,76 @@
+import random
+
+from lifu_recorder import MESSAGE, SAMPLE, STATUS, SessionReader, SessionRecorder
+from lifu_status import StatusDecoder
+
+STATUS_LINE = "STATUS:RUNNING,MODE:SEQUENCE,PULSE_TRAIN:[2/10],TEMP_TX:41.25,TEMP_AMBIENT:26.5"
+
+
+def test_round_trip_and_seek_across_rotated_files(tmp_path):
+    status = StatusDecoder().decode(STATUS_LINE)
+    recorder = SessionRecorder(str(tmp_path), max_bytes=4096, index_every=256)
+    for i in range(500):
+        t = 100.0 + i
+        recorder.record_message("TX", STATUS_LINE, t)
+        recorder.record_sample("hv.temp1", float(i), t)
+    recorder.close()
+    recorder.record_sample("hv.temp1", -1.0, 1000.0)  # Ignored after close
+
+    reader = SessionReader(str(tmp_path))
+    assert len(reader.paths) > 5
+
+    window = list(reader.records(start=350.0, end=352.0))
+    assert [r.timestamp for r in window] == [350.0] * 6 + [351.0] * 6 + [352.0] * 6
+    message, decoded, temp_tx, temp_ambient, percent, sample = window[:6]
+    assert (message.kind, message.source, message.value) == (MESSAGE, "TX", STATUS_LINE)
+    assert decoded.kind == STATUS and decoded.value == status and decoded.value.pulse_current is None
+    assert [(r.kind, r.source, r.value) for r in (temp_tx, temp_ambient, percent)] == \
+        [(SAMPLE, "status.temp_tx", 41.25), (SAMPLE, "status.temp_ambient", 26.5),
+         (SAMPLE, "status.pulse_train_percent", 20.0)]
+    assert (sample.kind, sample.source, sample.value) == (SAMPLE, "hv.temp1", 250.0)
+
+    samples = [r.value for r in reader.records(kinds={SAMPLE}) if r.source == "hv.temp1"]
+    assert samples == [float(i) for i in range(500)]
+    assert [r.kind for r in reader.records(start=350.0, end=350.0, kinds={STATUS})] == [STATUS]
+
+
+def test_late_records_inside_the_range_are_found_in_order(tmp_path):
+    recorder = SessionRecorder(str(tmp_path), max_bytes=2048, index_every=64)
+    for i in range(400):
+        t = 100.0 + i * 0.1
+        recorder.record_sample("tx0.temp", t, t)
+        if i % 5 == 0:
+            recorder.record_sample("hv.temp1", t - 0.35, t - 0.35)  # Written late by the other thread
+    recorder.close()
+
+    window = list(SessionReader(str(tmp_path)).records(start=120.0, end=125.0))
+    timestamps = [r.timestamp for r in window]
+    assert timestamps == sorted(timestamps)
+    assert [r.value for r in window if r.source == "hv.temp1"] == \
+        [100.0 + i * 0.1 - 0.35 for i in range(400) if i % 5 == 0 and 120.0 <= 100.0 + i * 0.1 - 0.35 <= 125.0]
+    assert len([r for r in window if r.source == "tx0.temp"]) == 51
+
+
+def test_old_sessions_are_pruned(tmp_path):
+    recorder = SessionRecorder(str(tmp_path), max_bytes=1024, max_files=3)
+    for i in range(200):
+        recorder.record_message("HV", "x" * 40, float(i))
+    recorder.close()
+
+    assert len(list(tmp_path.glob("*.lrec"))) == 3
+    assert len(list(tmp_path.glob("*.idx"))) == 3
+    assert [r.value for r in SessionReader(str(tmp_path)).records()][-1] == "x" * 40
+
+
+def test_seek_with_out_of_order_index_entries(tmp_path):
+    rng = random.Random(3)
+    timestamps = [100.0 + i * 0.05 + rng.uniform(0.0, 0.9) for i in range(2000)]
+    recorder = SessionRecorder(str(tmp_path), index_every=1)  # Every record indexed
+    for t in timestamps:
+        recorder.record_sample("hv.temp1", t, t)
+    recorder.close()
+
+    reader = SessionReader(str(tmp_path))
+    for start in (105.0, 130.3, 170.7, 199.9):
+        expected = sorted(t for t in timestamps if start <= t <= start + 2.0)
+        assert [r.value for r in reader.records(start=start, end=start + 2.0)] == expected
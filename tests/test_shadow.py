@@ -0,0 +1,64 @@
+import functools
+
+from lifu_connector import LIFUConnector
+
+CONFIGURE = LIFUConnector.configure_transmitter.__wrapped__
+ARGS = ("0", "0", "50", "400e3", "12", "10", "5", "1", "1", "2e-5", "sequence")
+
+
+def test_unchanged_configuration_is_not_uploaded_again(cached_connector, tx_call):
+    sim, connector = cached_connector()
+    commands = functools.partial(tx_call, sim, connector)
+    set_voltage = LIFUConnector.setHVCommand.__wrapped__
+    args = list(ARGS)
+
+    sim.connect()
+    connector.drain().result(timeout=5)  # Device info read on connect
+    first = commands(CONFIGURE, *args)[1:]
+    assert first == (1, 1)  # Solution, voltage
+    assert commands(CONFIGURE, *args)[1:] == (0, 0)  # Module count is cached too
+    args[4] = "20"
+    assert commands(CONFIGURE, *args)[1:] == (0, 1)  # Voltage only
+    assert commands(set_voltage, "20")[1:] == (0, 0)
+
+    sim.disconnect()
+    sim.connect()
+    connector.drain().result(timeout=5)
+    assert commands(CONFIGURE, *args)[1:] == first
+
+
+def test_rejected_voltage_is_not_recorded(cached_connector, tx_call):
+    sim, connector = cached_connector()
+    args = list(ARGS)
+    writes = []
+
+    def rejecting_set_voltage(voltage):
+        writes.append(voltage)
+        return False  # What HVController.set_voltage returns on OW_ERROR
+
+    sim.connect()
+    connector.drain().result(timeout=5)
+    assert tx_call(sim, connector, CONFIGURE, *args)[0]
+    sim.hvcontroller.set_voltage = rejecting_set_voltage
+    args[4] = "20"
+    assert tx_call(sim, connector, CONFIGURE, *args)[0] is False
+    assert tx_call(sim, connector, CONFIGURE, *args)[0] is False
+    assert writes == [20.0, 20.0]  # Retried, not skipped as already held
+
+
+def test_simple_tx_config_is_built_and_uploaded_once(cached_connector, tx_call, monkeypatch):
+    import openlifu.plan.solution
+
+    sim, connector = cached_connector()
+    built = []
+    solution_class = openlifu.plan.solution.Solution
+    monkeypatch.setattr(openlifu.plan.solution, "Solution",
+                        lambda **kwargs: built.append(kwargs) or solution_class(**kwargs))
+    simple = LIFUConnector.setSimpleTxConfig.__wrapped__
+
+    sim.connect()
+    connector.drain().result(timeout=5)
+    assert tx_call(sim, connector, simple, 400000, 5) == (True, 1, 1)
+    assert tx_call(sim, connector, simple, 400000, 5) == (True, 0, 0)
+    assert len(built) == 1  # Not even built when unchanged
+    assert connector._txconfigured_state
@@ -0,0 +1,33 @@
+import time
+
+
+def test_connector_follows_simulated_status_stream(sim_connector):
+    sim, connector = sim_connector(num_modules=2, status_rate=2000)
+    sim.connect()
+    assert connector.txConnected and connector.hvConnected
+
+    assert sim.txdevice.start_trigger()
+    deadline = time.monotonic() + 2
+    while sim.messages_sent < 200 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sim.messages_sent >= 200
+    assert connector.triggerEnabled
+    assert "status.temp_tx" in connector.telemetryChannels()
+    sim.disconnect()
+    assert not connector.txConnected
+
+
+def test_state_signals_only_on_edges(qapp, sim_connector):
+    sim, connector = sim_connector()
+    states, triggers = [], []
+    sim.connect()
+    connector.stateChanged.connect(states.append)
+    connector.triggerStateChanged.connect(triggers.append)
+    for i in range(50):
+        connector.on_data_received("TX", sim.status_line(i))
+    sim.txdevice.trigger["TriggerStatus"] = "RUNNING"
+    for i in range(50):
+        connector.on_data_received("TX", sim.status_line(i))
+    qapp.processEvents()
+    assert states == [3]  # READY once, not per STOPPED message
+    assert triggers == [True]
@@ -0,0 +1,48 @@
+import numpy as np
+from openlifu.bf.pulse import Pulse
+from openlifu.bf.sequence import Sequence
+from openlifu.geo import Point
+from openlifu.plan.solution import Solution
+
+from lifu_solution_cache import SolutionCache
+
+
+def make_solution(z):
+    pt = Point(position=(0, 0, z), units="mm")
+    return Solution(
+        delays=np.linspace(0, 1e-6, 64),
+        apodizations=np.ones(64),
+        pulse=Pulse(frequency=400e3, duration=2e-5),
+        sequence=Sequence(pulse_interval=0.1, pulse_count=10, pulse_train_interval=1, pulse_train_count=1),
+        voltage=12.0,
+        target=pt,
+        foci=[pt],
+    )
+
+
+def test_solution_survives_restart(tmp_path):
+    key = SolutionCache.make_key({"focus": [0, 0, 30], "voltage": 12.0})
+    assert key == SolutionCache.make_key({"voltage": 12.0, "focus": [0, 0, 30]})
+
+    cache = SolutionCache(str(tmp_path))
+    assert cache.get(key) is None
+    stored = cache.put(key, make_solution(30))
+
+    restarted = SolutionCache(str(tmp_path))
+    loaded = restarted.get(key)
+    assert restarted.hits == 1
+    np.testing.assert_array_equal(loaded["delays"], stored["delays"])
+    assert loaded["delays"].shape == (1, 64)
+    assert loaded["pulse"]["frequency"] == 400e3
+    assert loaded["voltage"] == 12.0
+
+
+def test_least_recently_used_is_evicted(tmp_path):
+    cache = SolutionCache(str(tmp_path), max_entries=2, memory_entries=0)
+    for z in (10, 20):
+        cache.put(str(z), make_solution(z))
+    assert cache.get("10") is not None  # 20 is now the least recently used
+    cache.put("30", make_solution(30))
+
+    assert sorted(p.stem for p in tmp_path.glob("*.json")) == ["10", "30"]
+    assert cache.get("20") is None
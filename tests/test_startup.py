@@ -0,0 +1,81 @@
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import types
+
+from lifu_connector import LIFUConnector
+from lifu_simulator import SimulatedLIFUInterface
+from lifu_startup import COLD_IMPORT_BUDGET_S, FIRST_FRAME_BUDGET_S, StartupProfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ("openlifu", "matplotlib", "scipy", "PIL", "pandas", "vtk")
+
+COLD_IMPORT = f"""
+import json, sys, time
+start = time.perf_counter()
+import lifu_connector
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": sorted({{m.split(".")[0] for m in sys.modules}} & set({HEAVY!r}))}}))
+"""
+
+
+def test_connector_cold_import_is_within_budget():
+    # Best of three fresh interpreters, so a busy machine does not fail it
+    runs = [json.loads(subprocess.run([sys.executable, "-c", COLD_IMPORT], cwd=ROOT, check=True,
+                                      capture_output=True, text=True).stdout)
+            for _ in range(3)]
+    assert runs[0]["loaded"] == []
+    assert min(run["seconds"] for run in runs) < COLD_IMPORT_BUDGET_S
+
+
+def test_first_frame_is_within_budget_and_before_the_device_stack():
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    app = subprocess.Popen([sys.executable, "main.py", "--simulate", "--startup-profile", "--log-level", "INFO"],
+                           cwd=ROOT, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    watchdog = threading.Timer(60, app.kill)
+    watchdog.start()
+    elapsed = {}  # phase -> seconds since start, from the logged profile
+    try:
+        for line in app.stdout:
+            match = re.match(r"\s+(\S.*?)\s+[0-9.]+ ms\s+([0-9.]+) ms$", line)
+            if match:
+                elapsed[match.group(1)] = float(match.group(2)) / 1000
+                if "device stack" in elapsed and "first frame" in elapsed:
+                    break
+    finally:
+        watchdog.cancel()
+        app.kill()
+        app.wait()
+    assert elapsed["first frame"] < FIRST_FRAME_BUDGET_S
+    assert elapsed["first frame"] <= elapsed["device stack"]  # The window does not wait for openlifu
+
+
+def test_sdk_version_follows_the_deferred_import(qapp, monkeypatch):
+    monkeypatch.delitem(sys.modules, "openlifu", raising=False)
+    connector = LIFUConnector(defer_interface=True)
+    changed = []
+    connector.sdkVersionChanged.connect(lambda: changed.append(connector.sdkVersion))
+    try:
+        assert connector.sdkVersion == "unknown"  # Never a made-up version
+        monkeypatch.setitem(sys.modules, "openlifu", types.SimpleNamespace(__version__="0.20.2"))
+        connector.attach_interface(SimulatedLIFUInterface(status_rate=0))
+        assert changed == ["0.20.2"]
+    finally:
+        connector.shutdown_workers()
+
+
+def test_startup_profile_phases():
+    profile = StartupProfile()
+    profile.mark("imports")
+    profile.mark("QML load")
+    profile.mark("device stack", since="imports")
+    profile.mark("monitoring")
+    assert [phase for phase, _, _ in profile.phases] == ["imports", "QML load", "device stack", "monitoring"]
+    (_, qml, qml_end), (_, background, _), (_, monitoring, monitoring_end) = profile.phases[1:]
+    assert background >= qml  # Started with the QML load, not after it
+    # Background phases do not move the sequential mark
+    assert abs(monitoring_end - monitoring - qml_end) < 1e-9
+    assert "device stack" in profile.report()
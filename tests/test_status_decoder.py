@@ -0,0 +1,30 @@
+from lifu_status import StatusDecoder, StatusRecord
+
+decoder = StatusDecoder()
+
+
+def test_decode_with_pulse():
+    record = decoder.decode("STATUS:RUNNING,MODE:SEQUENCE,PULSE_TRAIN:[3/10],PULSE:[25/100],TEMP_TX:31.25,TEMP_AMBIENT:24.5")
+    assert record == StatusRecord("RUNNING", "SEQUENCE", 3, 10, 25, 100, 31.25, 24.5)
+    assert record.pulse_train_percent == 30
+    assert record.pulse_percent == 25
+
+
+def test_decode_without_pulse():
+    record = decoder.decode("  STATUS:STOPPED,MODE:CONTINUOUS,PULSE_TRAIN:[0/0],TEMP_TX:30,TEMP_AMBIENT:24\r\n")
+    assert record.status == "STOPPED"
+    assert record.pulse_current is None
+    assert record.to_dict() == {
+        "status": "STOPPED",
+        "mode": "CONTINUOUS",
+        "pulse_train_percent": 0,
+        "pulse_percent": None,
+        "temp_tx": 30.0,
+        "temp_ambient": 24.0,
+    }
+
+
+def test_decode_rejects_other_messages():
+    assert decoder.decode("Demo Response") is None
+    assert decoder.decode("STATUS:RUNNING,MODE:SEQUENCE") is None
+    assert decoder.decode("STATUS:RUNNING,MODE:X,PULSE_TRAIN:[1/2],TEMP_TX:1.2.3,TEMP_AMBIENT:2") is None
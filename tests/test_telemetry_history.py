@@ -0,0 +1,37 @@
+import numpy as np
+
+from lifu_history import TelemetryChannel, TelemetryHistory
+
+
+def test_decimated_series_matches_raw_extremes():
+    channel = TelemetryChannel(capacity=256, factor=4, levels=4)
+    rng = np.random.default_rng(1)
+    values = rng.normal(size=20000)
+    for t, v in enumerate(values):
+        channel.append(v, timestamp=float(t))
+
+    # Far longer than level 0 holds, so this comes from a coarser level.
+    t, vmin, vmax, mean = channel.series(50, seconds=5000)
+    window = values[-5001:]
+    assert 0 < len(t) <= 50
+    assert np.all(np.diff(t) > 0)
+    assert vmin.min() == window.min() and vmax.max() == window.max()
+    assert np.all(vmin <= mean) and np.all(mean <= vmax)
+
+    t, _, _, mean = channel.series(10, seconds=100)
+    np.testing.assert_allclose(mean.mean(), values[-101:].mean(), atol=0.2)
+
+
+def test_memory_is_fixed():
+    history = TelemetryHistory(capacity=64, factor=4, levels=3)
+    history.record("hv.temp1", 20.0, timestamp=0.0)
+    channel = history._channels["hv.temp1"]
+    sizes = [level.start.nbytes for level in channel.levels]
+    for t in range(1, 10000):
+        history.record("hv.temp1", 20.0 + t % 7, timestamp=float(t))
+
+    assert [level.start.nbytes for level in channel.levels] == sizes
+    assert all(level.size == 64 for level in channel.levels[:2])
+    series = history.series("hv.temp1", 20)
+    assert len(series["t"]) <= 20 and series["max"] and max(series["max"]) == 26.0
+    assert history.series("missing", 20) == {"t": [], "min": [], "max": [], "mean": []}
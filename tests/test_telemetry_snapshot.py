@@ -0,0 +1,29 @@
+import threading
+
+from PyQt6.QtCore import Qt
+
+
+def test_telemetry_snapshot_reads_only_the_requested_links(sim_connector):
+    sim, connector = sim_connector(num_modules=2)
+    snapshots = []
+    ready = threading.Event()
+    connector.telemetrySnapshotReady.connect(lambda snapshot: (snapshots.append(snapshot), ready.set()),
+                                             Qt.ConnectionType.DirectConnection)
+
+    def snapshot(*link):
+        ready.clear()
+        connector.queryTelemetrySnapshot(*link)
+        assert ready.wait(5)
+        return snapshots[-1]
+
+    sim.connect()
+    connector.drain().result(timeout=5)
+    tx_commands = sim._tx_link.commands
+    hv_only = snapshot("HV")
+    assert hv_only["tx"] is None and sim._tx_link.commands == tx_commands
+    assert hv_only["hv"]["temperature1"]["value"] is not None
+
+    both = snapshot()
+    assert len(both["tx"]["modules"]) == 2 and both["hv"] is not None
+    assert both["tx"]["modules"][1]["tx_temperature"]["timestamp"] >= both["timestamp"]
+    assert snapshot("TX")["hv"] is None
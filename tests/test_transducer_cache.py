@@ -0,0 +1,48 @@
+import os
+import shutil
+
+import numpy as np
+
+from lifu_transducer import TransducerCache, compute_focus_delays
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_cache_reuses_and_revalidates(tmp_path):
+    shutil.copy(os.path.join(REPO_DIR, "pinmap_1x.json"), tmp_path)
+    cache = TransducerCache(directory=str(tmp_path))
+
+    first = cache.get(1)
+    assert first.positions.shape == (first.transducer.numelements(), 3)
+    assert first.positions.flags.c_contiguous and not first.positions.flags.writeable
+    assert cache.get(1) is first
+
+    path = cache.path_for(1)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    reloaded = cache.get(1)
+    assert reloaded is not first
+
+    cache.invalidate()
+    assert cache.get(1) is not reloaded
+
+
+def test_batched_delays_match_single_focus():
+    cache = TransducerCache(directory=REPO_DIR)
+    positions = cache.get(2).positions
+    rng = np.random.default_rng(0)
+    foci = rng.uniform([-20, -20, 10], [20, 20, 80], size=(257, 3))
+
+    # A tiny chunk budget forces many chunks, including a ragged last one.
+    delays, apodizations = compute_focus_delays(positions, foci, chunk_bytes=4096)
+
+    assert delays.shape == apodizations.shape == (257, positions.shape[0])
+    for focus, row in zip(foci, delays):
+        tof = np.sqrt(np.sum((focus - positions)**2, 1)) * 1e-3 / 1500
+        np.testing.assert_allclose(row, tof.max() - tof, atol=1e-15)
+
+
+def test_connector_uses_the_1x_pinmap_while_tx_is_disconnected(cached_connector):
+    _, connector = cached_connector()
+    delays, apodizations = connector.compute_focus_delays(np.array([[0.0, 0.0, 50.0]]))
+    assert delays.shape == apodizations.shape == (1, connector._transducers.get(1).positions.shape[0])